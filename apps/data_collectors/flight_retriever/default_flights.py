@@ -8,6 +8,8 @@ import uuid
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
+from shared.countries import normalize_country_to_iso2
+
 # Airport code to country mapping
 AIRPORT_COUNTRIES: Dict[str, str] = {
     # Israel
@@ -125,9 +127,14 @@ def get_coordinates_for_airport(airport_code: str) -> tuple[float, float]:
     """Get the coordinates (lat, lon) for an airport code, or a reasonable default."""
     return AIRPORT_COORDINATES.get(airport_code.upper(), (0.0, 0.0))
 
+# ISO-2 codes, matching the countryCode Amadeus returns for live offers
+_AIRPORT_COUNTRY_CODES: Dict[str, str] = {
+    code: normalize_country_to_iso2(country) for code, country in AIRPORT_COUNTRIES.items()
+}
+
 def get_country_for_airport(airport_code: str) -> str:
-    """Get the country name for an airport code, or a reasonable default."""
-    return AIRPORT_COUNTRIES.get(airport_code.upper(), "Unknown")
+    """Get the ISO-2 country code for an airport code, or a reasonable default."""
+    return _AIRPORT_COUNTRY_CODES.get(airport_code.upper(), "Unknown")
 
 
 def get_city_for_airport(airport_code: str) -> str:
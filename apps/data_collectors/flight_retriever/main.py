@@ -1,10 +1,12 @@
 import os
-import json
 import re
 import redis.asyncio as redis
 from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime, timezone, timedelta
+from urllib.parse import urlparse
 from shared.data_types.models import *
+from shared.serialization import ORJSONResponse, cache_dumps, cache_loads
+from shared.protobuf_codec import ProtobufResponse, accepts_protobuf
 from fastapi import FastAPI, HTTPException, Body, Request
 from amadeus import Client, ResponseError
 from dotenv import load_dotenv
@@ -29,6 +31,8 @@ load_dotenv()
 
 AMADEUS_CLIENT_ID = os.getenv("AMADEUS_CLIENT_ID")
 AMADEUS_CLIENT_SECRET = os.getenv("AMADEUS_CLIENT_SECRET")
+# e.g. http://provider_simulator:8000 for offline load tests
+AMADEUS_BASE_URL = os.getenv("AMADEUS_BASE_URL")
 
 # Redis connection
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
@@ -53,16 +57,16 @@ async def cache_get(key: str) -> Optional[Dict]:
         if not client: return None
         data = await client.get(key)
         if data:
-            return json.loads(data)
+            return cache_loads(data)
         return None
     except Exception as e:
         logger.info(f"Cache get error: {e}")
         return None
 
-async def cache_set(key: str, value: Dict, ttl: int = FLIGHT_CACHE_TTL):
+async def cache_set(key: str, value: Any, ttl: int = FLIGHT_CACHE_TTL):
     try:
         client = await get_redis_client()
-        await client.setex(key, ttl, json.dumps(value))
+        await client.setex(key, ttl, cache_dumps(value))
     except Exception as e:
         logger.info(f"Cache set error: {e}")
 
@@ -72,7 +76,7 @@ async def map_provider_id(unique_id: str, provider_offer: Dict):
         client = await get_redis_client()
         if not client: return
         key = f"map:flight_offer:{unique_id}"
-        await client.setex(key, FLIGHT_CACHE_TTL * 3, json.dumps(provider_offer))
+        await client.setex(key, FLIGHT_CACHE_TTL * 3, cache_dumps(provider_offer))
     except Exception as e:
         logger.info(f"Mapping error: {e}")
 
@@ -84,21 +88,40 @@ async def get_provider_offer(unique_id: str) -> Optional[Dict]:
         key = f"map:flight_offer:{unique_id}"
         data = await client.get(key)
         if data:
-            return json.loads(data)
+            return cache_loads(data)
         return None
     except Exception as e:
         logger.info(f"Mapping lookup error: {e}")
         return None
 
+def _amadeus_host_options(base_url: Optional[str]) -> Dict[str, Any]:
+    """Translate a base URL into the Amadeus SDK's host/port/ssl options."""
+    if not base_url:
+        return {}
+    parsed = urlparse(base_url)
+    ssl = parsed.scheme == "https"
+    return {
+        "host": parsed.hostname,
+        "port": parsed.port or (443 if ssl else 80),
+        "ssl": ssl,
+    }
+
 # Amadeus Client
 amadeus = None
-if AMADEUS_CLIENT_ID and AMADEUS_CLIENT_SECRET:
+if AMADEUS_BASE_URL:
+    # The simulator accepts any credentials
+    amadeus = Client(
+        client_id=AMADEUS_CLIENT_ID or "simulator",
+        client_secret=AMADEUS_CLIENT_SECRET or "simulator",
+        **_amadeus_host_options(AMADEUS_BASE_URL),
+    )
+elif AMADEUS_CLIENT_ID and AMADEUS_CLIENT_SECRET:
     amadeus = Client(
         client_id=AMADEUS_CLIENT_ID,
         client_secret=AMADEUS_CLIENT_SECRET,
     )
 
-app = FastAPI(title="Flight Retriever Service")
+app = FastAPI(title="Flight Retriever Service", default_response_class=ORJSONResponse)
 
 # ----------------------------
 # FastAPI endpoints
@@ -132,7 +155,14 @@ async def shutdown():
         await redis_client.close()
 
 @app.post("/api/flight_retriever/search", response_model=FlightSearchResponse)
-async def flight_search(request: FlightSearchRequest):
+async def flight_search(request: FlightSearchRequest, http_request: Request):
+    """JSON by default; a flight.proto FlightSearchResponse with `Accept: application/x-protobuf`."""
+    response = await search_flights(request)
+    if accepts_protobuf(http_request):
+        return ProtobufResponse(response)
+    return response
+
+async def search_flights(request: FlightSearchRequest) -> FlightSearchResponse:
 
     origin_code = (request.origin.airport_code or "").strip().upper()
     dest_code = (request.destination.airport_code or "").strip().upper()
@@ -184,7 +214,7 @@ async def flight_search(request: FlightSearchRequest):
                     opt = FlightOption.model_validate(cached_opt)
                 else:
                     opt = transform_flight_data(o, passengers=adults, locations=locations)
-                    await cache_set(opt_cache_key, opt.model_dump())
+                    await cache_set(opt_cache_key, opt)
                 
                 await map_provider_id(unique_id, o)
                 flight_options.append(opt)
@@ -197,7 +227,7 @@ async def flight_search(request: FlightSearchRequest):
             )
 
             response = FlightSearchResponse(options=flight_options, metadata=metadata)
-            await cache_set(search_cache_key, response.model_dump())
+            await cache_set(search_cache_key, response)
             return response
 
         except (ResponseError, Exception) as e:
@@ -2,8 +2,11 @@ from liteapi import LiteApi
 from typing import List, Dict, Any, Optional
 
 class CustomLiteApi(LiteApi):
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, service_url: Optional[str] = None):
         super().__init__(api_key)
+        # Allows pointing the SDK at the offline provider simulator
+        if service_url:
+            self.service_url = service_url.rstrip("/")
 
     def get_rates(
         self,
@@ -6,11 +6,12 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 from .data_processor import transform_hotel_data, generate_unique_hotel_id
 import redis.asyncio as redis
-import json
 import os
 from dotenv import load_dotenv
 
 from shared.data_types import models
+from shared.serialization import ORJSONResponse, cache_dumps, cache_loads
+from shared.protobuf_codec import ProtobufResponse, accepts_protobuf
 
 from .custom_liteapi import CustomLiteApi
 
@@ -21,7 +22,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Hotel Data Service")
+app = FastAPI(title="Hotel Data Service", default_response_class=ORJSONResponse)
 
 load_dotenv()
 
@@ -31,8 +32,10 @@ redis_client = None
 
 # Initialize Custom Hotels API SDK
 API_KEY = os.getenv("LITE_API_KEY", "")
+# e.g. http://provider_simulator:8000/v3.0 for offline load tests
+LITE_API_BASE_URL = os.getenv("LITE_API_BASE_URL")
 
-api = CustomLiteApi(api_key=API_KEY)
+api = CustomLiteApi(api_key=API_KEY, service_url=LITE_API_BASE_URL)
 
 # Cache TTL (1 hour for hotel data, 30 minutes for availability)
 HOTEL_CACHE_TTL = 3600
@@ -52,7 +55,7 @@ async def cache_get(key: str) -> Optional[Dict]:
         client = await get_redis_client()
         data = await client.get(key)
         if data:
-            return json.loads(data)
+            return cache_loads(data)
         logger.info(f"DEBUG: cache_get returning None for key: {key}")
         return None
     except Exception as e:
@@ -61,11 +64,11 @@ async def cache_get(key: str) -> Optional[Dict]:
         return None
 
 
-async def cache_set(key: str, value: Dict, ttl: int = HOTEL_CACHE_TTL):
-    """Set data in Redis cache"""
+async def cache_set(key: str, value: Any, ttl: int = HOTEL_CACHE_TTL):
+    """Set data (dicts or Pydantic models) in Redis cache"""
     try:
         client = await get_redis_client()
-        await client.setex(key, ttl, json.dumps(value))
+        await client.setex(key, ttl, cache_dumps(value))
     except Exception as e:
         logger.info(f"Cache set error: {e}")
 
@@ -331,12 +334,14 @@ async def log_requests(request: Request, call_next):
 
 @app.post("/api/hotels/search")
 async def search_hotels(
+    request: Request,
     query: models.HotelSearchRequest = Body(..., description="Hotel search request")
 ):
     """
     Search for hotels using a JSON payload.
     Checks availability for given dates and only returns available hotels.
-    Returns Pydantic model-compatible JSON.
+    Returns Pydantic model-compatible JSON, or a hotel.proto
+    HotelSearchResponse with `Accept: application/x-protobuf`.
     """
     # Extract parameters from Pydantic model
     city = query.location.city
@@ -459,8 +464,7 @@ async def search_hotels(
                 continue
             
             # Cache the transformed hotel option
-            hotel_dict = hotel_option.model_dump()
-            await cache_set(cache_key, hotel_dict, HOTEL_CACHE_TTL)
+            await cache_set(cache_key, hotel_option, HOTEL_CACHE_TTL)
             
             response.options.append(hotel_option)
             available_count += 1
@@ -474,8 +478,10 @@ async def search_hotels(
         response.metadata.timestamp = datetime.now(timezone.utc).isoformat()
         response.metadata.data_source = provider
         
-        # Convert to dict for JSON response
-        return response.model_dump()
+        if accepts_protobuf(request):
+            return ProtobufResponse(response)
+        # Serialize the model directly, skipping the jsonable_encoder pass
+        return ORJSONResponse(content=response)
         
     except Exception as e:
         import traceback
@@ -1,36 +1,74 @@
 import os
-import json
-from google import genai
+import asyncio
+from typing import AsyncIterator, Tuple
 from google.genai import types
 from dotenv import load_dotenv
 
+from shared.llm_clients import llm_clients, GEMINI
+
 load_dotenv()
 
-TOKEN = os.getenv("GEMINI_API_TOKEN") or os.getenv("GEMINI_API_KEY")
-if not TOKEN:
-    raise ValueError("Set GEMINI_API_TOKEN or GEMINI_API_KEY environment variable")
+# Requests in flight per process; excess callers wait instead of piling onto the API
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "16"))
 
-CLIENT = genai.Client(api_key=TOKEN)
+_semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
 
-def _generate_with_gemini(
-    system_prompt: str,
-    user_prompt: str,
-    use_grounding: bool = False,
-) -> str:
+
+def _content_config(system_prompt: str, use_grounding: bool) -> types.GenerateContentConfig:
     tools = []
     if use_grounding:
         tools.append(types.Tool(google_search=types.GoogleSearch()))
 
-    config = types.GenerateContentConfig(
+    return types.GenerateContentConfig(
         system_instruction=system_prompt,
         tools=tools if tools else None,
         response_mime_type="application/json",
     )
 
-    response = CLIENT.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=user_prompt,
-        config=config,
-    )
 
-    return response.text
+async def _generate_with_gemini(
+    system_prompt: str,
+    user_prompt: str,
+    use_grounding: bool = False,
+) -> Tuple[str, int]:
+    client = llm_clients.gemini()
+    config = _content_config(system_prompt, use_grounding)
+
+    async with _semaphore:
+        with llm_clients.track(GEMINI):
+            response = await client.aio.models.generate_content(
+                model="gemini-2.5-flash",
+                contents=user_prompt,
+                config=config,
+            )
+    prompt_tokens, completion_tokens = llm_clients.record_usage(GEMINI, response)
+
+    return response.text, prompt_tokens + completion_tokens
+
+
+async def _stream_with_gemini(
+    system_prompt: str,
+    user_prompt: str,
+    use_grounding: bool = False,
+) -> AsyncIterator[Tuple[str, int]]:
+    """Yields (text delta, 0) as tokens arrive, then ("", tokens used) at the end."""
+    client = llm_clients.gemini()
+    config = _content_config(system_prompt, use_grounding)
+
+    last_chunk = None
+    async with _semaphore:
+        with llm_clients.track(GEMINI):
+            stream = await client.aio.models.generate_content_stream(
+                model="gemini-2.5-flash",
+                contents=user_prompt,
+                config=config,
+            )
+            async for chunk in stream:
+                last_chunk = chunk
+                if chunk.text:
+                    yield chunk.text, 0
+
+    # Usage metadata is cumulative, so only the final chunk counts
+    if last_chunk is not None:
+        prompt_tokens, completion_tokens = llm_clients.record_usage(GEMINI, last_chunk)
+        yield "", prompt_tokens + completion_tokens
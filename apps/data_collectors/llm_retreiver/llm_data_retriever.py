@@ -3,25 +3,25 @@ Generate realistic vacation planning data from Pydantic models using Gemini.
 Supports flight, hotel, activity, and transport models.
 """
 
-import os
 import json
+import logging
 import re
-from google import genai
-from dotenv import load_dotenv
+from typing import AsyncIterator, Tuple, get_args
+
+from pydantic import BaseModel, ValidationError
 
 from apps.data_collectors.llm_retreiver.llm_provider import LLMProvider
-from apps.data_collectors.llm_retreiver.gemini_generator import _generate_with_gemini
-from apps.data_collectors.llm_retreiver.perplexity_generator import _generate_with_perplexity
+from apps.data_collectors.llm_retreiver.gemini_generator import _generate_with_gemini, _stream_with_gemini
+from apps.data_collectors.llm_retreiver.perplexity_generator import _generate_with_perplexity, _stream_with_perplexity
+from apps.data_collectors.llm_retreiver import response_cache
+from apps.data_collectors.llm_retreiver.prompt_templates import get_prompt_template
+from apps.data_collectors.llm_retreiver.streaming_parser import OptionsArrayParser
 
 # Import Pydantic models
 from shared.data_types import models
+from shared.serialization import loads
 
-load_dotenv()
-TOKEN = os.getenv("GEMINI_API_TOKEN") or os.getenv("GEMINI_API_KEY")
-if not TOKEN:
-    raise ValueError("Set GEMINI_API_TOKEN or GEMINI_API_KEY environment variable")
-
-CLIENT = genai.Client(api_key=TOKEN)
+logger = logging.getLogger(__name__)
 
 
 def _strip_markdown_and_clean_json(text: str) -> str:
@@ -50,102 +50,54 @@ def _strip_markdown_and_clean_json(text: str) -> str:
     return text.strip()
 
 
-def _get_service_context(model_name: str) -> str:
-    """Get context-specific instructions for each service type."""
-    
-    contexts = {
-        "FlightSearchResponse": """
-Generate realistic flight options with:
-- Real airline names (United, Delta, American, British Airways, etc.)
-- Realistic routes and IATA airport codes
-- Appropriate pricing: economy $200-800, business $1000-3000, first $1500-5000
-- Realistic flight durations based on distance
-- 0-2 stops for most routes
-- ISO 8601 datetime format (YYYY-MM-DDTHH:MM:SS)
-- Include layover details when stops > 0
-- Amenities appropriate to cabin class
-- Component scores 0.0-1.0 (price_score: lower price = higher, quality_score: better service/fewer stops)
-""",
-        "ActivitySearchResponse": """
-Generate realistic activity options with:
-- Location-appropriate activities (tours, museums, outdoor activities, food tours)
-- Pricing $10-300 depending on activity type
-- Ratings 3.5-5.0
-- Duration 60-480 minutes (1-8 hours)
-- Realistic highlights and inclusions
-- Available time slots with ISO 8601 format (date: YYYY-MM-DD, time: HH:MM)
-- Difficulty levels: easy, moderate, challenging
-- Component scores 0.0-1.0 (preference_score: match to requested description)
-- IMPORTANT: Set the "category" field to the correct integer based on activity type:
-  0=UNKNOWN (use this in fallback cases), 1=TOUR, 2=MUSEUM, 3=RESTAURANT, 4=SHOW, 5=OUTDOOR, 
-  6=WATER_SPORTS, 7=NIGHTLIFE, 8=SHOPPING, 9=SPA, 10=ADVENTURE, 11=CULTURAL, 12=FOOD_TOUR
-  Examples: Walking tour=1, Art museum=2, Cooking class=12, Hiking=5, Snorkeling=6, Wine tasting=12
-""",
-        "TransportSearchResponse": """
-Generate realistic transport options with:
-- Appropriate modes for distance (rental car, rideshare, train, bus)
-- Realistic providers (Hertz, Uber, Amtrak, Greyhound, etc.)
-- Distance-appropriate pricing and duration
-- Vehicle details: class, model, seats, features
-- ISO 8601 datetime format (YYYY-MM-DDTHH:MM:SS)
-- For rental cars: economy, compact, SUV classes with daily rates
-- For rideshare: sedan, SUV, van options with wait times
-- For transit: line numbers, stops, service class
-- Component scores 0.0-1.0 (convenience_score: shorter duration/wait = higher)
-""",
-    }
-    
-    return contexts.get(model_name, "Generate realistic travel-related data.")
-
-
-def generate_json_from_model(
+async def generate_json_from_model(
     model_cls,
     list_size: int = 1,
     preferences: dict = None,
     system_description: str = None,
     use_grounding: bool = False,
     provider: LLMProvider = LLMProvider.PERPLEXITY,
+    use_cache: bool = False,
 ):
-    schema = model_cls.model_json_schema()
-    model_name = model_cls.__name__
-
-    service_context = _get_service_context(model_name)
+    async def generate():
+        return await _generate_json(model_cls, list_size, preferences, system_description, use_grounding, provider)
+
+    if use_cache:
+        return await response_cache.get_or_generate(
+            model_cls.__name__,
+            preferences,
+            list_size,
+            generate,
+            extra={"provider": provider, "system_description": system_description, "use_grounding": use_grounding},
+        )
 
-    system_prompt = f"""
-    You are a realistic travel data generator.
-    
-    {system_description or service_context}
-    
-    IMPORTANT INSTRUCTIONS:
-    - For "options" arrays, generate exactly {list_size} diverse, realistic items
-    - Use realistic names, locations, and pricing appropriate to the context
-    - All scores must be between 0.0 and 1.0
-    - Use ISO 8601 format for all dates and times
-    - Include all required fields
-    - Set "available" to true for all options
-    - Generate unique IDs for each option
-    """
+    data, _ = await generate()
+    return data
 
-    if preferences:
-        user_prompt = f"""
-Generate results for this search request:
-{json.dumps(preferences, indent=2)}
 
-Remember: Output ONLY raw JSON, no markdown formatting.
-"""
-    else:
-        user_prompt = f"Generate {list_size} realistic travel options. Output ONLY raw JSON."
+async def _generate_json(
+    model_cls,
+    list_size: int,
+    preferences: dict,
+    system_description: str,
+    use_grounding: bool,
+    provider: LLMProvider,
+) -> Tuple[dict, int]:
+    """Returns (parsed JSON, tokens used)."""
+    template = get_prompt_template(model_cls, system_description)
+    user_prompt = template.user_prompt(list_size, json.dumps(preferences, indent=2) if preferences else None)
 
     try:
         if provider == LLMProvider.PERPLEXITY:
-            raw_text = _generate_with_perplexity(system_prompt, user_prompt, response_model=schema)
+            raw_text, tokens = await _generate_with_perplexity(template.system_prompt, user_prompt, response_format=template.response_format)
         else:
-            raw_text = _generate_with_gemini(system_prompt, user_prompt, use_grounding)
+            raw_text, tokens = await _generate_with_gemini(template.system_prompt, user_prompt, use_grounding)
 
         # Strip markdown and clean the response
         cleaned_text = _strip_markdown_and_clean_json(raw_text)
         
-        return json.loads(cleaned_text)
+        # orjson's JSONDecodeError subclasses json.JSONDecodeError
+        return loads(cleaned_text), tokens
 
     except json.JSONDecodeError as e:
         raise ValueError(
@@ -155,7 +107,62 @@ Remember: Output ONLY raw JSON, no markdown formatting.
         )
 
 
-def generate_model_message(model_cls, request_dict: dict = None, list_size: int = 5):
+def _option_model(model_cls):
+    """Element type of a response model's `options: List[...]` field."""
+    return get_args(model_cls.model_fields["options"].annotation)[0]
+
+
+async def stream_options_from_model(
+    model_cls,
+    list_size: int = 1,
+    preferences: dict = None,
+    system_description: str = None,
+    use_grounding: bool = False,
+    provider: LLMProvider = LLMProvider.PERPLEXITY,
+    use_cache: bool = False,
+) -> AsyncIterator[BaseModel]:
+    """
+    Streaming variant of generate_json_from_model for response models with an
+    `options` list: yields each validated option as soon as the LLM finishes
+    writing it. Options that fail validation are skipped.
+    """
+    option_cls = _option_model(model_cls)
+    extra = {"provider": provider, "system_description": system_description, "use_grounding": use_grounding}
+
+    slot = None
+    if use_cache:
+        cached, slot = await response_cache.lookup(model_cls.__name__, preferences, list_size, extra)
+        if cached is not None:
+            for item in cached.get("options", []):
+                yield option_cls.model_validate(item)
+            return
+
+    template = get_prompt_template(model_cls, system_description)
+    user_prompt = template.user_prompt(list_size, json.dumps(preferences, indent=2) if preferences else None)
+    if provider == LLMProvider.PERPLEXITY:
+        deltas = _stream_with_perplexity(template.system_prompt, user_prompt, response_format=template.response_format)
+    else:
+        deltas = _stream_with_gemini(template.system_prompt, user_prompt, use_grounding)
+
+    parser = OptionsArrayParser()
+    items = []
+    tokens = 0
+    async for text, used in deltas:
+        tokens += used
+        for item in parser.feed(text):
+            try:
+                option = option_cls.model_validate(item)
+            except ValidationError as e:
+                logger.info(f"Skipping invalid streamed {option_cls.__name__}: {e}")
+                continue
+            items.append(item)
+            yield option
+
+    if parser.done:
+        await response_cache.store(slot, {"options": items}, tokens)
+
+
+async def generate_model_message(model_cls, request_dict: dict = None, list_size: int = 5):
     """
     Generate a populated Pydantic model using Gemini.
     
@@ -167,7 +174,7 @@ def generate_model_message(model_cls, request_dict: dict = None, list_size: int
     Returns:
         Populated Pydantic model
     """
-    json_data = generate_json_from_model(
+    json_data = await generate_json_from_model(
         model_cls=model_cls,
         list_size=list_size,
         preferences=request_dict
@@ -4,21 +4,27 @@ Accepts JSON requests and returns JSON responses.
 """
 
 from fastapi import FastAPI, HTTPException, Body
+from fastapi.responses import StreamingResponse
 from typing import Optional, Dict, Any
-import json
 
 # Import Pydantic models
 from shared.data_types import models
+from shared.serialization import ORJSONResponse, dumps
+from shared.llm_clients import llm_clients
 
 from apps.data_collectors.llm_retreiver.llm_data_retriever import (
-    generate_json_from_model
+    generate_json_from_model,
+    stream_options_from_model
 )
 from apps.data_collectors.llm_retreiver.llm_provider import LLMProvider
+from apps.data_collectors.llm_retreiver.response_cache import cache_stats
+from apps.data_collectors.llm_retreiver.prompt_templates import warm_prompt_templates
 
 app = FastAPI(
     title="Vacation Planning Service",
     description="AI-powered vacation planning data for flights, hotels, activities, and transport",
-    version="1.1.0"
+    version="1.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # ===== Health Check =====
@@ -28,13 +34,40 @@ def health_check():
     return {"status": "healthy", "service": "vacation-planning"}
 
 
+@app.get("/metrics/llm")
+def llm_metrics():
+    return llm_clients.snapshot()
+
+
+@app.get("/metrics/llm-cache")
+async def llm_cache_metrics():
+    return await cache_stats()
+
+
+@app.on_event("startup")
+def startup():
+    warm_prompt_templates()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await llm_clients.aclose()
+
+
+def _ndjson(options) -> StreamingResponse:
+    async def lines():
+        async for option in options:
+            yield dumps(option) + b"\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 # ===== Flights =====
 
 @app.post("/api/flights/search", response_model=models.FlightSearchResponse)
 async def get_flight_data(
     query: models.FlightSearchRequest = Body(..., description="Flight search request")
 ):
-    resp = generate_json_from_model(
+    resp = await generate_json_from_model(
         model_cls=models.FlightSearchResponse,
         preferences=query.model_dump(),
         list_size=query.max_results or 5
@@ -48,28 +81,56 @@ async def get_flight_data(
 async def get_activity_data(
     query: models.ActivitySearchRequest = Body(..., description="Activity search request")
 ):
-    resp = generate_json_from_model(
+    resp = await generate_json_from_model(
         model_cls=models.ActivitySearchResponse,
         preferences=query.model_dump(),
-        list_size=query.max_results or 3
+        list_size=query.max_results or 3,
+        use_cache=True
     )
     return resp
 
 
+@app.post("/api/activities/search/stream")
+async def stream_activity_data(
+    query: models.ActivitySearchRequest = Body(..., description="Activity search request")
+):
+    """NDJSON stream of ActivityOption objects, one per line, as they are generated."""
+    return _ndjson(stream_options_from_model(
+        model_cls=models.ActivitySearchResponse,
+        preferences=query.model_dump(),
+        list_size=query.max_results or 3,
+        use_cache=True
+    ))
+
+
 # ===== Transport =====
 
 @app.post("/api/transport/search", response_model=models.TransportSearchResponse)
 async def get_transport_data(
     query: models.TransportSearchRequest = Body(..., description="Transport search request")
 ):
-    resp = generate_json_from_model(
+    resp = await generate_json_from_model(
         model_cls=models.TransportSearchResponse,
         preferences=query.model_dump(),
-        list_size=query.max_results or 10
+        list_size=query.max_results or 10,
+        use_cache=True
     )
     return resp
 
 
+@app.post("/api/transport/search/stream")
+async def stream_transport_data(
+    query: models.TransportSearchRequest = Body(..., description="Transport search request")
+):
+    """NDJSON stream of TransportOption objects, one per line, as they are generated."""
+    return _ndjson(stream_options_from_model(
+        model_cls=models.TransportSearchResponse,
+        preferences=query.model_dump(),
+        list_size=query.max_results or 10,
+        use_cache=True
+    ))
+
+
 # ===== Root =====
 
 @app.get("/")
@@ -81,6 +142,8 @@ def root():
             "flights": "POST /flights/search",
             "activities": "POST /activities/search",
             "transport": "POST /transport/search",
+            "activities_stream": "POST /activities/search/stream",
+            "transport_stream": "POST /transport/search/stream",
             "docs": "/docs"
         }
     }
@@ -1,23 +1,21 @@
 import os
-import json
-from openai import OpenAI
+import asyncio
+from typing import AsyncIterator, Tuple
 from dotenv import load_dotenv
 
+from shared.llm_clients import llm_clients, PERPLEXITY
+
 load_dotenv()
 
-PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
+# Requests in flight per process; excess callers wait instead of piling onto the API
+PERPLEXITY_MAX_CONCURRENCY = int(os.getenv("PERPLEXITY_MAX_CONCURRENCY", "16"))
 
-def _generate_with_perplexity(system_prompt: str, user_prompt: str, response_model: dict = None) -> str:
-    if not PERPLEXITY_API_KEY:
-        raise ValueError("Set PERPLEXITY_API_KEY environment variable")
+_semaphore = asyncio.Semaphore(PERPLEXITY_MAX_CONCURRENCY)
 
-    client = OpenAI(
-        api_key=PERPLEXITY_API_KEY,
-        base_url="https://api.perplexity.ai"
-    )
 
+def _request_kwargs(system_prompt: str, user_prompt: str, response_format: dict = None) -> dict:
     kwargs = {
-        "model": "sonar", 
+        "model": "sonar",
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
@@ -25,13 +23,40 @@ def _generate_with_perplexity(system_prompt: str, user_prompt: str, response_mod
         "temperature": 0.7,
     }
 
-    if response_model:
-        kwargs["response_format"] = {
-            "type": "json_schema",
-            "json_schema": {
-                "schema": response_model
-            }
-        }
+    if response_format:
+        kwargs["response_format"] = response_format
+    return kwargs
+
+
+async def _generate_with_perplexity(system_prompt: str, user_prompt: str, response_format: dict = None) -> Tuple[str, int]:
+    client = llm_clients.async_openai(PERPLEXITY)
+    kwargs = _request_kwargs(system_prompt, user_prompt, response_format)
+
+    async with _semaphore:
+        with llm_clients.track(PERPLEXITY):
+            response = await client.chat.completions.create(**kwargs)
+    prompt_tokens, completion_tokens = llm_clients.record_usage(PERPLEXITY, response)
+    return response.choices[0].message.content, prompt_tokens + completion_tokens
+
+
+async def _stream_with_perplexity(
+    system_prompt: str, user_prompt: str, response_format: dict = None
+) -> AsyncIterator[Tuple[str, int]]:
+    """Yields (text delta, 0) as tokens arrive, then ("", tokens used) once usage is reported."""
+    client = llm_clients.async_openai(PERPLEXITY)
+    kwargs = _request_kwargs(system_prompt, user_prompt, response_format)
+
+    usage_chunk = None
+    async with _semaphore:
+        with llm_clients.track(PERPLEXITY):
+            stream = await client.chat.completions.create(**kwargs, stream=True)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content, 0
+                if getattr(chunk, "usage", None):
+                    usage_chunk = chunk
 
-    response = client.chat.completions.create(**kwargs)
-    return response.choices[0].message.content
+    # Usage is cumulative and may be repeated on later chunks, so only the last counts
+    if usage_chunk is not None:
+        prompt_tokens, completion_tokens = llm_clients.record_usage(PERPLEXITY, usage_chunk)
+        yield "", prompt_tokens + completion_tokens
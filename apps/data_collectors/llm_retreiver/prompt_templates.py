@@ -0,0 +1,118 @@
+"""
+Prompt templates for generate_json_from_model, built once per model class.
+
+The JSON schema, the response_format payload and the system prompt only
+depend on the response model (and an optional custom description), so they
+are computed once and reused. Everything request-specific, including the
+number of options, goes in the user prompt. That keeps the system prompt a
+byte-identical prefix across requests, which lets Perplexity and Gemini
+apply their automatic prompt caching to it.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
+
+from shared.data_types import models
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    model_name: str
+    schema: Dict[str, Any]
+    response_format: Dict[str, Any]
+    system_prompt: str
+
+    def user_prompt(self, list_size: int, preferences_json: Optional[str]) -> str:
+        if preferences_json:
+            return f"""
+Generate exactly {list_size} items in the "options" array for this search request:
+{preferences_json}
+
+Remember: Output ONLY raw JSON, no markdown formatting.
+"""
+        return f"Generate exactly {list_size} realistic travel options. Output ONLY raw JSON."
+
+
+def _get_service_context(model_name: str) -> str:
+    """Get context-specific instructions for each service type."""
+    
+    contexts = {
+        "FlightSearchResponse": """
+Generate realistic flight options with:
+- Real airline names (United, Delta, American, British Airways, etc.)
+- Realistic routes and IATA airport codes
+- Appropriate pricing: economy $200-800, business $1000-3000, first $1500-5000
+- Realistic flight durations based on distance
+- 0-2 stops for most routes
+- ISO 8601 datetime format (YYYY-MM-DDTHH:MM:SS)
+- Include layover details when stops > 0
+- Amenities appropriate to cabin class
+- Component scores 0.0-1.0 (price_score: lower price = higher, quality_score: better service/fewer stops)
+""",
+        "ActivitySearchResponse": """
+Generate realistic activity options with:
+- Location-appropriate activities (tours, museums, outdoor activities, food tours)
+- Pricing $10-300 depending on activity type
+- Ratings 3.5-5.0
+- Duration 60-480 minutes (1-8 hours)
+- Realistic highlights and inclusions
+- Available time slots with ISO 8601 format (date: YYYY-MM-DD, time: HH:MM)
+- Difficulty levels: easy, moderate, challenging
+- Component scores 0.0-1.0 (preference_score: match to requested description)
+- IMPORTANT: Set the "category" field to the correct integer based on activity type:
+  0=UNKNOWN (use this in fallback cases), 1=TOUR, 2=MUSEUM, 3=RESTAURANT, 4=SHOW, 5=OUTDOOR, 
+  6=WATER_SPORTS, 7=NIGHTLIFE, 8=SHOPPING, 9=SPA, 10=ADVENTURE, 11=CULTURAL, 12=FOOD_TOUR
+  Examples: Walking tour=1, Art museum=2, Cooking class=12, Hiking=5, Snorkeling=6, Wine tasting=12
+""",
+        "TransportSearchResponse": """
+Generate realistic transport options with:
+- Appropriate modes for distance (rental car, rideshare, train, bus)
+- Realistic providers (Hertz, Uber, Amtrak, Greyhound, etc.)
+- Distance-appropriate pricing and duration
+- Vehicle details: class, model, seats, features
+- ISO 8601 datetime format (YYYY-MM-DDTHH:MM:SS)
+- For rental cars: economy, compact, SUV classes with daily rates
+- For rideshare: sedan, SUV, van options with wait times
+- For transit: line numbers, stops, service class
+- Component scores 0.0-1.0 (convenience_score: shorter duration/wait = higher)
+""",
+    }
+    
+    return contexts.get(model_name, "Generate realistic travel-related data.")
+
+
+
+@lru_cache(maxsize=None)
+def get_prompt_template(model_cls, system_description: Optional[str] = None) -> PromptTemplate:
+    schema = model_cls.model_json_schema()
+    system_prompt = f"""
+    You are a realistic travel data generator.
+    
+    {system_description or _get_service_context(model_cls.__name__)}
+    
+    IMPORTANT INSTRUCTIONS:
+    - For "options" arrays, generate exactly the number of items requested by the user, all diverse and realistic
+    - Use realistic names, locations, and pricing appropriate to the context
+    - All scores must be between 0.0 and 1.0
+    - Use ISO 8601 format for all dates and times
+    - Include all required fields
+    - Set "available" to true for all options
+    - Generate unique IDs for each option
+    """
+    return PromptTemplate(
+        model_name=model_cls.__name__,
+        schema=schema,
+        response_format={"type": "json_schema", "json_schema": {"schema": schema}},
+        system_prompt=system_prompt,
+    )
+
+
+def warm_prompt_templates(model_classes: Iterable[Any] = (
+    models.FlightSearchResponse,
+    models.ActivitySearchResponse,
+    models.TransportSearchResponse,
+)):
+    """Build the templates for the served models up front (call at startup)."""
+    for model_cls in model_classes:
+        get_prompt_template(model_cls)
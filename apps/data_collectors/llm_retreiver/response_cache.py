@@ -0,0 +1,239 @@
+"""
+Redis cache in front of generate_json_from_model.
+
+Requests are keyed by a normalized fingerprint: model class, locations,
+dates bucketed to ISO weeks, normalized description, list_size and the
+remaining non-empty filters. Optionally (LLM_CACHE_SIMILARITY=1) a miss on
+the exact key falls back to comparing description embeddings against other
+entries with the same fingerprint minus the description, so "museums" and
+"art museums" for the same city/week can share a result.
+
+Hit/miss counters and the tokens saved by hits are kept in Redis so they
+cover every worker.
+"""
+
+import hashlib
+import logging
+import math
+import os
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+from dotenv import load_dotenv
+
+from shared.llm_clients import llm_clients, GEMINI
+from shared.serialization import cache_dumps, cache_loads
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") == "1"
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(24 * 3600)))
+LLM_CACHE_SIMILARITY = os.getenv("LLM_CACHE_SIMILARITY", "0") == "1"
+LLM_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("LLM_CACHE_SIMILARITY_THRESHOLD", "0.9"))
+LLM_CACHE_EMBEDDING_MODEL = os.getenv("LLM_CACHE_EMBEDDING_MODEL", "text-embedding-004")
+
+KEY_PREFIX = "llm_cache:v1"
+STATS_KEY = f"{KEY_PREFIX}:stats"
+
+# Request fields folded into the fingerprint in normalized form
+LOCATION_FIELDS = ("location", "origin", "destination")
+DATE_FIELDS = ("dates", "date", "departure_date", "return_date")
+
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+redis_client = None
+
+
+async def get_redis_client():
+    global redis_client
+    if redis_client is None:
+        redis_client = await redis.from_url(REDIS_URL, decode_responses=True)
+    return redis_client
+
+
+def normalize_text(text: Any) -> str:
+    text = _NON_WORD_RE.sub(" ", str(text or "").lower())
+    return " ".join(text.split())
+
+
+def _week_bucket(value: str) -> str:
+    try:
+        year, week, _ = date.fromisoformat(value[:10]).isocalendar()
+        return f"{year}-W{week:02d}"
+    except ValueError:
+        return normalize_text(value)
+
+
+def _location_key(location: Dict[str, Any]) -> str:
+    parts = [normalize_text(location.get(k)) for k in ("city", "country", "airport_code")]
+    return "|".join(parts)
+
+
+def _is_empty(value: Any) -> bool:
+    return value in (None, "", 0, 0.0, [], {}) or (
+        isinstance(value, dict) and all(_is_empty(v) for v in value.values())
+    )
+
+
+def fingerprint(model_name: str, preferences: Optional[Dict[str, Any]], list_size: int,
+                extra: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], str]:
+    """
+    Returns (scope, description): everything that must match exactly, and the
+    normalized description that may instead match by similarity.
+    """
+    preferences = preferences or {}
+    scope: Dict[str, Any] = {"model": model_name, "list_size": list_size}
+
+    for field in LOCATION_FIELDS:
+        if isinstance(preferences.get(field), dict):
+            scope[field] = _location_key(preferences[field])
+
+    for field in DATE_FIELDS:
+        value = preferences.get(field)
+        if isinstance(value, dict):
+            scope[field] = [_week_bucket(v) for v in value.values() if v]
+        elif value:
+            scope[field] = _week_bucket(value)
+
+    handled = set(LOCATION_FIELDS) | set(DATE_FIELDS) | {"description", "max_results"}
+    scope["filters"] = {k: v for k, v in sorted(preferences.items()) if k not in handled and not _is_empty(v)}
+    if extra:
+        scope["extra"] = {k: v for k, v in sorted(extra.items()) if not _is_empty(v)}
+
+    return scope, normalize_text(preferences.get("description"))
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(cache_dumps(value)).hexdigest()[:32]
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+async def _embed(text: str) -> List[float]:
+    client = llm_clients.gemini()
+    with llm_clients.track(GEMINI):
+        result = await client.aio.models.embed_content(model=LLM_CACHE_EMBEDDING_MODEL, contents=text)
+    return list(result.embeddings[0].values)
+
+
+async def _find_similar(client, scope_key: str, embedding: List[float]) -> Optional[str]:
+    best_key, best_score = None, LLM_CACHE_SIMILARITY_THRESHOLD
+    for entry_key, raw in (await client.hgetall(scope_key)).items():
+        score = _cosine(embedding, cache_loads(raw))
+        if score >= best_score:
+            best_key, best_score = entry_key, score
+    return best_key
+
+
+async def _record(client, field: str, tokens_saved: int = 0):
+    pipe = client.pipeline()
+    pipe.hincrby(STATS_KEY, field, 1)
+    if tokens_saved:
+        pipe.hincrby(STATS_KEY, "tokens_saved", tokens_saved)
+    await pipe.execute()
+
+
+@dataclass
+class CacheSlot:
+    """Where a request's result lives (or will be stored) in the cache."""
+    entry_key: str
+    scope_key: str
+    client: Any = None
+    embedding: Optional[List[float]] = None
+
+
+async def lookup(
+    model_name: str,
+    preferences: Optional[Dict[str, Any]],
+    list_size: int,
+    extra: Optional[Dict[str, Any]] = None,
+) -> Tuple[Optional[Any], Optional[CacheSlot]]:
+    """
+    Returns (cached data or None, slot to `store` a fresh result in). The slot
+    is None when caching is disabled.
+    """
+    if not LLM_CACHE_ENABLED:
+        return None, None
+
+    scope, description = fingerprint(model_name, preferences, list_size, extra)
+    scope_digest = _digest(scope)
+    slot = CacheSlot(
+        entry_key=f"{KEY_PREFIX}:entry:{scope_digest}:{_digest(description)}",
+        scope_key=f"{KEY_PREFIX}:scope:{scope_digest}",
+    )
+
+    try:
+        slot.client = await get_redis_client()
+        cached = await slot.client.get(slot.entry_key)
+        if cached:
+            entry = cache_loads(cached)
+            await _record(slot.client, "hits_exact", entry.get("tokens", 0))
+            return entry["data"], slot
+
+        if LLM_CACHE_SIMILARITY and description:
+            slot.embedding = await _embed(description)
+            similar_key = await _find_similar(slot.client, slot.scope_key, slot.embedding)
+            cached = await slot.client.get(similar_key) if similar_key else None
+            if cached:
+                entry = cache_loads(cached)
+                await _record(slot.client, "hits_similar", entry.get("tokens", 0))
+                return entry["data"], slot
+    except Exception as e:
+        logger.info(f"LLM cache lookup error: {e}")
+
+    return None, slot
+
+
+async def store(slot: Optional[CacheSlot], data: Any, tokens: int):
+    if slot is None or slot.client is None:
+        return
+    try:
+        pipe = slot.client.pipeline()
+        pipe.setex(slot.entry_key, LLM_CACHE_TTL, cache_dumps({"data": data, "tokens": tokens}))
+        if slot.embedding is not None:
+            pipe.hset(slot.scope_key, slot.entry_key, cache_dumps(slot.embedding))
+            pipe.expire(slot.scope_key, LLM_CACHE_TTL)
+        pipe.hincrby(STATS_KEY, "misses", 1)
+        pipe.hincrby(STATS_KEY, "tokens_spent", tokens)
+        await pipe.execute()
+    except Exception as e:
+        logger.info(f"LLM cache store error: {e}")
+
+
+async def get_or_generate(
+    model_name: str,
+    preferences: Optional[Dict[str, Any]],
+    list_size: int,
+    generate: Callable[[], Awaitable[Tuple[Any, int]]],
+    extra: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """
+    Return the cached result for this request, or run `generate()` (which
+    returns (data, tokens_used)) and cache it. Redis errors bypass the cache.
+    """
+    cached, slot = await lookup(model_name, preferences, list_size, extra)
+    if cached is not None:
+        return cached
+
+    data, tokens = await generate()
+    await store(slot, data, tokens)
+    return data
+
+
+async def cache_stats() -> Dict[str, Any]:
+    client = await get_redis_client()
+    raw = await client.hgetall(STATS_KEY)
+    stats = {k: int(raw.get(k, 0)) for k in ("hits_exact", "hits_similar", "misses", "tokens_saved", "tokens_spent")}
+    lookups = stats["hits_exact"] + stats["hits_similar"] + stats["misses"]
+    stats["hit_rate"] = round((stats["hits_exact"] + stats["hits_similar"]) / lookups, 4) if lookups else 0.0
+    return stats
@@ -0,0 +1,88 @@
+"""
+Incremental parser for the "options" array of a streamed LLM JSON response.
+
+Text deltas are fed in as they arrive; every element of the top-level
+"options" array is returned as soon as its closing brace is seen, without
+waiting for the rest of the document. Anything before the array (markdown
+fences, prose, other keys) is skipped.
+"""
+
+import re
+from typing import Any, Dict, List
+
+import orjson
+
+_OPTIONS_KEY_RE = re.compile(r'"options"\s*:\s*\[')
+
+
+class OptionsArrayParser:
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0           # next character of _buffer to scan
+        self._in_array = False
+        self._done = False
+        self._depth = 0         # brace/bracket depth inside the array
+        self._in_string = False
+        self._escaped = False
+        self._item_start = -1
+
+    @property
+    def done(self) -> bool:
+        """True once the options array has been closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a text delta and return the options completed by it."""
+        if self._done or not chunk:
+            return []
+        self._buffer += chunk
+
+        if not self._in_array:
+            match = _OPTIONS_KEY_RE.search(self._buffer)
+            if not match:
+                return []
+            self._in_array = True
+            self._buffer = self._buffer[match.end():]
+            self._pos = 0
+
+        items: List[Dict[str, Any]] = []
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer):
+            ch = buffer[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                if self._depth == 0:
+                    self._item_start = i
+                self._depth += 1
+            elif ch in "}]":
+                if self._depth == 0:
+                    # End of the options array itself
+                    self._done = True
+                    break
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        item = orjson.loads(buffer[self._item_start:i + 1])
+                        if isinstance(item, dict):
+                            items.append(item)
+                    except orjson.JSONDecodeError:
+                        pass
+                    self._item_start = -1
+            i += 1
+
+        # Drop the scanned prefix, keeping only a still-open item
+        keep_from = self._item_start if self._item_start >= 0 else i
+        self._buffer = buffer[keep_from:]
+        self._pos = i - keep_from
+        if self._item_start >= 0:
+            self._item_start = 0
+        return items
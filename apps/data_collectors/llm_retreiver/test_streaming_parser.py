@@ -0,0 +1,47 @@
+"""
+Checks for the incremental options parser.
+Run from the repository root: python -m pytest apps/data_collectors/llm_retreiver/test_streaming_parser.py
+"""
+
+import json
+
+from apps.data_collectors.llm_retreiver.streaming_parser import OptionsArrayParser
+
+OPTIONS = [
+    {"id": "a1", "name": "Tour {with} [brackets]", "tags": ["x", {"y": 1}]},
+    {"id": "a2", "name": 'Quote \" and backslash \\\\ inside'},
+    {"id": "a3", "name": "Last"},
+]
+DOCUMENT = "```json\n" + json.dumps({"options": OPTIONS, "metadata": {"total_results": 3}}) + "\n```"
+
+
+def _feed_in_chunks(document, size):
+    parser = OptionsArrayParser()
+    batches = [parser.feed(document[i:i + size]) for i in range(0, len(document), size)]
+    return parser, batches
+
+
+def test_single_character_chunks_yield_every_option():
+    parser, batches = _feed_in_chunks(DOCUMENT, 1)
+    assert [item for batch in batches for item in batch] == OPTIONS
+    assert parser.done
+
+
+def test_options_are_yielded_as_soon_as_they_close():
+    first_end = DOCUMENT.index('"id": "a2"')
+    parser = OptionsArrayParser()
+    assert parser.feed(DOCUMENT[:first_end]) == [OPTIONS[0]]
+    assert parser.feed(DOCUMENT[first_end:]) == OPTIONS[1:]
+
+
+def test_truncated_stream_keeps_completed_options():
+    cut = DOCUMENT.index('"id": "a3"')
+    parser, batches = _feed_in_chunks(DOCUMENT[:cut], 16)
+    assert [item for batch in batches for item in batch] == OPTIONS[:2]
+    assert not parser.done
+
+
+def test_text_after_array_is_ignored():
+    parser = OptionsArrayParser()
+    assert parser.feed('{"options": []} {"options": [{"id": "late"}]}') == []
+    assert parser.done
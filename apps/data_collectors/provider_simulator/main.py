@@ -0,0 +1,417 @@
+"""
+Offline stand-in for the external hotel and flight providers.
+
+Mimics the LiteAPI `/data/hotels` and `/hotels/rates` endpoints and the
+Amadeus OAuth + flight-offers endpoints closely enough for the retrievers'
+transformers, with configurable latency distributions, error rates and
+payload sizes. Point the retrievers at it with LITE_API_BASE_URL and
+AMADEUS_BASE_URL to benchmark the whole pipeline without credentials.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+app = FastAPI(
+    title="Provider Simulator",
+    description="Offline LiteAPI / Amadeus stand-in for load testing.",
+    version="1.0.0"
+)
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+AIRLINES = ["BA", "LH", "AF", "KL", "LY", "UA", "DL", "AA", "IB", "AZ"]
+AIRPORT_CITIES = {
+    "TLV": ("Tel Aviv", "IL", 32.0114, 34.8867),
+    "JFK": ("New York", "US", 40.6413, -73.7781),
+    "LHR": ("London", "GB", 51.4700, -0.4543),
+    "CDG": ("Paris", "FR", 49.0097, 2.5479),
+    "FCO": ("Rome", "IT", 41.8003, 12.2389),
+    "FRA": ("Frankfurt", "DE", 50.0379, 8.5622),
+    "AMS": ("Amsterdam", "NL", 52.3105, 4.7683),
+    "MAD": ("Madrid", "ES", 40.4983, -3.5676),
+}
+HUB_AIRPORTS = ["FRA", "AMS", "CDG", "LHR", "MAD"]
+BOARD_TYPES = [("RO", "Room Only"), ("BB", "Bed & Breakfast"), ("HB", "Half Board")]
+ROOM_NAMES = ["Standard Room", "Deluxe Room", "Superior Double", "Junior Suite", "Family Room"]
+
+
+class SimulatorConfig(BaseModel):
+    """Runtime knobs; defaults come from SIM_* environment variables."""
+    latency_distribution: str = os.getenv("SIM_LATENCY_DISTRIBUTION", "lognormal")
+    latency_ms: float = float(os.getenv("SIM_LATENCY_MS", "250"))
+    latency_spread_ms: float = float(os.getenv("SIM_LATENCY_SPREAD_MS", "100"))
+    error_rate: float = float(os.getenv("SIM_ERROR_RATE", "0.0"))
+    hotels_per_city: int = int(os.getenv("SIM_HOTELS_PER_CITY", "50"))
+    room_types_per_hotel: int = int(os.getenv("SIM_ROOM_TYPES_PER_HOTEL", "3"))
+    flight_offers: int = int(os.getenv("SIM_FLIGHT_OFFERS", "250"))
+    description_chars: int = int(os.getenv("SIM_DESCRIPTION_CHARS", "400"))
+    seed: int = int(os.getenv("SIM_SEED", "42"))
+
+
+class SimulatorStats(BaseModel):
+    requests: Dict[str, int] = Field(default_factory=dict)
+    errors: Dict[str, int] = Field(default_factory=dict)
+    started_at: float = 0.0
+
+
+config = SimulatorConfig()
+_request_counts: Counter = Counter()
+_error_counts: Counter = Counter()
+_started_at = time.time()
+# Latency and error draws; seeded from config.seed, and reseeded when the
+# config or the stats are reset, so runs with the same seed are comparable
+_rng = random.Random(config.seed)
+
+
+def _sample_latency_ms(cfg: SimulatorConfig) -> float:
+    """Draw one latency sample (ms) from the configured distribution."""
+    mean = cfg.latency_ms
+    spread = cfg.latency_spread_ms
+    dist = cfg.latency_distribution
+
+    if dist == "fixed":
+        return mean
+    if dist == "uniform":
+        return _rng.uniform(max(0.0, mean - spread), mean + spread)
+    if dist == "normal":
+        return max(0.0, _rng.gauss(mean, spread))
+    if dist == "exponential":
+        return _rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+    # lognormal: `latency_ms` is the median, `latency_spread_ms` shapes the tail
+    if mean <= 0:
+        return 0.0
+    sigma = max(spread, 1.0) / mean
+    return _rng.lognormvariate(0.0, sigma) * mean
+
+
+async def _simulate(endpoint: str) -> Optional[JSONResponse]:
+    """Sleep for a sampled latency and optionally return an injected error."""
+    _request_counts[endpoint] += 1
+    await asyncio.sleep(_sample_latency_ms(config) / 1000.0)
+
+    if config.error_rate > 0 and _rng.random() < config.error_rate:
+        _error_counts[endpoint] += 1
+        return _error_response(endpoint)
+    return None
+
+
+def _error_response(endpoint: str) -> JSONResponse:
+    if endpoint.startswith("amadeus"):
+        return JSONResponse(
+            status_code=500,
+            content={"errors": [{"status": 500, "code": 141, "title": "SYSTEM ERROR HAS OCCURRED"}]},
+        )
+    return JSONResponse(
+        status_code=500,
+        content={"error": {"code": 5000, "message": "Simulated provider failure"}},
+    )
+
+
+def _seeded_rng(*parts: Any) -> random.Random:
+    """Deterministic RNG so the same query always yields the same inventory."""
+    key = "|".join(str(p) for p in (config.seed, *parts))
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+def _filler_text(rng: random.Random, size: int) -> str:
+    words = ["charming", "central", "quiet", "rooftop", "historic", "modern",
+             "spacious", "bright", "cozy", "elegant", "boutique", "riverside"]
+    out: List[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        out.append(word)
+        length += len(word) + 1
+    return "<p>" + " ".join(out)[:size] + "</p>"
+
+
+# ==========================================
+# LiteAPI
+# ==========================================
+
+def _hotel_id(city: str, index: int) -> str:
+    return f"lp{hashlib.md5(f'{city.lower()}:{index}'.encode()).hexdigest()[:8]}"
+
+
+def _build_hotel(city: str, country: str, index: int) -> Dict[str, Any]:
+    rng = _seeded_rng("hotel", city.lower(), index)
+    stars = rng.randint(2, 5)
+    return {
+        "id": _hotel_id(city, index),
+        "name": f"Sim Hotel {city.title()} {index}",
+        "hotelDescription": _filler_text(rng, config.description_chars),
+        "currency": "USD",
+        "country": country.lower(),
+        "city": city.title(),
+        "latitude": round(rng.uniform(-60, 60), 6),
+        "longitude": round(rng.uniform(-120, 120), 6),
+        "address": f"{rng.randint(1, 300)} Simulation Street",
+        "zip": f"{rng.randint(10000, 99999)}",
+        "main_photo": f"https://static.sim.local/hotels/{_hotel_id(city, index)}.jpg",
+        "stars": stars,
+        "rating": round(rng.uniform(5.5, 9.8), 1),
+        "reviewCount": rng.randint(10, 5000),
+        "facilityIds": rng.sample(range(1, 400), rng.randint(3, 25)),
+    }
+
+
+def _nights(checkin: str, checkout: str) -> int:
+    try:
+        delta = datetime.fromisoformat(checkout) - datetime.fromisoformat(checkin)
+        return max(1, delta.days)
+    except ValueError:
+        return 1
+
+
+def _build_hotel_rates(hotel_id: str, checkin: str, checkout: str, currency: str) -> Dict[str, Any]:
+    rng = _seeded_rng("rates", hotel_id, checkin, checkout)
+    nights = _nights(checkin, checkout)
+    room_types = []
+    for r in range(config.room_types_per_hotel):
+        nightly = rng.uniform(60, 900)
+        total = round(nightly * nights, 2)
+        board_type, board_name = rng.choice(BOARD_TYPES)
+        room_types.append({
+            "roomTypeId": f"{hotel_id}-rt{r}",
+            "offerId": f"offer-{hotel_id}-{r}-{checkin}",
+            "supplier": "Simulator",
+            "supplierId": 1,
+            "offerRetailRate": {"amount": total, "currency": currency},
+            "suggestedSellingPrice": {"amount": round(total * 1.1, 2), "currency": currency},
+            "offerInitialPrice": {"amount": round(total * 1.05, 2), "currency": currency},
+            "rates": [{
+                "rateId": f"rate-{hotel_id}-{r}",
+                "name": rng.choice(ROOM_NAMES),
+                "maxOccupancy": rng.randint(2, 4),
+                "adultCount": 2,
+                "childCount": 0,
+                "boardType": board_type,
+                "boardName": board_name,
+                "retailRate": {
+                    "total": [{"amount": total, "currency": currency}],
+                    "taxesAndFees": [{
+                        "included": rng.random() < 0.7,
+                        "description": "City tax",
+                        "amount": round(rng.uniform(2, 30), 2),
+                        "currency": currency,
+                    }],
+                },
+                "cancellationPolicies": {"refundableTag": rng.choice(["RFN", "NRFN"])},
+            }],
+        })
+    return {"hotelId": hotel_id, "roomTypes": room_types}
+
+
+@app.get("/v3.0/data/hotels")
+async def lite_get_hotels(countryCode: str = "", cityName: str = "", limit: int = 0, offset: int = 0):
+    """LiteAPI hotel listing for a city."""
+    error = await _simulate("liteapi.data_hotels")
+    if error:
+        return error
+
+    count = config.hotels_per_city
+    if limit:
+        count = min(count, limit)
+    hotels = [_build_hotel(cityName, countryCode, i) for i in range(offset, offset + count)]
+    return {"data": hotels, "hotelIds": [h["id"] for h in hotels], "total": len(hotels)}
+
+
+@app.post("/v3.0/hotels/rates")
+async def lite_get_rates(request: Request):
+    """LiteAPI availability/rates for the requested hotel ids."""
+    error = await _simulate("liteapi.hotels_rates")
+    if error:
+        return error
+
+    payload = await request.json()
+    checkin = payload.get("checkin", "")
+    checkout = payload.get("checkout", "")
+    currency = payload.get("currency", "USD")
+    data = [
+        _build_hotel_rates(hotel_id, checkin, checkout, currency)
+        for hotel_id in payload.get("hotelIds", [])
+    ]
+    return {"data": data}
+
+
+# ==========================================
+# Amadeus
+# ==========================================
+
+@app.post("/v1/security/oauth2/token")
+async def amadeus_token():
+    """Amadeus client-credentials token; any credentials are accepted."""
+    _request_counts["amadeus.token"] += 1
+    return {
+        "type": "amadeusOAuth2Token",
+        "access_token": "simulated-token",
+        "token_type": "Bearer",
+        "expires_in": 1799,
+        "state": "approved",
+    }
+
+
+def _location_entry(iata: str) -> Dict[str, Any]:
+    city, country, lat, lon = AIRPORT_CITIES.get(iata, (iata.title(), "", 0.0, 0.0))
+    return {
+        "cityCode": iata,
+        "cityName": city,
+        "countryCode": country,
+        "geoCode": {"latitude": lat, "longitude": lon},
+    }
+
+
+def _iso_duration(minutes: int) -> str:
+    return f"PT{minutes // 60}H{minutes % 60}M"
+
+
+def _build_offer(index: int, origin: str, dest: str, departure_date: str, adults: int) -> Dict[str, Any]:
+    rng = _seeded_rng("offer", origin, dest, departure_date, index)
+    carrier = rng.choice(AIRLINES)
+    stops = rng.choices([0, 1, 2], weights=[5, 4, 1])[0]
+    hubs = rng.sample([h for h in HUB_AIRPORTS if h not in (origin, dest)], stops)
+    path = [origin, *hubs, dest]
+
+    try:
+        depart = datetime.fromisoformat(departure_date) + timedelta(hours=rng.randint(5, 22))
+    except ValueError:
+        depart = datetime(2026, 1, 1, 8)
+
+    segments = []
+    current = depart
+    for leg, (seg_from, seg_to) in enumerate(zip(path, path[1:])):
+        flight_minutes = rng.randint(60, 420)
+        arrive = current + timedelta(minutes=flight_minutes)
+        segments.append({
+            "departure": {"iataCode": seg_from, "terminal": str(rng.randint(1, 3)), "at": current.isoformat()},
+            "arrival": {"iataCode": seg_to, "terminal": str(rng.randint(1, 3)), "at": arrive.isoformat()},
+            "carrierCode": carrier,
+            "number": str(rng.randint(100, 9999)),
+            "aircraft": {"code": rng.choice(["320", "321", "738", "77W", "789"])},
+            "duration": _iso_duration(flight_minutes),
+            "id": str(leg + 1),
+            "numberOfStops": 0,
+        })
+        current = arrive + timedelta(minutes=rng.randint(45, 300))
+
+    total_minutes = int((datetime.fromisoformat(segments[-1]["arrival"]["at"]) - depart).total_seconds() // 60)
+    per_person = round(rng.uniform(120, 2400), 2)
+    grand_total = round(per_person * adults, 2)
+    amenities = [{"description": d, "isChargeable": False}
+                 for d in rng.sample(["WIFI ON BOARD", "MEAL", "IN FLIGHT ENTERTAINMENT", "USB POWER"], rng.randint(0, 4))]
+
+    return {
+        "type": "flight-offer",
+        "id": str(index + 1),
+        "source": "GDS",
+        "itineraries": [{"duration": _iso_duration(total_minutes), "segments": segments}],
+        "price": {"currency": "USD", "total": f"{grand_total:.2f}", "grandTotal": f"{grand_total:.2f}"},
+        "validatingAirlineCodes": [carrier],
+        "travelerPricings": [{
+            "travelerId": "1",
+            "travelerType": "ADULT",
+            "price": {"currency": "USD", "total": f"{per_person:.2f}"},
+            "fareDetailsBySegment": [{
+                "segmentId": "1",
+                "cabin": "ECONOMY",
+                "includedCheckedBags": {"quantity": rng.randint(0, 2), "weight": 23, "weightUnit": "KG"},
+                "includedCabinBags": {"quantity": 1},
+                "amenities": amenities,
+            }],
+        }],
+    }
+
+
+@app.get("/v2/shopping/flight-offers")
+async def amadeus_flight_offers(
+    originLocationCode: str,
+    destinationLocationCode: str,
+    departureDate: str,
+    adults: int = 1,
+    max: int = 250,
+):
+    """Amadeus Flight Offers Search (GET variant used by the retriever)."""
+    error = await _simulate("amadeus.flight_offers")
+    if error:
+        return error
+
+    count = min(config.flight_offers, max)
+    offers = [
+        _build_offer(i, originLocationCode, destinationLocationCode, departureDate, adults)
+        for i in range(count)
+    ]
+    iatas = {originLocationCode, destinationLocationCode, *HUB_AIRPORTS}
+    return {
+        "meta": {"count": len(offers)},
+        "data": offers,
+        "dictionaries": {"locations": {code: _location_entry(code) for code in iatas}},
+    }
+
+
+# ==========================================
+# Simulator control
+# ==========================================
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy", "service": "provider_simulator"}
+
+
+@app.get("/_simulator/config", response_model=SimulatorConfig)
+async def get_config():
+    return config
+
+
+@app.put("/_simulator/config", response_model=SimulatorConfig)
+async def update_config(update: Dict[str, Any]):
+    """Change latency / error / payload knobs without restarting the server."""
+    global config
+    merged = {**config.model_dump(), **update}
+    if merged["latency_distribution"] not in LATENCY_DISTRIBUTIONS:
+        return JSONResponse(
+            status_code=400,
+            content={"detail": f"latency_distribution must be one of {LATENCY_DISTRIBUTIONS}"},
+        )
+    config = SimulatorConfig.model_validate(merged)
+    _rng.seed(config.seed)
+    logger.info(f"Simulator config updated: {config.model_dump()}")
+    return config
+
+
+@app.get("/_simulator/stats", response_model=SimulatorStats)
+async def get_stats():
+    return SimulatorStats(requests=dict(_request_counts), errors=dict(_error_counts), started_at=_started_at)
+
+
+@app.post("/_simulator/reset")
+async def reset_stats():
+    global _started_at
+    _request_counts.clear()
+    _error_counts.clear()
+    _started_at = time.time()
+    _rng.seed(config.seed)
+    return {"status": "reset"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000, access_log=False)
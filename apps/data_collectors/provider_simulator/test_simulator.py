@@ -0,0 +1,24 @@
+"""
+Checks that the provider simulator's random draws repeat for the same seed.
+Run from the repository root: python -m pytest apps/data_collectors/provider_simulator/test_simulator.py
+"""
+
+from fastapi.testclient import TestClient
+
+from apps.data_collectors.provider_simulator import main
+
+
+def _latencies(count=20):
+    return [main._sample_latency_ms(main.config) for _ in range(count)]
+
+
+def test_latencies_repeat_after_reset_and_follow_the_seed():
+    client = TestClient(main.app)
+    assert client.put("/_simulator/config", json={"seed": 7}).status_code == 200
+    first = _latencies()
+    client.post("/_simulator/reset")
+    assert _latencies() == first
+
+    client.put("/_simulator/config", json={"seed": 8})
+    assert _latencies() != first
+    client.put("/_simulator/config", json={"seed": main.SimulatorConfig().seed})
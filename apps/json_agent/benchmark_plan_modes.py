@@ -0,0 +1,104 @@
+"""
+Compare json_agent plan generation modes on latency and token usage.
+
+Runs generate_trip_plans in each mode against the configured provider
+(PERPLEXITY_BASE_URL can point at a stub) and reports, per mode, the wall
+time, the number of LLM calls, prompt/completion tokens and how many
+distinct route signatures came back.
+
+Examples:
+    python -m apps.json_agent.benchmark_plan_modes --trip-yml trip.yml
+    python -m apps.json_agent.benchmark_plan_modes --modes sequential,single_call --runs 5
+"""
+
+import sys
+import os
+# Add the project root to sys.path so 'shared' can be imported without PYTHONPATH hacks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+from shared.llm_clients import llm_clients, PERPLEXITY
+from apps.json_agent.main import (
+    PLAN_GENERATION_MODES,
+    generate_trip_plans,
+    _extract_route_signature,
+    _route_signature_key,
+)
+
+DEFAULT_TRIP_YML = """
+travelers:
+  adults: 2
+origin:
+  city: Tel Aviv
+  iata: TLV
+destinations:
+  - region: Northern Italy
+dates:
+  departureDate: 2026-09-10
+  nights: 7
+preferences:
+  - food
+  - history
+"""
+
+
+def _counters() -> Dict[str, int]:
+    snapshot = llm_clients.snapshot()[PERPLEXITY]
+    return {k: snapshot[k] for k in ("requests", "prompt_tokens", "completion_tokens")}
+
+
+def run_mode(mode: str, trip_yml: str, count: int, runs: int) -> Dict[str, Any]:
+    timings: List[float] = []
+    distinct_routes: List[int] = []
+    before = _counters()
+    for _ in range(runs):
+        start = time.perf_counter()
+        plans = generate_trip_plans(trip_yml, count, mode=mode)
+        timings.append(time.perf_counter() - start)
+        distinct_routes.append(len({_route_signature_key(_extract_route_signature(p)) for p in plans}))
+    after = _counters()
+
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        **{f"{k}_per_run": (after[k] - before[k]) / runs for k in before},
+        "distinct_routes_avg": statistics.mean(distinct_routes),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="json_agent plan generation mode benchmark")
+    parser.add_argument("--trip-yml", help="YAML trip description file (defaults to a built-in sample)")
+    parser.add_argument("--modes", default=",".join(PLAN_GENERATION_MODES), help="Comma separated modes")
+    parser.add_argument("--count", type=int, default=3, help="Plans per run")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode")
+    parser.add_argument("--report", help="Write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    trip_yml = DEFAULT_TRIP_YML
+    if args.trip_yml:
+        with open(args.trip_yml) as f:
+            trip_yml = f.read()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+        results[mode] = stats = run_mode(mode, trip_yml, args.count, args.runs)
+        print(
+            f"{mode:<12} median={stats['median_s']:7.2f}s  min={stats['min_s']:7.2f}s  "
+            f"calls={stats['requests_per_run']:5.1f}  prompt_tok={stats['prompt_tokens_per_run']:8.0f}  "
+            f"completion_tok={stats['completion_tokens_per_run']:7.0f}  routes={stats['distinct_routes_avg']:.1f}/{args.count}"
+        )
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
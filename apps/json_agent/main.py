@@ -1,6 +1,8 @@
 from fastapi import FastAPI, HTTPException, Request
 import logging
 import time
+from shared.llm_clients import llm_clients, PERPLEXITY
+from shared.countries import normalize_country_to_iso2
 from shared.data_types.models import (
     TripRequest, TripSection, SectionType,
     FlightRequest, StayRequest, Location, DateRange,
@@ -9,13 +11,11 @@ from shared.data_types.models import (
 from dotenv import load_dotenv
 import uvicorn
 from pydantic import BaseModel
-from openai import OpenAI
 import json
 import os
 import re
-import unicodedata
-from pathlib import Path
-from typing import List, Dict, Any, Union, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Union, Set
 
 # Configure logging
 logging.basicConfig(
@@ -26,12 +26,16 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
-
-client = OpenAI(
-    api_key=PERPLEXITY_API_KEY,
-    base_url="https://api.perplexity.ai"
-)
+# "sequential" (each plan sees the earlier ones), "parallel" or "single_call"
+# (all plans in one response); overridable per request
+PLAN_GENERATION_MODES = ("sequential", "parallel", "single_call")
+PLAN_GENERATION_MODE = os.getenv("PLAN_GENERATION_MODE", "sequential")
+# Parallel mode: how many times colliding/failed plans are regenerated
+PLAN_REGENERATION_ROUNDS = int(os.getenv("PLAN_REGENERATION_ROUNDS", "1"))
+# "full" (rewrite every plan) or "incremental" (patch only the targeted plans,
+# falling back to "full" when the patches can't be used); overridable per request
+PLAN_EDIT_MODES = ("incremental", "full")
+PLAN_EDIT_MODE = os.getenv("PLAN_EDIT_MODE", "full")
 
 app = FastAPI()
 
@@ -49,6 +53,7 @@ async def log_requests(request: Request, call_next):
 
 class GeneratePlansRequest(BaseModel):
     trip_yml: str = ""
+    mode: Optional[str] = None  # defaults to PLAN_GENERATION_MODE
 
 class GeneratedTripResponse(BaseModel):
     vibe: str
@@ -68,85 +73,34 @@ class GenerateTripRequest(BaseModel):
 class EditTripPlansRequest(BaseModel):
     plans: List[TripPlan]
     user_text: str
+    mode: Optional[str] = None  # defaults to PLAN_EDIT_MODE
 
 class EditTripPlansResponse(BaseModel):
     plans: List[TripPlan]
     modified_indices: List[int]
+    # Rebuilt only for the modified plans, keyed by plan index
+    trip_requests: Dict[int, TripRequest] = {}
 
+class TargetPlansResponse(BaseModel):
+    indices: List[int]
 
-# ==========================================
-# HELPER FUNCTIONS
-# ==========================================
+class ActionPatch(BaseModel):
+    op: str  # "replace", "insert" or "delete"
+    index: int  # position in the plan's original actions list
+    action: Optional[List[Union[str, int, float, None]]] = None
 
-def _normalize_country_key(value: str) -> str:
-    normalized = unicodedata.normalize("NFKD", value)
-    normalized = "".join(
-        char for char in normalized if not unicodedata.combining(char)
-    )
-    normalized = normalized.lower().strip()
-    normalized = re.sub(r"[^a-z0-9]+", " ", normalized)
-    return re.sub(r"\s+", " ", normalized).strip()
+class PlanPatch(BaseModel):
+    plan_index: int
+    vibe: Optional[str] = None
+    patches: List[ActionPatch] = []
 
+class PlanPatchesResponse(BaseModel):
+    plans: List[PlanPatch]
 
-def _load_country_name_to_code_map() -> Dict[str, str]:
-    try:
-        repo_root = Path(__file__).resolve().parents[2]
-        shared_countries_path = (
-            repo_root / "shared" / "metadata" / "countries.json"
-        )
-        legacy_web_countries_path = (
-            repo_root / "apps" / "web-client" / "common" / "countries.json"
-        )
-
-        countries_path = (
-            shared_countries_path
-            if shared_countries_path.exists()
-            else legacy_web_countries_path
-        )
-
-        raw = countries_path.read_text(encoding="utf-8")
-        items = json.loads(raw)
-        if not isinstance(items, list):
-            return {}
 
-        mapping: Dict[str, str] = {}
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            name = item.get("name")
-            code = item.get("code")
-            if not isinstance(name, str) or not isinstance(code, str):
-                continue
-            name = name.strip()
-            code = code.strip()
-            if not name or not code:
-                continue
-            mapping[_normalize_country_key(name)] = code.upper()
-        return mapping
-    except Exception:
-        return {}
-
-
-_COUNTRY_NAME_TO_ISO2: Dict[str, str] = _load_country_name_to_code_map()
-
-
-def normalize_country_to_iso2(country: str) -> str:
-    if not isinstance(country, str):
-        return ""
-
-    country = country.strip()
-    if not country:
-        return country
-
-    if re.fullmatch(r"[A-Za-z]{2}", country):
-        return country.upper()
-
-    key = _normalize_country_key(country)
-    code = _COUNTRY_NAME_TO_ISO2.get(key)
-    if code:
-        return code
-
-    return country
+# ==========================================
+# HELPER FUNCTIONS
+# ==========================================
 
 def extract_json_from_text(text: str) -> str:
     """
@@ -344,6 +298,29 @@ def _route_signature_key(signature: List[str]) -> str:
     return ">".join(signature)
 
 
+# Action format and flight rules shared by the plan generation prompts
+_PLAN_ACTION_PROTOCOL = """Protocol for Actions:
+    
+    1. FLIGHT
+       Format: ["FLIGHT", origin_city, origin_country, origin_code, dest_city, dest_country, dest_code, date, return_date, passengers, cabin]
+       Note: YOU MUST PROVIDE IATA CODES. If a city does not have an airport, find and use the nearest major hub airport code.
+       
+    2. STAY
+       Format: ["STAY", city, country, start_date, end_date, guests, rooms, description]
+       Note: description is a short string of activity preferences. USE ISO-2 COUNTRY CODES (e.g., "US", "IT", "FR", "GB", "IL").
+    
+    CRITICAL FLIGHT RULES:
+    - A trip has EXACTLY TWO FLIGHTS ONLY: one OUTBOUND flight (from origin to first destination) and one RETURN flight (from last destination back to origin).
+    - NEVER add intermediate flights between destinations. Travel between cities during the trip is by ground transport (train/car), which is handled automatically - DO NOT add actions for it.
+    - Example for a multi-city trip (TLV -> Rome -> Florence -> Venice -> TLV):
+      * ONE outbound flight: TLV -> Rome
+      * STAYS: Rome, then Florence, then Venice (consecutive)
+      * ONE return flight: Venice -> TLV
+      * NO flights between Rome->Florence or Florence->Venice!
+    - HUB RESOLUTION: If the destination is a place without a major airport (e.g. Positano, Monaco, Gozo), you MUST use the nearest major international airport (hub) and its IATA code (e.g. NAP for Positano, NCE for Monaco, MLA for Gozo).
+    - MANDATORY RETURN: Every single trip plan MUST include a return flight from the final destination back to the original starting city."""
+
+
 def generate_single_trip_plan(
     trip_yml: str,
     previous_vibes: List[str],
@@ -379,26 +356,7 @@ def generate_single_trip_plan(
     The option should have a unique "vibe" name (e.g., "Luxury Relax", "Adventure", "Cultural Deep Dive").
     Represent the plan as a "vibe" name and a COMPACT SEQUENCE of actions.
     
-    Protocol for Actions:
-    
-    1. FLIGHT
-       Format: ["FLIGHT", origin_city, origin_country, origin_code, dest_city, dest_country, dest_code, date, return_date, passengers, cabin]
-       Note: YOU MUST PROVIDE IATA CODES. If a city does not have an airport, find and use the nearest major hub airport code.
-       
-    2. STAY
-       Format: ["STAY", city, country, start_date, end_date, guests, rooms, description]
-       Note: description is a short string of activity preferences. USE ISO-2 COUNTRY CODES (e.g., "US", "IT", "FR", "GB", "IL").
-    
-    CRITICAL FLIGHT RULES:
-    - A trip has EXACTLY TWO FLIGHTS ONLY: one OUTBOUND flight (from origin to first destination) and one RETURN flight (from last destination back to origin).
-    - NEVER add intermediate flights between destinations. Travel between cities during the trip is by ground transport (train/car), which is handled automatically - DO NOT add actions for it.
-    - Example for a multi-city trip (TLV -> Rome -> Florence -> Venice -> TLV):
-      * ONE outbound flight: TLV -> Rome
-      * STAYS: Rome, then Florence, then Venice (consecutive)
-      * ONE return flight: Venice -> TLV
-      * NO flights between Rome->Florence or Florence->Venice!
-    - HUB RESOLUTION: If the destination is a place without a major airport (e.g. Positano, Monaco, Gozo), you MUST use the nearest major international airport (hub) and its IATA code (e.g. NAP for Positano, NCE for Monaco, MLA for Gozo).
-    - MANDATORY RETURN: Every single trip plan MUST include a return flight from the final destination back to the original starting city.
+    {_PLAN_ACTION_PROTOCOL}
     
     Rules:
     - Generate EXACTLY ONE option.
@@ -428,18 +386,20 @@ def generate_single_trip_plan(
     }}
     """
 
-    response = client.chat.completions.create(
-        model="sonar",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=1.1,
-        top_p=0.95,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "schema": TripPlan.model_json_schema()
+    with llm_clients.track(PERPLEXITY):
+        response = llm_clients.openai(PERPLEXITY).chat.completions.create(
+            model="sonar",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=1.1,
+            top_p=0.95,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "schema": TripPlan.model_json_schema()
+                }
             }
-        }
-    )
+        )
+    llm_clients.record_usage(PERPLEXITY, response)
 
     content = response.choices[0].message.content
     try:
@@ -450,6 +410,208 @@ def generate_single_trip_plan(
         return None
 
 
+DIVERSITY_DIRECTIVES = [
+    "Classic highlights route: iconic sights, balanced pacing.",
+    "Offbeat/hidden-gems route: prefer secondary cities and avoid the most standard tourist triangle.",
+    "Nature/coast/wellness route: prioritize scenic towns, beaches/lakes, hiking/spas, slower travel.",
+]
+
+# Parallel plans cannot see each other, so each slot also gets a different
+# route shape to keep their city signatures apart.
+ROUTE_STRATEGIES = [
+    "ROUTE STRATEGY: build the route around the single most obvious gateway city for this destination.",
+    "ROUTE STRATEGY: do NOT stay in the destination's best-known city; base the trip in secondary or regional cities.",
+    "ROUTE STRATEGY: use a different region of the destination than a classic first-time itinerary would, with at least one smaller town.",
+]
+
+
+def _parallel_directive(slot: int) -> str:
+    return (
+        f"{DIVERSITY_DIRECTIVES[slot % len(DIVERSITY_DIRECTIVES)]}\n"
+        f"        {ROUTE_STRATEGIES[slot % len(ROUTE_STRATEGIES)]}"
+    )
+
+
+def generate_trip_plans_parallel(trip_yml: str, count: int = 3) -> List[Dict[str, Any]]:
+    """
+    Generate `count` plans concurrently, each with a pre-assigned directive and
+    route strategy instead of the earlier plans' vibes and routes. Plans that
+    fail or repeat an earlier plan's route signature are regenerated (again
+    concurrently) with the accepted plans as constraints; any still failing
+    or repeating after the last round are dropped, so fewer than `count`
+    plans may be returned.
+    """
+    slots: List[Optional[Dict[str, Any]]] = [None] * count
+    pending = list(range(count))
+    previous_vibes: List[str] = []
+    forbidden_route_signatures: List[List[str]] = []
+
+    def generate(slot: int) -> Optional[Dict[str, Any]]:
+        try:
+            return generate_single_trip_plan(
+                trip_yml,
+                previous_vibes,
+                forbidden_route_signatures,
+                _parallel_directive(slot),
+            )
+        except Exception as e:
+            logger.info(f"Error generating plan {slot+1}: {str(e)}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        for round_number in range(PLAN_REGENERATION_ROUNDS + 1):
+            results = list(executor.map(generate, pending))
+            # A failed regeneration empties its slot rather than keeping the plan it replaces
+            for slot, plan in zip(pending, results):
+                slots[slot] = plan if plan and "vibe" in plan else None
+
+            # Keep the first plan per route signature; regenerate the rest
+            seen: Set[str] = set()
+            retry: List[int] = []
+            for slot, plan in enumerate(slots):
+                if not plan:
+                    retry.append(slot)
+                    continue
+                sig_key = _route_signature_key(_extract_route_signature(plan))
+                if sig_key and sig_key in seen:
+                    retry.append(slot)
+                    continue
+                seen.add(sig_key)
+
+            if not retry or round_number == PLAN_REGENERATION_ROUNDS:
+                for slot in retry:
+                    logger.info(f"Warning: Plan {slot+1} failed or repeated a route signature, dropping it")
+                    slots[slot] = None
+                break
+
+            logger.info(f"Regenerating plans {[slot + 1 for slot in retry]} after round {round_number + 1}")
+            accepted = [plan for slot, plan in enumerate(slots) if plan and slot not in retry]
+            previous_vibes = [plan["vibe"] for plan in accepted]
+            forbidden_route_signatures = [s for s in (_extract_route_signature(p) for p in accepted) if s]
+            pending = retry
+
+    return [plan for plan in slots if plan]
+
+
+def generate_trip_plans_single_call(trip_yml: str, count: int = 3) -> List[Dict[str, Any]]:
+    """
+    Ask for all `count` plans in one structured response. Route-signature
+    uniqueness is checked locally; missing plans and plans repeating an
+    earlier route are replaced with generate_single_trip_plan calls.
+    """
+    directives = "\n".join(
+        f"        Plan {i+1}: {DIVERSITY_DIRECTIVES[i % len(DIVERSITY_DIRECTIVES)]}" for i in range(count)
+    )
+
+    prompt = f"""
+    You are a creative travel planner JSON Agent.
+    
+    Task:
+    Read the trip description and generate EXACTLY {count} DIFFERENT trip options (Vibes) in the "plans" array.
+    
+        DIVERSITY DIRECTIVES (one per plan, in order, MUST FOLLOW):
+{directives}
+    
+        HARD DIVERSITY CONSTRAINTS (MUST FOLLOW):
+        - Define ROUTE SIGNATURE as the ordered list of STAY city names (lowercased), e.g. ["rome", "florence", "venice"].
+        - Every plan MUST have a different route signature from every other plan.
+        - Do NOT simply reuse the same cities in the same order with different descriptions.
+        - Prefer changing at least one city and/or changing the order and number of stays.
+    Each option must have a unique "vibe" name (e.g., "Luxury Relax", "Adventure", "Cultural Deep Dive").
+    Represent each plan as a "vibe" name and a COMPACT SEQUENCE of actions.
+    
+    {_PLAN_ACTION_PROTOCOL}
+    
+    Rules:
+    - Generate EXACTLY {count} options.
+    - Ensure logical flow in every plan: FLIGHT -> STAY(s) -> FLIGHT (exactly 2 flights total).
+    - Be consistent with dates.
+    - Do not include any additional text or comments.
+
+    Creativity guidance (still must follow Trip Description):
+    - GEOGRAPHIC REALISM: Only suggest multiple cities if they are geographically close enough to be easily visited within the trip duration.
+    - Choose cities that make sense geographically (contiguous travel by ground is plausible).
+    - Vary the experience focus (food, history, outdoors, nightlife, wellness) in line with each "vibe".
+
+    Trip Description:
+    {trip_yml}
+    
+    Output JSON Example (one plan shown):
+    {{
+      "plans": [
+        {{
+          "vibe": "The Classic Tourist",
+          "actions": [
+            ["FLIGHT", "Tel Aviv", "IL", "TLV", "Rome", "IT", "FCO", "2024-05-01", "", 2, "economy"],
+            ["STAY", "Rome", "IT", "2024-05-01", "2024-05-04", 2, 1, "Colosseum and Vatican"],
+            ["STAY", "Florence", "IT", "2024-05-04", "2024-05-07", 2, 1, "Renaissance art and Tuscan cuisine"],
+            ["FLIGHT", "Florence", "IT", "FLR", "Tel Aviv", "IL", "TLV", "2024-05-07", "", 2, "economy"]
+          ]
+        }}
+      ]
+    }}
+    """
+
+    with llm_clients.track(PERPLEXITY):
+        response = llm_clients.openai(PERPLEXITY).chat.completions.create(
+            model="sonar",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=1.1,
+            top_p=0.95,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "schema": TripPlansResponse.model_json_schema()
+                }
+            }
+        )
+    llm_clients.record_usage(PERPLEXITY, response)
+
+    content = response.choices[0].message.content
+    try:
+        candidates = json.loads(content).get("plans") or []
+    except (json.JSONDecodeError, AttributeError):
+        logger.info(f"Failed to decode JSON from LLM: {content}")
+        candidates = []
+
+    plans: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+    for plan in candidates[:count]:
+        if not isinstance(plan, dict) or "vibe" not in plan:
+            continue
+        sig_key = _route_signature_key(_extract_route_signature(plan))
+        if sig_key and sig_key in seen:
+            logger.info(f"Dropping plan '{plan['vibe']}' with repeated route signature: {sig_key}")
+            continue
+        seen.add(sig_key)
+        plans.append(plan)
+
+    # Fill the gaps one plan at a time, forbidding every accepted route
+    for i in range(len(plans), count):
+        logger.info(f"Falling back to a single-plan call for plan {i+1}/{count}")
+        plan = generate_single_trip_plan(
+            trip_yml,
+            [p["vibe"] for p in plans],
+            [s for s in (_extract_route_signature(p) for p in plans) if s],
+            DIVERSITY_DIRECTIVES[i % len(DIVERSITY_DIRECTIVES)],
+        )
+        if plan and "vibe" in plan:
+            plans.append(plan)
+        else:
+            logger.info(f"Warning: Failed to generate plan {i+1}")
+
+    return plans
+
+
+def generate_trip_plans(trip_yml: str, count: int = 3, mode: Optional[str] = None) -> List[Dict[str, Any]]:
+    mode = (mode or PLAN_GENERATION_MODE).lower()
+    if mode == "parallel":
+        return generate_trip_plans_parallel(trip_yml, count)
+    if mode == "single_call":
+        return generate_trip_plans_single_call(trip_yml, count)
+    return generate_trip_plans_from_text(trip_yml, count)
+
+
 def generate_trip_plans_from_text(trip_yml: str, count: int = 3) -> List[Dict[str, Any]]:
     """
     Generate 3 distinct trip plans (vibes) using separate LLM calls.
@@ -460,15 +622,9 @@ def generate_trip_plans_from_text(trip_yml: str, count: int = 3) -> List[Dict[st
     forbidden_route_signatures: List[List[str]] = []
     forbidden_keys: Set[str] = set()
 
-    diversity_directives = [
-        "Classic highlights route: iconic sights, balanced pacing.",
-        "Offbeat/hidden-gems route: prefer secondary cities and avoid the most standard tourist triangle.",
-        "Nature/coast/wellness route: prioritize scenic towns, beaches/lakes, hiking/spas, slower travel.",
-    ]
-
     for i in range(count):
         print(f"Generating plan {i+1}/{count}...")
-        directive = diversity_directives[i % len(diversity_directives)]
+        directive = DIVERSITY_DIRECTIVES[i % len(DIVERSITY_DIRECTIVES)]
         plan = generate_single_trip_plan(
             trip_yml,
             previous_vibes,
@@ -520,23 +676,8 @@ def calculate_modified_indices(original_plans: List[TripPlan], edited_plans: Lis
     return modified_indices
 
 
-def edit_trip_plans_with_llm(plans: List[TripPlan], user_text: str) -> List[TripPlan]:
-    """
-    Use LLM to apply changes to a list of TripPlans based on natural language instructions.
-    """
-    plans_json = json.dumps([p.model_dump() for p in plans], indent=2)
-    
-    prompt = f"""
-    You are an expert travel coordinator. 
-    You are given a list of travel plans in JSON format and specific instructions for editing them.
-    
-    Current Plans:
-    {plans_json}
-    
-    Instructions:
-    {user_text}
-    
-    Protocol for Actions:
+# Action format and editing rules shared by the plan editing prompts
+_PLAN_EDIT_RULES = """Protocol for Actions:
     1. FLIGHT: ["FLIGHT", origin_city, origin_country, origin_code, dest_city, dest_country, dest_code, date, return_date, passengers, cabin]
        - YOU MUST PROVIDE IATA CODES. If a city does not have an airport, find and use the nearest major hub airport code (e.g. NAP for Positano).
     2. STAY: ["STAY", city, country, start_date, end_date, guests, rooms, description]
@@ -557,22 +698,43 @@ def edit_trip_plans_with_llm(plans: List[TripPlan], user_text: str) -> List[Trip
     - CONTIGUITY: Stays and flights must remain contiguous. A check-out date for one city should generally match the check-in date for the next city and the flight date between them.
     - SPECIFICITY: Only modify the specific plan(s) mentioned (e.g., "first option"). Leave others UNCHANGED.
     - VIBE: You MAY change the "vibe" name if the user request implies a change in the overall theme, or if they explicitly ask for it.
-    - VISUAL INTEGRITY: Do not modify the JSON structure unless explicitly asked.
+    - VISUAL INTEGRITY: Do not modify the JSON structure unless explicitly asked."""
+
+
+def edit_trip_plans_with_llm(plans: List[TripPlan], user_text: str) -> List[TripPlan]:
+    """
+    Use LLM to apply changes to a list of TripPlans based on natural language instructions.
+    """
+    plans_json = json.dumps([p.model_dump() for p in plans], indent=2)
+    
+    prompt = f"""
+    You are an expert travel coordinator. 
+    You are given a list of travel plans in JSON format and specific instructions for editing them.
+    
+    Current Plans:
+    {plans_json}
+    
+    Instructions:
+    {user_text}
+    
+    {_PLAN_EDIT_RULES}
     
     Return the FULL updated list of plans in the specified output format.
     """
     
-    response = client.chat.completions.create(
-        model="sonar",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.0,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "schema": TripPlansResponse.model_json_schema()
+    with llm_clients.track(PERPLEXITY):
+        response = llm_clients.openai(PERPLEXITY).chat.completions.create(
+            model="sonar",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.0,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "schema": TripPlansResponse.model_json_schema()
+                }
             }
-        }
-    )
+        )
+    llm_clients.record_usage(PERPLEXITY, response)
     
     content = response.choices[0].message.content
     try:
@@ -585,17 +747,251 @@ def edit_trip_plans_with_llm(plans: List[TripPlan], user_text: str) -> List[Trip
         return []
 
 
+_ORDINAL_INDEX = {
+    "first": 0, "1st": 0, "second": 1, "2nd": 1, "third": 2, "3rd": 2,
+    "fourth": 3, "4th": 3, "fifth": 4, "5th": 4,
+}
+_PLAN_NOUN = r"(?:option|plan|trip|one|itinerary|vibe)s?"
+_ORDINAL_REF_RE = re.compile(rf"\b({'|'.join(_ORDINAL_INDEX)}|last)\s+{_PLAN_NOUN}\b", re.IGNORECASE)
+# "trip" is left out ("make the trip 2 days longer" names no plan), and a
+# number followed by a unit is a quantity, not a plan reference
+_NUMBERED_REF_RE = re.compile(
+    r"\b(?:option|plan|itinerary|vibe)\s*#?\s*(\d+)\b"
+    r"(?!\s*(?:day|night|week|month|hour|adult|child|kid|guest|room|star)s?\b)",
+    re.IGNORECASE,
+)
+_ALL_PLANS_RE = re.compile(
+    rf"\b(?:all|every|each|both)\b(?:\s+\w+)?\s+{_PLAN_NOUN}\b|\ball of them\b", re.IGNORECASE
+)
+
+
+def _match_target_plans(plans: List[TripPlan], user_text: str) -> Optional[List[int]]:
+    """
+    Resolve explicit references ("second option", "plan #3", "the Foodie
+    vibe", "all plans") locally. Returns None when the text names no plan.
+    """
+    if _ALL_PLANS_RE.search(user_text):
+        return list(range(len(plans)))
+
+    targets: Set[int] = set()
+    for match in _ORDINAL_REF_RE.finditer(user_text):
+        word = match.group(1).lower()
+        targets.add(len(plans) - 1 if word == "last" else _ORDINAL_INDEX[word])
+    for match in _NUMBERED_REF_RE.finditer(user_text):
+        targets.add(int(match.group(1)) - 1)
+
+    text = user_text.lower()
+    for i, plan in enumerate(plans):
+        vibe = plan.vibe.strip().lower()
+        if len(vibe) >= 4 and vibe in text:
+            targets.add(i)
+
+    targets = {i for i in targets if 0 <= i < len(plans)}
+    return sorted(targets) if targets else None
+
+
+def classify_target_plans(plans: List[TripPlan], user_text: str) -> List[int]:
+    """
+    Indices of the plans an edit instruction applies to. Explicit references
+    are matched locally; otherwise a small LLM call sees only each plan's
+    vibe and route. Any failure targets every plan.
+    """
+    every_plan = list(range(len(plans)))
+    if len(plans) <= 1:
+        return every_plan
+
+    targets = _match_target_plans(plans, user_text)
+    if targets is not None:
+        return targets
+
+    summaries = "\n".join(
+        f"    {i}: {plan.vibe} ({' > '.join(_extract_route_signature(plan.model_dump())) or 'no stays'})"
+        for i, plan in enumerate(plans)
+    )
+    prompt = f"""
+    You are given numbered travel plans (index: vibe (stay cities)) and an edit instruction.
+    Return the indices of the plans the instruction should change. If it applies to every plan or names none in particular, return all indices.
+
+    Plans:
+{summaries}
+
+    Instruction:
+    {user_text}
+    """
+
+    try:
+        with llm_clients.track(PERPLEXITY):
+            response = llm_clients.openai(PERPLEXITY).chat.completions.create(
+                model="sonar",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.0,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "schema": TargetPlansResponse.model_json_schema()
+                    }
+                }
+            )
+        llm_clients.record_usage(PERPLEXITY, response)
+        indices = TargetPlansResponse.model_validate_json(response.choices[0].message.content).indices
+    except Exception as e:
+        logger.info(f"Error classifying target plans: {str(e)}")
+        return every_plan
+
+    targets = sorted({i for i in indices if 0 <= i < len(plans)})
+    return targets or every_plan
+
+
+def apply_action_patches(actions: List[List[Any]], patches: List[ActionPatch]) -> List[List[Any]]:
+    """
+    Apply patches whose indices refer to the original actions list. Raises
+    ValueError on an unknown op, an out-of-range index or a missing action.
+    """
+    result = [list(action) for action in actions]
+    by_index: Dict[int, List[ActionPatch]] = {}
+    for patch in patches:
+        op = patch.op.lower()
+        limit = len(actions) if op == "insert" else len(actions) - 1
+        if op not in ("replace", "insert", "delete"):
+            raise ValueError(f"Unknown patch op: {patch.op}")
+        if not 0 <= patch.index <= limit:
+            raise ValueError(f"Patch index {patch.index} out of range for {len(actions)} actions")
+        if op != "delete" and not patch.action:
+            raise ValueError(f"Patch '{op}' at {patch.index} has no action")
+        by_index.setdefault(patch.index, []).append(patch)
+
+    # Back to front so earlier original indices stay valid
+    for index in sorted(by_index, reverse=True):
+        ops = by_index[index]
+        edits = [p for p in ops if p.op.lower() != "insert"]
+        if len(edits) > 1:
+            raise ValueError(f"Conflicting patches for action {index}")
+        if edits:
+            if edits[0].op.lower() == "delete":
+                del result[index]
+            else:
+                result[index] = list(edits[0].action)
+        # Inserts go before the original action, in the order given
+        for patch in reversed([p for p in ops if p.op.lower() == "insert"]):
+            result.insert(index, list(patch.action))
+
+    return result
+
+
+def edit_trip_plans_incremental(
+    plans: List[TripPlan], user_text: str
+) -> Optional[Tuple[List[TripPlan], Dict[int, TripRequest]]]:
+    """
+    Edit only the plans the instruction targets: they are sent as compact
+    JSON and the LLM returns patches over their actions, applied here.
+    Returns the full plan list and rebuilt TripRequests for the plans that
+    changed, or None when the patches can't be used (the caller falls back
+    to edit_trip_plans_with_llm).
+    """
+    targets = classify_target_plans(plans, user_text)
+    logger.info(f"Edit targets plans {targets} of {len(plans)}")
+
+    target_json = "\n".join(
+        json.dumps({"plan_index": i, **plans[i].model_dump()}, separators=(",", ":"))
+        for i in targets
+    )
+
+    prompt = f"""
+    You are an expert travel coordinator.
+    You are given travel plans in compact JSON (one per line) and specific instructions for editing them.
+    Do NOT return the plans. Return only the patches that turn each plan's "actions" list into the edited one.
+
+    Plans:
+    {target_json}
+
+    Instructions:
+    {user_text}
+
+    {_PLAN_EDIT_RULES}
+
+    Patch format:
+    - One entry per plan you change: {{"plan_index": <as given>, "vibe": <new name or null>, "patches": [...]}}. Omit plans that need no change.
+    - Each patch is {{"op": "replace" | "insert" | "delete", "index": <i>, "action": [...]}}.
+    - "index" always refers to the ORIGINAL actions list (0-based), before any patch is applied.
+    - "replace" swaps action i for "action"; "delete" removes action i ("action" is null); "insert" adds "action" before original action i (use the list length to append).
+    - Every changed field (dates, guests, codes) means a "replace" of the whole action.
+    """
+
+    try:
+        with llm_clients.track(PERPLEXITY):
+            response = llm_clients.openai(PERPLEXITY).chat.completions.create(
+                model="sonar",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.0,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {
+                        "schema": PlanPatchesResponse.model_json_schema()
+                    }
+                }
+            )
+        llm_clients.record_usage(PERPLEXITY, response)
+        plan_patches = PlanPatchesResponse.model_validate_json(response.choices[0].message.content).plans
+    except Exception as e:
+        logger.info(f"Error getting plan patches: {str(e)}")
+        return None
+
+    edited_plans = list(plans)
+    trip_requests: Dict[int, TripRequest] = {}
+    for plan_patch in plan_patches:
+        i = plan_patch.plan_index
+        if i not in targets:
+            logger.info(f"Ignoring patches for untargeted plan {i}")
+            continue
+        try:
+            actions = apply_action_patches(plans[i].actions, plan_patch.patches)
+            if not actions or any(not a or a[0] not in ("FLIGHT", "STAY") for a in actions):
+                raise ValueError("patched actions must be non-empty FLIGHT/STAY actions")
+            edited = TripPlan(vibe=plan_patch.vibe or plans[i].vibe, actions=actions)
+            if edited.model_dump() == plans[i].model_dump():
+                continue
+            trip_requests[i] = build_trip_request_from_instructions(edited.actions)
+        except Exception as e:
+            logger.info(f"Invalid patches for plan {i}: {str(e)}")
+            return None
+        edited_plans[i] = edited
+
+    return edited_plans, trip_requests
+
+
+def _build_trip_requests(plans: List[TripPlan], indices: List[int]) -> Dict[int, TripRequest]:
+    trip_requests: Dict[int, TripRequest] = {}
+    for i in indices:
+        try:
+            trip_requests[i] = build_trip_request_from_instructions(plans[i].actions)
+        except Exception as e:
+            logger.info(f"Error building trip request for plan {i}: {str(e)}")
+    return trip_requests
+
+
 # ==========================================
 # API ENDPOINT
 # ==========================================
 
+@app.get("/metrics/llm")
+def llm_metrics():
+    return llm_clients.snapshot()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await llm_clients.aclose()
+
+
 @app.post("/api/generate-plans", response_model=TripPlansResponse)
 def generate_plans(request: GeneratePlansRequest):
     if not request.trip_yml or request.trip_yml.strip() == "":
         raise HTTPException(status_code=400, detail="trip_yml cannot be empty")
+    if request.mode and request.mode.lower() not in PLAN_GENERATION_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of {', '.join(PLAN_GENERATION_MODES)}")
     
     try:
-        variations_data = generate_trip_plans_from_text(request.trip_yml)
+        variations_data = generate_trip_plans(request.trip_yml, mode=request.mode)
         
         plans = []
         if isinstance(variations_data, list):
@@ -628,18 +1024,33 @@ def build_trip_request(request: GenerateTripRequest):
 def edit_plans(request: EditTripPlansRequest):
     if not request.user_text or request.user_text.strip() == "":
         raise HTTPException(status_code=400, detail="user_text cannot be empty")
+    mode = (request.mode or PLAN_EDIT_MODE).lower()
+    if mode not in PLAN_EDIT_MODES:
+        raise HTTPException(status_code=400, detail=f"mode must be one of {', '.join(PLAN_EDIT_MODES)}")
     
     try:
-        edited_plans = edit_trip_plans_with_llm(request.plans, request.user_text)
-        
-        if not edited_plans:
-             raise HTTPException(status_code=500, detail="Failed to edit plans via LLM")
-             
-        modified_indices = calculate_modified_indices(request.plans, edited_plans)
+        result = None
+        if mode == "incremental" and request.plans:
+            result = edit_trip_plans_incremental(request.plans, request.user_text)
+            if result is None:
+                logger.info("Incremental edit failed, falling back to a full edit")
+
+        if result is not None:
+            edited_plans, trip_requests = result
+            modified_indices = sorted(trip_requests)
+        else:
+            edited_plans = edit_trip_plans_with_llm(request.plans, request.user_text)
+            
+            if not edited_plans:
+                 raise HTTPException(status_code=500, detail="Failed to edit plans via LLM")
+                 
+            modified_indices = calculate_modified_indices(request.plans, edited_plans)
+            trip_requests = _build_trip_requests(edited_plans, modified_indices)
         
         return EditTripPlansResponse(
             plans=edited_plans,
-            modified_indices=modified_indices
+            modified_indices=modified_indices,
+            trip_requests=trip_requests
         )
     except Exception as e:
         logger.info(f"Error: {str(e)}")
@@ -0,0 +1,74 @@
+"""
+Checks for plan generation and editing that don't need a live LLM.
+Run from the repository root: python -m pytest apps/json_agent/test_plans.py
+"""
+
+from fastapi.testclient import TestClient
+
+from apps.json_agent import main
+
+
+def _plan(vibe, *cities):
+    actions = [["FLIGHT", "Tel Aviv", "IL", "TLV", cities[0], "IT", "FCO", "2026-05-01", "", 2, "economy"]]
+    actions += [["STAY", city, "IT", "2026-05-01", "2026-05-04", 2, 1, ""] for city in cities]
+    return {"vibe": vibe, "actions": actions}
+
+
+def test_parallel_drops_duplicates_whose_retry_fails(monkeypatch):
+    first_round = {0: _plan("Classic", "Rome", "Florence"), 1: _plan("Again", "Rome", "Florence"), 2: _plan("Coast", "Naples")}
+    calls = []
+
+    def fake_generate(trip_yml, previous_vibes, forbidden_route_signatures, directive):
+        slot = next(i for i in range(3) if main._parallel_directive(i) == directive)
+        calls.append(slot)
+        if calls.count(slot) == 1:
+            return first_round[slot]
+        raise RuntimeError("provider error")
+
+    monkeypatch.setattr(main, "generate_single_trip_plan", fake_generate)
+    monkeypatch.setattr(main, "PLAN_REGENERATION_ROUNDS", 1)
+
+    plans = main.generate_trip_plans_parallel("trip", count=3)
+    assert [p["vibe"] for p in plans] == ["Classic", "Coast"]
+    assert sorted(calls) == [0, 1, 1, 2]
+
+
+def test_parallel_drops_duplicates_left_after_the_last_round(monkeypatch):
+    monkeypatch.setattr(main, "generate_single_trip_plan", lambda *args: _plan("Same", "Rome"))
+    monkeypatch.setattr(main, "PLAN_REGENERATION_ROUNDS", 2)
+    plans = main.generate_trip_plans_parallel("trip", count=3)
+    assert [p["vibe"] for p in plans] == ["Same"]
+
+
+def _trip_plans(*vibes):
+    return [main.TripPlan(**_plan(vibe, city)) for vibe, city in zip(vibes, ["Rome", "Naples", "Milan"])]
+
+
+def test_trip_quantities_are_not_plan_references():
+    plans = _trip_plans("Classic", "Coast", "Lakes")
+    assert main._match_target_plans(plans, "Make the trip 2 days longer") is None
+    assert main._match_target_plans(plans, "Push the trip 1 week later") is None
+    assert main._match_target_plans(plans, "Make option 2 3 nights longer") == [1]
+    assert main._match_target_plans(plans, "Swap the hotel in plan #3") == [2]
+
+
+def test_incremental_edit_falls_back_when_the_llm_fails(monkeypatch):
+    plans = _trip_plans("Classic", "Coast")
+    edited = [plans[0], main.TripPlan(vibe="Coast", actions=plans[1].actions[:1])]
+
+    def failing_client(provider):
+        raise RuntimeError("provider error")
+
+    monkeypatch.setattr(main.llm_clients, "openai", failing_client)
+    monkeypatch.setattr(main, "edit_trip_plans_with_llm", lambda plans, user_text: edited)
+
+    assert main.edit_trip_plans_incremental(plans, "Drop the stay in the second option") is None
+
+    response = TestClient(main.app).post("/api/edit-plans", json={
+        "plans": [p.model_dump() for p in plans],
+        "user_text": "Drop the stay in the second option",
+        "mode": "incremental",
+    })
+    assert response.status_code == 200
+    assert response.json()["modified_indices"] == [1]
+    assert response.json()["plans"][1]["actions"] == edited[1].actions
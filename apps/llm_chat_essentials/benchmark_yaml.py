@@ -0,0 +1,107 @@
+"""
+Compare YAML parse/dump time for intake state documents.
+
+Builds realistic intake documents from the V11 schema template (blank,
+essentials filled turn by turn, and a long conversation with preferences)
+and times, per document: PyYAML's pure-Python SafeLoader, libyaml's
+CSafeLoader (if available), and yaml_codec.load_yaml on a warm cache; then
+SafeDumper vs CSafeDumper for dumping.
+
+Examples:
+    python -m apps.llm_chat_essentials.benchmark_yaml
+    python -m apps.llm_chat_essentials.benchmark_yaml --repeat 500 --report yaml_bench.json
+"""
+
+import sys
+import os
+# Add the project root to sys.path so 'shared' can be imported without PYTHONPATH hacks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import json
+import timeit
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from apps.llm_chat_essentials.settings import YAML_TRIP_INTAKE_SCHEMA_V11
+from apps.llm_chat_essentials.fast_path import try_fast_update
+from apps.llm_chat_essentials.main import first_missing_essential
+from apps.llm_chat_essentials.state_patch import record_user_message
+from apps.llm_chat_essentials import yaml_codec
+
+TURNS = ["2 adults", "TLV", "2026-09-10 to 2026-09-17", "Rome"]
+CHATTY_TURNS = [
+    "We'd love somewhere with great food and not too many tourists",
+    "Budget is around 4000 USD total, hotels should be 4 stars or better",
+    "My partner doesn't eat pork, and we prefer walkable neighbourhoods",
+    "Can we add a couple of nights in Florence too?",
+    "Direct flights only please, morning departures if possible",
+]
+
+
+def _documents() -> Dict[str, str]:
+    template = yaml.safe_load(YAML_TRIP_INTAKE_SCHEMA_V11)
+    docs = {"blank": YAML_TRIP_INTAKE_SCHEMA_V11}
+
+    state = template
+    for message in TURNS:
+        state = try_fast_update(state, first_missing_essential(state), message, today=date(2026, 1, 1)) or state
+    docs["essentials_filled"] = yaml.safe_dump(state, sort_keys=False, allow_unicode=True)
+
+    for _ in range(4):
+        for message in CHATTY_TURNS:
+            record_user_message(state, message)
+            state["conversation"]["messages"].append({"role": "assistant", "content": f"Noted: {message.lower()}", "ts": None})
+    state["conversation"]["history"]["summary"] = " ".join(CHATTY_TURNS)
+    docs["long_conversation"] = yaml.safe_dump(state, sort_keys=False, allow_unicode=True)
+    return docs
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    """Best of 3 runs, in microseconds per call."""
+    return min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def run(repeat: int) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, text in _documents().items():
+        data = yaml.safe_load(text)
+        yaml_codec.load_yaml(text)  # warm the parse cache
+        stats: Dict[str, Any] = {"bytes": len(text.encode("utf-8"))}
+        stats["load_pure_us"] = _time(lambda: yaml.load(text, Loader=yaml.SafeLoader), repeat)
+        if yaml_codec.LIBYAML:
+            stats["load_libyaml_us"] = _time(lambda: yaml.load(text, Loader=yaml.CSafeLoader), repeat)
+        stats["load_cached_us"] = _time(lambda: yaml_codec.load_yaml(text), repeat)
+        stats["dump_pure_us"] = _time(lambda: yaml.dump(data, Dumper=yaml.SafeDumper, sort_keys=False), repeat)
+        if yaml_codec.LIBYAML:
+            stats["dump_libyaml_us"] = _time(lambda: yaml.dump(data, Dumper=yaml.CSafeDumper, sort_keys=False), repeat)
+        results[name] = stats
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Intake YAML parse/dump benchmark")
+    parser.add_argument("--repeat", type=int, default=200, help="Calls per timing run")
+    parser.add_argument("--report", help="Write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    if not yaml_codec.LIBYAML:
+        print("libyaml not available: only the pure-Python loader and the cache are measured")
+
+    results = run(args.repeat)
+    columns = ["load_pure_us", "load_libyaml_us", "load_cached_us", "dump_pure_us", "dump_libyaml_us"]
+    print(f"{'document':<18} {'bytes':>6}  " + "  ".join(f"{c[:-3]:>13}" for c in columns) + "   (µs/call)")
+    for name, stats in results.items():
+        cells = "  ".join(f"{stats[c]:13.1f}" if c in stats else f"{'-':>13}" for c in columns)
+        print(f"{name:<18} {stats['bytes']:6d}  {cells}")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+Rule-based extraction for the essential the intake conversation is asking about.
+
+Most intake turns answer the single question asked by
+get_single_missing_question ("2 adults", "TLV", "2026-09-10 to 2026-09-17").
+For those, the field reported by first_missing_essential is filled here and
+the LLM round-trip is skipped. Extraction only succeeds when the whole
+message is accounted for: anything left over besides filler words (another
+place, a preference, a correction) returns None and the caller falls back
+to the LLM update.
+"""
+
+import copy
+import json
+import re
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from apps.llm_chat_essentials.state_patch import record_user_message
+
+AIRPORTS_PATH = Path(__file__).resolve().parents[2] / "shared" / "metadata" / "airports.json"
+
+_NUMBER_WORDS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+}
+_NUMBER = rf"(\d{{1,2}}|{'|'.join(_NUMBER_WORDS)})"
+
+_ADULTS_RE = re.compile(rf"\b{_NUMBER}\s+(?:adults?|people|persons|travell?ers|guests|pax|of us)\b")
+_BARE_NUMBER_RE = re.compile(rf"^\s*{_NUMBER}\s*[.!]?\s*$")
+_SOLO_RE = re.compile(r"\b(?:just me|only me|solo|alone|by myself|myself)\b")
+_COUPLE_RE = re.compile(
+    r"\b(?:a couple|couple|me and my (?:wife|husband|partner|girlfriend|boyfriend)"
+    r"|my (?:wife|husband|partner|girlfriend|boyfriend) and (?:i|me))\b"
+)
+# Children need ages/rooms handled by the LLM
+_CHILDREN_RE = re.compile(r"\b(?:kids?|child|children|infants?|bab(?:y|ies)|toddlers?|son|daughter)\b")
+
+_IATA_RE = re.compile(r"\b[A-Z]{3}\b")
+_ISO_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_NIGHTS_RE = re.compile(rf"\b{_NUMBER}\s+nights?\b")
+
+_WORD_RE = re.compile(r"[a-z']+|\d+")
+
+_COMMON_FILLER = {
+    "i", "im", "i'm", "we", "we're", "were", "us", "our", "my", "will", "would", "be", "are", "am",
+    "is", "it", "its", "it's", "the", "a", "an", "just", "only", "please", "thanks", "thank", "you",
+    "ok", "okay", "yes", "yeah", "sure", "so", "total", "in",
+}
+_ADULT_FILLER = _COMMON_FILLER | {"traveling", "travelling", "going", "flying", "coming", "of", "and", "there"}
+_ORIGIN_FILLER = _COMMON_FILLER | {
+    "from", "flying", "fly", "departing", "depart", "leaving", "leave", "out", "of", "airport",
+    "city", "based", "live", "starting", "start",
+}
+_DESTINATION_FILLER = _COMMON_FILLER | {
+    "to", "go", "going", "visit", "visiting", "want", "wanna", "like", "i'd", "we'd", "love",
+    "travel", "trip", "fly", "flying", "destination", "head", "heading", "airport", "city",
+}
+_DATES_FILLER = _COMMON_FILLER | {
+    "from", "to", "until", "till", "through", "departing", "depart", "departure", "leaving", "leave",
+    "returning", "return", "back", "on", "and", "for", "fly", "flying", "out", "staying", "stay",
+}
+# Words that say which slot a lone date is for
+_DEPARTURE_WORDS = {"from", "departing", "depart", "departure", "leaving", "leave", "out"}
+_RETURN_WORDS = {"to", "until", "till", "through", "returning", "return", "back"}
+
+
+def _load_airports() -> Tuple[Dict[str, Dict[str, str]], Dict[str, List[Dict[str, str]]]]:
+    try:
+        items = json.loads(AIRPORTS_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        items = []
+
+    by_iata: Dict[str, Dict[str, str]] = {}
+    by_city: Dict[str, List[Dict[str, str]]] = {}
+    for item in items:
+        if isinstance(item, dict) and item.get("iata"):
+            by_iata[item["iata"].upper()] = item
+            by_city.setdefault(str(item.get("city") or "").lower(), []).append(item)
+    by_city.pop("", None)
+    return by_iata, by_city
+
+
+AIRPORTS_BY_IATA, AIRPORTS_BY_CITY = _load_airports()
+# Longest first so "san francisco" wins over a shorter city inside it
+_CITY_RE = re.compile(
+    r"\b(" + "|".join(re.escape(c) for c in sorted(AIRPORTS_BY_CITY, key=len, reverse=True)) + r")\b"
+) if AIRPORTS_BY_CITY else None
+
+
+def _number(token: str) -> int:
+    return int(token) if token.isdigit() else _NUMBER_WORDS[token]
+
+
+def _only_filler(text: str, filler: set) -> bool:
+    return all(word in filler for word in _WORD_RE.findall(text))
+
+
+def _remove_spans(text: str, spans: List[Tuple[int, int]]) -> str:
+    for start, end in sorted(spans, reverse=True):
+        text = text[:start] + " " + text[end:]
+    return text
+
+
+def _essentials(state: Dict[str, Any]) -> Dict[str, Any]:
+    trip = state.setdefault("trip", {})
+    if not isinstance(trip, dict):
+        trip = state["trip"] = {}
+    essentials = trip.setdefault("essentials", {})
+    if not isinstance(essentials, dict):
+        essentials = trip["essentials"] = {}
+    return essentials
+
+
+def _section(essentials: Dict[str, Any], key: str) -> Dict[str, Any]:
+    value = essentials.get(key)
+    if not isinstance(value, dict):
+        value = essentials[key] = {}
+    return value
+
+
+def extract_adults(message: str) -> Optional[int]:
+    text = message.lower()
+    if _CHILDREN_RE.search(text):
+        return None
+
+    matches = [(m, _number(m.group(1))) for m in _ADULTS_RE.finditer(text)]
+    if not matches:
+        bare = _BARE_NUMBER_RE.match(text)
+        if bare:
+            matches = [(bare, _number(bare.group(1)))]
+        else:
+            matches = [(m, 1) for m in _SOLO_RE.finditer(text)] + [(m, 2) for m in _COUPLE_RE.finditer(text)]
+
+    if len(matches) != 1:
+        return None
+    match, adults = matches[0]
+    if not 1 <= adults <= 10:
+        return None
+    if not _only_filler(_remove_spans(text, [match.span()]), _ADULT_FILLER):
+        return None
+    return adults
+
+
+def _airport_place(airport: Dict[str, str]) -> Dict[str, Optional[str]]:
+    return {"iata": airport["iata"], "city": airport.get("city"), "countryCode": airport.get("countryCode")}
+
+
+def extract_place(message: str, filler: set) -> Optional[Dict[str, Optional[str]]]:
+    """A single known airport code or airport city, as {iata, city, countryCode}."""
+    # A lone code may be typed in lower case; inside a sentence only upper case counts
+    lone_code = message.strip().upper()
+    if lone_code in AIRPORTS_BY_IATA:
+        return _airport_place(AIRPORTS_BY_IATA[lone_code])
+
+    iata_matches = [m for m in _IATA_RE.finditer(message) if m.group(0) in AIRPORTS_BY_IATA]
+    text = message.lower()
+    city_matches = list(_CITY_RE.finditer(text)) if _CITY_RE else []
+    if len(iata_matches) + len(city_matches) != 1:
+        return None
+
+    spans = [m.span() for m in iata_matches + city_matches]
+    if not _only_filler(_remove_spans(text, spans), filler):
+        return None
+
+    if iata_matches:
+        return _airport_place(AIRPORTS_BY_IATA[iata_matches[0].group(0)])
+
+    # A city name alone doesn't say which airport; the IATA code is left for later steps
+    airports = AIRPORTS_BY_CITY[city_matches[0].group(1)]
+    countries = {a.get("countryCode") for a in airports}
+    return {
+        "iata": None,
+        "city": airports[0].get("city"),
+        "countryCode": countries.pop() if len(countries) == 1 else None,
+    }
+
+
+def _as_date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _lone_date_slot(text: str, existing: Dict[str, Any]) -> Optional[str]:
+    """
+    "departureDate" or "returnDate" for a message carrying one date, from
+    its wording or, failing that, from which slot is still empty. None when
+    it's unclear, so the LLM reads the turn.
+    """
+    words = set(re.findall(r"[a-z]+", text))
+    says_departure, says_return = bool(words & _DEPARTURE_WORDS), bool(words & _RETURN_WORDS)
+    if says_departure != says_return:
+        return "departureDate" if says_departure else "returnDate"
+    if says_departure:
+        return None
+    if not existing.get("departureDate"):
+        return "departureDate"
+    if not existing.get("returnDate"):
+        return "returnDate"
+    return None
+
+
+def extract_dates(message: str, existing: Dict[str, Any], today: date) -> Optional[Dict[str, Any]]:
+    text = message.lower()
+    spans: List[Tuple[int, int]] = []
+    dates: List[date] = []
+    for m in _ISO_DATE_RE.finditer(text):
+        try:
+            dates.append(date.fromisoformat(m.group(1)))
+        except ValueError:
+            return None
+        spans.append(m.span())
+    nights_matches = list(_NIGHTS_RE.finditer(text))
+    spans += [m.span() for m in nights_matches]
+
+    if len(dates) > 2 or len(nights_matches) > 1 or not (dates or nights_matches):
+        return None
+    if not _only_filler(_remove_spans(text, spans), _DATES_FILLER):
+        return None
+
+    update: Dict[str, Any] = {}
+    if len(dates) == 2:
+        if nights_matches or not dates[0] < dates[1]:
+            return None
+        update = {"departureDate": dates[0], "returnDate": dates[1]}
+    elif len(dates) == 1:
+        slot = _lone_date_slot(text, existing)
+        if slot is None:
+            return None
+        update = {slot: dates[0]}
+    if nights_matches:
+        nights = _number(nights_matches[0].group(1))
+        if not 0 < nights <= 90:
+            return None
+        update["nights"] = nights
+
+    departure = _as_date(update.get("departureDate") or existing.get("departureDate"))
+    returning = _as_date(update.get("returnDate") or existing.get("returnDate"))
+    if departure and returning and not departure < returning:
+        return None
+    if "departureDate" not in update and not existing.get("departureDate"):
+        # Nights alone can't satisfy the dates essential yet; let the LLM ask around it
+        return None
+    if update.get("departureDate") and update["departureDate"] < today:
+        return None
+    return update
+
+
+def try_fast_update(
+    state: Dict[str, Any],
+    missing: Optional[str],
+    message: str,
+    today: Optional[date] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Return a copy of `state` with the `missing` essential filled from
+    `message`, or None when the message isn't a confident, complete answer.
+    """
+    if not missing or not message or not message.strip():
+        return None
+    message = message.strip()
+    today = today or date.today()
+
+    updated = copy.deepcopy(state)
+    essentials = _essentials(updated)
+
+    if missing == "travelers.adults":
+        adults = extract_adults(message)
+        if adults is None:
+            return None
+        _section(essentials, "travelers")["adults"] = adults
+
+    elif missing == "origin.(iata|city)":
+        place = extract_place(message, _ORIGIN_FILLER)
+        if place is None:
+            return None
+        _section(essentials, "origin").update(place)
+
+    elif missing == "destinations.(iata|city|region)":
+        place = extract_place(message, _DESTINATION_FILLER)
+        if place is None:
+            return None
+        essentials.pop("destination", None)
+        essentials["destinations"] = [{"kind": "airport_or_city_or_region", **place, "region": None}]
+
+    elif missing.startswith("dates."):
+        dates = _section(essentials, "dates")
+        update = extract_dates(message, dates, today)
+        if update is None:
+            return None
+        dates.update(update)
+
+    else:
+        return None
+
+    record_user_message(updated, message)
+    return updated
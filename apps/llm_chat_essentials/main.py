@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import os
+import queue
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-import yaml
 import uvicorn
-import requests
 from dotenv import load_dotenv
 from datetime import date, datetime
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 import logging
 import time
@@ -21,10 +22,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 from shared.data_types.llm_models import *
+from shared.llm_clients import llm_clients, PERPLEXITY
+from shared.countries import normalize_country_to_iso2
+from shared.serialization import dumps
 from apps.llm_chat_essentials.settings import (
     YAML_TRIP_INTAKE_SCHEMA_V11,
     YAML_UPDATE_SYSTEM_INSTRUCTIONS,
+    STATE_PATCH_SYSTEM_INSTRUCTIONS,
 )
+from apps.llm_chat_essentials.fast_path import try_fast_update
+from apps.llm_chat_essentials.state_patch import StatePatch, apply_patch, record_user_message
+from apps.llm_chat_essentials.session_store import session_store
+from apps.llm_chat_essentials.yaml_codec import dump_yaml, load_yaml
 
 load_dotenv()
 app = FastAPI(title="LLM Chat Essentials Service")
@@ -33,6 +42,26 @@ PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
 if not PERPLEXITY_API_KEY:
     logger.info("WARNING: PERPLEXITY_API_KEY not found in environment.")
 
+# Opt-in: fill the essential being asked about without an LLM call when the answer is unambiguous
+ESSENTIALS_FAST_PATH = os.getenv("ESSENTIALS_FAST_PATH", "0") == "1"
+# "full" (LLM rewrites the whole YAML, the default) or "patch" (opt-in: LLM
+# returns changed paths only)
+YAML_UPDATE_MODE = os.getenv("YAML_UPDATE_MODE", "full")
+# Question for the next missing essential returned by update_trip_yaml:
+# "off" (client calls get_single_missing_question), "template" (fallback
+# question, no LLM call) or "speculative" (LLM question generated alongside
+# the update for the essential predicted to be missing next)
+NEXT_QUESTION_MODES = ("off", "template", "speculative")
+NEXT_QUESTION_MODE = os.getenv("NEXT_QUESTION_MODE", "off")
+_question_executor = ThreadPoolExecutor(max_workers=int(os.getenv("QUESTION_WORKERS", "8")))
+# Runs the work behind the SSE endpoints; separate from _question_executor so a
+# stream waiting on a speculative question can't starve it
+_stream_executor = ThreadPoolExecutor(max_workers=int(os.getenv("STREAM_WORKERS", "16")))
+
+# Called with each text delta as a streamed LLM response arrives, and with
+# None when the deltas so far are void because another attempt follows
+TokenCallback = Callable[[Optional[str]], None]
+
 
 # -------------------------
 # Output cleaning
@@ -92,11 +121,11 @@ def validate_yaml_root_mapping(yaml_text: str) -> Dict[str, Any]:
         return "\n".join(fixed_lines).strip()
 
     try:
-        data = yaml.safe_load(yaml_text)
+        data = load_yaml(yaml_text)
     except Exception:
         try:
             repaired = _cleanup_common_llm_yaml_issues(yaml_text)
-            data = yaml.safe_load(repaired)
+            data = load_yaml(repaired)
         except Exception as e:
             raise ValueError(f"Invalid YAML returned by LLM: {e}") from e
 
@@ -126,36 +155,51 @@ def call_llm(
     model: str = "sonar",
     max_tokens: int = 1000,
     system_message: Optional[str] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+    on_token: Optional[TokenCallback] = None,
 ) -> str:
-    if not PERPLEXITY_API_KEY:
-        raise ValueError("Set PERPLEXITY_API_KEY environment variable")
-
-    url = "https://api.perplexity.ai/chat/completions"
+    """
+    Returns the full response text. With `on_token` the response is streamed
+    and each delta is passed to it as it arrives.
+    """
+    # Shared pooled client: keep-alive connections instead of a new TLS handshake per call
+    client = llm_clients.openai(PERPLEXITY)
 
     messages = []
     if system_message:
         messages.append({"role": "system", "content": system_message})
     messages.append({"role": "user", "content": prompt})
 
-    payload = {
+    kwargs = {
         "model": model,
         "messages": messages,
         "max_tokens": max_tokens,
         "temperature": 0.2,
     }
+    if response_format:
+        kwargs["response_format"] = response_format
 
-    headers = {
-        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    resp = requests.post(url, headers=headers, json=payload, timeout=60)
-    resp.raise_for_status()
+    with llm_clients.track(PERPLEXITY):
+        if on_token is None:
+            resp = client.chat.completions.create(**kwargs)
+            text = resp.choices[0].message.content
+        else:
+            resp = None
+            parts: List[str] = []
+            for chunk in client.chat.completions.create(**kwargs, stream=True):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    on_token(parts[-1])
+                if getattr(chunk, "usage", None):
+                    resp = chunk
+            text = "".join(parts)
+    if resp is not None:
+        llm_clients.record_usage(PERPLEXITY, resp)
 
-    data = resp.json()
-    text = data["choices"][0]["message"]["content"]
     logger.info(f"LLM RESPONSE: {text}")
     return text
+
+
 # -------------------------
 # Update state (YAML)
 # -------------------------
@@ -179,13 +223,97 @@ def build_yaml_update_prompt(
     )
 
 
-def _update_trip_yaml_state(
+def dump_trip_state(state: Dict[str, Any]) -> str:
+    return dump_yaml(state, sort_keys=False, allow_unicode=True)
+
+
+def _load_trip_state(current_yaml_state: Optional[str], schema_template_yaml: str) -> Dict[str, Any]:
+    current = (current_yaml_state or "").strip() or schema_template_yaml.strip()
+    return validate_yaml_root_mapping(extract_yaml_text(current))
+
+
+def _patch_trip_state(
+    raw_user_message: str,
+    state: Dict[str, Any],
+    *,
+    max_tokens: int = 600,
+    on_token: Optional[TokenCallback] = None,
+) -> Optional[Dict[str, Any]]:
+    """Apply an LLM-produced path/value patch to `state`; None if the patch is unusable."""
+    # The message log is maintained locally and doesn't help the model
+    prompt_state = dict(state)
+    if isinstance(state.get("conversation"), dict):
+        prompt_state["conversation"] = {k: v for k, v in state["conversation"].items() if k != "messages"}
+
+    prompt = build_yaml_update_prompt(
+        raw_user_message=raw_user_message,
+        current_yaml_state=dump_trip_state(prompt_state),
+    )
+    result = call_llm(
+        prompt,
+        max_tokens=max_tokens,
+        system_message=STATE_PATCH_SYSTEM_INSTRUCTIONS,
+        response_format={
+            "type": "json_schema",
+            "json_schema": {"schema": StatePatch.model_json_schema()},
+        },
+        on_token=on_token,
+    )
+
+    try:
+        patch = StatePatch.model_validate_json(extract_yaml_text(result))
+        updated = apply_patch(state, patch)
+    except ValueError as e:
+        logger.info(f"Unusable state patch, falling back to a full YAML update: {e}")
+        return None
+
+    record_user_message(updated, raw_user_message)
+    return updated
+
+
+def _update_trip_state(
     raw_user_message: str,
     current_yaml_state: Optional[str],
     *,
+    state: Optional[Dict[str, Any]] = None,
     schema_template_yaml: str = YAML_TRIP_INTAKE_SCHEMA_V11,
     max_tokens: int = 2200,
-) -> str:
+    on_token: Optional[TokenCallback] = None,
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Returns (state, yaml_text). An already parsed `state` (from a session)
+    takes precedence over current_yaml_state. yaml_text is None when the
+    state was updated locally (fast path or patch) and has not been
+    serialized yet; callers that need YAML use dump_trip_state.
+    """
+    if state is not None:
+        current_yaml_state = None
+    elif ESSENTIALS_FAST_PATH or YAML_UPDATE_MODE == "patch":
+        try:
+            state = _load_trip_state(current_yaml_state, schema_template_yaml)
+        except ValueError:
+            state = None
+
+    if state is not None:
+
+        if ESSENTIALS_FAST_PATH:
+            missing = first_missing_essential(state)
+            updated = try_fast_update(state, missing, raw_user_message)
+            if updated is not None:
+                logger.info(f"Fast path filled {missing} without an LLM call")
+                return updated, None
+
+        if YAML_UPDATE_MODE == "patch":
+            updated = _patch_trip_state(raw_user_message, state, on_token=on_token)
+            if updated is not None:
+                return updated, None
+            if on_token is not None:
+                # The full-YAML update below streams its own response
+                on_token(None)
+
+        if current_yaml_state is None:
+            current_yaml_state = dump_trip_state(state)
+
     prompt = build_yaml_update_prompt(
         raw_user_message=raw_user_message,
         current_yaml_state=current_yaml_state,
@@ -195,12 +323,28 @@ def _update_trip_yaml_state(
     result = call_llm(
         prompt,
         max_tokens=max_tokens,
-        system_message=YAML_UPDATE_SYSTEM_INSTRUCTIONS
+        system_message=YAML_UPDATE_SYSTEM_INSTRUCTIONS,
+        on_token=on_token,
     )
 
     yaml_text = extract_yaml_text(result)
-    validate_yaml_root_mapping(yaml_text)
-    return yaml_text
+    return validate_yaml_root_mapping(yaml_text), yaml_text
+
+
+def _update_trip_yaml_state(
+    raw_user_message: str,
+    current_yaml_state: Optional[str],
+    *,
+    schema_template_yaml: str = YAML_TRIP_INTAKE_SCHEMA_V11,
+    max_tokens: int = 2200,
+) -> str:
+    state, yaml_text = _update_trip_state(
+        raw_user_message,
+        current_yaml_state,
+        schema_template_yaml=schema_template_yaml,
+        max_tokens=max_tokens,
+    )
+    return yaml_text if yaml_text is not None else dump_trip_state(state)
 
 
 # -------------------------
@@ -234,6 +378,10 @@ def _is_date_like(x: Any) -> bool:
     # PyYAML often parses YYYY-MM-DD into datetime.date automatically
     return isinstance(x, (date, datetime)) or _has_text(x)
 
+def _country_code(x: Any) -> Any:
+    # The LLM sometimes writes country names ("Italy") or ISO-3 codes here
+    return normalize_country_to_iso2(x) if _has_text(x) else x
+
 def _to_int(x: Any) -> Optional[int]:
     if isinstance(x, int):
         return x
@@ -340,7 +488,7 @@ def summarize_known_essentials(d: Dict[str, Any]) -> Dict[str, Any]:
             "iata": dd.get("iata"),
             "city": dd.get("city"),
             "region": dd.get("region"),
-            "countryCode": dd.get("countryCode"),
+            "countryCode": _country_code(dd.get("countryCode")),
         }
         for dd in dests[:3]  # cap to avoid token bloat
         if isinstance(dd, dict)
@@ -352,7 +500,7 @@ def summarize_known_essentials(d: Dict[str, Any]) -> Dict[str, Any]:
         "origin": {
             "iata": origin.get("iata"),
             "city": origin.get("city"),
-            "countryCode": origin.get("countryCode"),
+            "countryCode": _country_code(origin.get("countryCode")),
         },
         "destinations": destinations_summary,
         "dates": {
@@ -401,36 +549,104 @@ def build_single_missing_question_prompt(missing_field: str, known: Dict[str, An
     )
 
 
-def _get_single_missing_question(
-    yaml_state: str,
-) -> FillResponse:
-    yaml_state_clean = extract_yaml_text(yaml_state)
-    decoded = validate_yaml_root_mapping(yaml_state_clean)
+MISSING_FIELD_FALLBACK_QUESTIONS: Dict[str, str] = {
+    "travelers.adults": "How many adults are traveling?",
+    "origin.(iata|city)": "What city or airport are you departing from?",
+    "dates.(departureDate+returnDate OR departureDate+nights)": "What are your travel dates (departure and return), or your departure date and number of nights?",
+    "destinations.(iata|city|region)": "Where would you like to go (city, airport, or region)? You can name more than one destination.",
+}
+DEFAULT_FALLBACK_QUESTION = "What detail is missing so I can continue?"
 
-    missing = first_missing_essential(decoded)
-    if not missing:
-        return FillResponse(yaml=yaml_state_clean, status=FillStatus.ready, message=None)
 
-    known = summarize_known_essentials(decoded)
+def fallback_question(missing_field: str) -> str:
+    return MISSING_FIELD_FALLBACK_QUESTIONS.get(missing_field, DEFAULT_FALLBACK_QUESTION)
+
+
+def _ask_for_missing(missing: str, known: Dict[str, Any], on_token: Optional[TokenCallback] = None) -> str:
     prompt = build_single_missing_question_prompt(missing, known)
 
     raw = call_llm(
         prompt,
         max_tokens=1000,
-        system_message=QUESTION_SYSTEM_MESSAGE
+        system_message=QUESTION_SYSTEM_MESSAGE,
+        on_token=on_token,
     )
 
     question = sanitize_question(extract_yaml_text(raw))
-    if not question:
-        fallback = {
-            "travelers.adults": "How many adults are traveling?",
-            "origin.(iata|city)": "What city or airport are you departing from?",
-            "dates.(departureDate+returnDate OR departureDate+nights)": "What are your travel dates (departure and return), or your departure date and number of nights?",
-            "destinations.(iata|city|region)": "Where would you like to go (city, airport, or region)? You can name more than one destination.",
-        }
+    return question or fallback_question(missing)
+
+
+def _missing_question(
+    state: Dict[str, Any],
+    on_token: Optional[TokenCallback] = None,
+) -> Tuple[Optional[str], Optional[str]]:
+    """(first missing essential, question asking for it), or (None, None) when ready."""
+    missing = first_missing_essential(state)
+    if not missing:
+        return None, None
+    return missing, _ask_for_missing(missing, summarize_known_essentials(state), on_token)
+
+
+# Stand-in answers used to predict which essential will be missing once the
+# current one is answered (only first_missing_essential ever sees them)
+_PLACEHOLDER_ANSWERS: Dict[str, Tuple[str, Any]] = {
+    "travelers.adults": ("travelers", {"adults": 1}),
+    "origin.(iata|city)": ("origin", {"city": "?"}),
+    "dates.(departureDate+returnDate OR departureDate+nights)": ("dates", {"departureDate": "?", "nights": 1}),
+    "destinations.(iata|city|region)": ("destinations", [{"city": "?"}]),
+}
+
+
+def predict_next_missing(state: Dict[str, Any], missing: str) -> Optional[str]:
+    """The essential that will be missing after the user answers `missing`."""
+    if missing not in _PLACEHOLDER_ANSWERS:
+        return None
+    key, value = _PLACEHOLDER_ANSWERS[missing]
+    essentials = dict(_as_dict(_as_dict(state.get("trip")).get("essentials")))
+    essentials[key] = value
+    return first_missing_essential({"trip": {"essentials": essentials}})
+
+
+def _start_speculative_question(state: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Optional[Future]]:
+    """
+    Start generating the question for the essential that should be missing
+    after this turn, so it runs alongside the state update. Returns
+    (predicted field, future) or (None, None) when nothing is predicted.
+    """
+    if state is None:
+        return None, None
+    missing = first_missing_essential(state)
+    predicted = predict_next_missing(state, missing) if missing else None
+    if not predicted:
+        return None, None
+    return predicted, _question_executor.submit(_ask_for_missing, predicted, summarize_known_essentials(state))
+
+
+def _next_question(
+    mode: str,
+    missing: Optional[str],
+    predicted: Optional[str] = None,
+    speculative: Optional[Future] = None,
+) -> Optional[str]:
+    if not missing or mode == "off":
+        return None
+    if speculative is not None and predicted == missing:
+        try:
+            return speculative.result()
+        except Exception as e:
+            logger.info(f"Speculative question failed, using fallback: {e}")
+    # Prediction missed (or template mode): don't pay for a second serial LLM call
+    return fallback_question(missing)
 
-        question = fallback.get(missing, "What detail is missing so I can continue?")
 
+def _get_single_missing_question(
+    yaml_state: str,
+    on_token: Optional[TokenCallback] = None,
+) -> FillResponse:
+    yaml_state_clean = extract_yaml_text(yaml_state)
+    decoded = validate_yaml_root_mapping(yaml_state_clean)
+
+    missing, question = _missing_question(decoded, on_token)
     return FillResponse(
         yaml=yaml_state_clean,
         status=FillStatus.needs_more_info if missing else FillStatus.ready,
@@ -438,11 +654,27 @@ def _get_single_missing_question(
     )
 
 
+def _response_yaml(request: UpdateTripRequest, state: Dict[str, Any], yaml_text: Optional[str] = None) -> str:
+    if not request.include_yaml:
+        return ""
+    return yaml_text if yaml_text is not None else dump_trip_state(state)
+
+
 @app.get("/health")
 def health_check():
     return {"status": "ok", "service": "llm_chat_essentials"}
 
 
+@app.get("/metrics/llm")
+def llm_metrics():
+    return llm_clients.snapshot()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await llm_clients.aclose()
+
+
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     start_time = time.time()
@@ -452,28 +684,170 @@ async def log_requests(request: Request, call_next):
     return response
 
 
-@app.post("/api/get_single_missing_question", response_model=FillResponse)
-def get_single_missing_question(request: UpdateTripRequest) -> FillResponse:
-    return _get_single_missing_question(
-        yaml_state=request.current_yaml_state,
+def _session_state(request: UpdateTripRequest) -> Optional[Dict[str, Any]]:
+    """
+    The stored state of request.session_id, or None when the request starts
+    it (new_session, or a current_yaml_state to start from). A session that
+    is gone otherwise is a 404 rather than a silent restart from the blank
+    template, which would lose the conversation.
+    """
+    if not request.session_id:
+        return None
+    state = session_store.get(request.session_id)
+    if state is None and not request.new_session and not request.current_yaml_state:
+        raise HTTPException(status_code=404, detail="Unknown or expired session")
+    return state
+
+
+def _single_missing_question(request: UpdateTripRequest, on_token: Optional[TokenCallback] = None) -> FillResponse:
+    if not request.session_id:
+        return _get_single_missing_question(
+            yaml_state=request.current_yaml_state,
+            on_token=on_token,
+        )
+
+    state = _session_state(request)
+    if state is None:
+        state = _load_trip_state(request.current_yaml_state, YAML_TRIP_INTAKE_SCHEMA_V11)
+        session_store.set(request.session_id, state)
+
+    missing, question = _missing_question(state, on_token)
+    return FillResponse(
+        yaml=_response_yaml(request, state),
+        status=FillStatus.needs_more_info if missing else FillStatus.ready,
+        message=question,
+        session_id=request.session_id,
     )
 
 
-@app.post("/api/update_trip_yaml", response_model=FillResponse)
-def update_trip_yaml_state(request: UpdateTripRequest) -> FillResponse:
-    result = _update_trip_yaml_state(
+def _next_question_mode(request: UpdateTripRequest) -> str:
+    mode = request.next_question or NEXT_QUESTION_MODE
+    if mode not in NEXT_QUESTION_MODES:
+        raise HTTPException(status_code=400, detail=f"next_question must be one of {NEXT_QUESTION_MODES}")
+    return mode
+
+
+def _updated_trip(request: UpdateTripRequest, mode: str, on_token: Optional[TokenCallback] = None) -> FillResponse:
+    session_state = _session_state(request)
+    current_yaml_state = request.current_yaml_state or None
+
+    predicted, speculative = None, None
+    if mode == "speculative":
+        if session_state is None:
+            try:
+                session_state = _load_trip_state(current_yaml_state, YAML_TRIP_INTAKE_SCHEMA_V11)
+            except ValueError:
+                pass
+        predicted, speculative = _start_speculative_question(session_state)
+
+    state, yaml_text = _update_trip_state(
         raw_user_message=request.raw_user_message,
-        current_yaml_state=request.current_yaml_state or None,
+        current_yaml_state=current_yaml_state,
+        state=session_state,
+        on_token=on_token,
     )
+    if request.session_id:
+        session_store.set(request.session_id, state)
 
-    decoded = validate_yaml_root_mapping(result)
-    missing = first_missing_essential(decoded)
+    missing = first_missing_essential(state)
     return FillResponse(
-        yaml=result,
+        yaml=_response_yaml(request, state, yaml_text),
         status=FillStatus.needs_more_info if missing else FillStatus.ready,
+        message=_next_question(mode, missing, predicted, speculative),
+        session_id=request.session_id,
+    )
+
+
+_STREAM_DONE = object()
+
+
+def _sse_event(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+def _stream_fill_response(work: Callable[[TokenCallback], FillResponse]) -> StreamingResponse:
+    """
+    Server-sent events for `work`: a "token" event ({"text": ...}) per LLM
+    delta as it arrives, then a "result" event carrying the FillResponse, or
+    an "error" event ({"detail": ...}) if it failed. A "reset" event ({})
+    means the tokens so far belonged to a failed attempt (an unusable state
+    patch) and should be discarded; the retry's tokens follow.
+    """
+    tokens: queue.Queue = queue.Queue()
+
+    def run() -> FillResponse:
+        try:
+            return work(tokens.put)
+        finally:
+            tokens.put(_STREAM_DONE)
+
+    result = _stream_executor.submit(run)
+
+    def events() -> Iterator[bytes]:
+        while (token := tokens.get()) is not _STREAM_DONE:
+            if token is None:
+                yield _sse_event("reset", {})
+            else:
+                yield _sse_event("token", {"text": token})
+        try:
+            yield _sse_event("result", result.result().model_dump(mode="json"))
+        except HTTPException as e:
+            yield _sse_event("error", {"detail": e.detail})
+        except Exception as e:
+            logger.exception("Streamed request failed")
+            yield _sse_event("error", {"detail": str(e)})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/api/get_single_missing_question", response_model=FillResponse)
+def get_single_missing_question(request: UpdateTripRequest) -> FillResponse:
+    return _single_missing_question(request)
+
+
+@app.post("/api/get_single_missing_question/stream")
+def stream_single_missing_question(request: UpdateTripRequest) -> StreamingResponse:
+    """SSE: the question's tokens as they are generated, then the FillResponse."""
+    return _stream_fill_response(lambda on_token: _single_missing_question(request, on_token))
+
+
+@app.post("/api/update_trip_yaml", response_model=FillResponse)
+def update_trip_yaml_state(request: UpdateTripRequest) -> FillResponse:
+    return _updated_trip(request, _next_question_mode(request))
+
+
+@app.post("/api/update_trip_yaml/stream")
+def stream_update_trip_yaml_state(request: UpdateTripRequest) -> StreamingResponse:
+    """
+    SSE: the model's raw update output as it is generated (nothing when the
+    fast path applies), then the FillResponse.
+    """
+    mode = _next_question_mode(request)
+    return _stream_fill_response(lambda on_token: _updated_trip(request, mode, on_token))
+
+
+@app.get("/api/sessions/{session_id}/yaml", response_model=FillResponse)
+def get_session_yaml(session_id: str) -> FillResponse:
+    state = session_store.get(session_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired session")
+    return FillResponse(
+        yaml=dump_trip_state(state),
+        status=FillStatus.needs_more_info if first_missing_essential(state) else FillStatus.ready,
         message=None,
+        session_id=session_id,
     )
 
 
+@app.delete("/api/sessions/{session_id}")
+def delete_session(session_id: str):
+    session_store.delete(session_id)
+    return {"deleted": session_id}
+
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
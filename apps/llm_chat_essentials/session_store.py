@@ -0,0 +1,125 @@
+"""
+Per-session trip-intake state.
+
+Requests that carry a session_id don't need to ship the YAML state: the
+parsed state dict is kept here between turns. It is stored as YAML text,
+the format it was parsed from, so values such as dates read back with the
+same types a single request sees (JSON would turn them into strings).
+Sessions expire after SESSION_IDLE_TTL_SECONDS without a read or write.
+
+Redis (REDIS_URL) is used when configured so every worker sees the same
+sessions; otherwise a per-process TTL cache is used. If Redis can't be
+reached, the TTL cache stands in until REDIS_RETRY_SECONDS have passed, then
+Redis is tried again.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import redis
+from cachetools import TTLCache
+from dotenv import load_dotenv
+
+from apps.llm_chat_essentials.yaml_codec import dump_yaml, load_yaml
+
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL")
+SESSION_IDLE_TTL_SECONDS = int(os.getenv("SESSION_IDLE_TTL_SECONDS", str(2 * 3600)))
+SESSION_MEMORY_MAX_SESSIONS = int(os.getenv("SESSION_MEMORY_MAX_SESSIONS", "10000"))
+REDIS_RETRY_SECONDS = float(os.getenv("SESSION_REDIS_RETRY_SECONDS", "30"))
+
+KEY_PREFIX = "trip_intake:session:v1"
+
+
+class SessionStore:
+    def __init__(
+        self,
+        redis_url: Optional[str] = REDIS_URL,
+        idle_ttl: int = SESSION_IDLE_TTL_SECONDS,
+        max_sessions: int = SESSION_MEMORY_MAX_SESSIONS,
+        retry_seconds: float = REDIS_RETRY_SECONDS,
+    ):
+        self.idle_ttl = idle_ttl
+        self.retry_seconds = retry_seconds
+        self._redis = redis.Redis.from_url(redis_url) if redis_url else None
+        self._redis_retry_at = 0.0
+        self._memory: TTLCache = TTLCache(maxsize=max_sessions, ttl=idle_ttl)
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> str:
+        return "redis" if self._active_redis() is not None else "memory"
+
+    def _active_redis(self) -> Optional[redis.Redis]:
+        """The Redis client, unless it failed less than retry_seconds ago."""
+        if self._redis is None or time.monotonic() < self._redis_retry_at:
+            return None
+        return self._redis
+
+    def _key(self, session_id: str) -> str:
+        return f"{KEY_PREFIX}:{session_id}"
+
+    @staticmethod
+    def _dumps(state: Dict[str, Any]) -> str:
+        return dump_yaml(state, sort_keys=False, allow_unicode=True)
+
+    @staticmethod
+    def _loads(raw: Any) -> Dict[str, Any]:
+        # States written as JSON by earlier versions are valid YAML too
+        return load_yaml(raw.decode() if isinstance(raw, bytes) else raw)
+
+    def _redis_failed(self, e: Exception):
+        logger.info(f"Session store Redis error, using in-memory sessions for {self.retry_seconds}s: {e}")
+        self._redis_retry_at = time.monotonic() + self.retry_seconds
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """The session's state, refreshing its idle timeout, or None."""
+        client = self._active_redis()
+        if client is not None:
+            try:
+                raw = client.getex(self._key(session_id), ex=self.idle_ttl)
+                if raw:
+                    return self._loads(raw)
+                # Sessions started while Redis was unreachable live in memory
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            raw = self._memory.get(session_id)
+            if raw is not None:
+                # TTLCache expires by insertion time; re-inserting makes it idle time
+                self._memory[session_id] = raw
+        return self._loads(raw) if raw is not None else None
+
+    def set(self, session_id: str, state: Dict[str, Any]):
+        raw = self._dumps(state)
+        client = self._active_redis()
+        if client is not None:
+            try:
+                client.set(self._key(session_id), raw, ex=self.idle_ttl)
+                return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            self._memory[session_id] = raw
+
+    def delete(self, session_id: str):
+        client = self._active_redis()
+        if client is not None:
+            try:
+                client.delete(self._key(session_id))
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+        with self._lock:
+            self._memory.pop(session_id, None)
+
+
+session_store = SessionStore()
@@ -113,22 +113,8 @@ trip:
       readyForNextModule: false
     blockingMissing: []
 """
-YAML_UPDATE_SYSTEM_INSTRUCTIONS = """\
-You update a trip-intake state stored as YAML.
-
-OUTPUT
-- Return ONE valid YAML document only. No prose, no markdown fences, no comments.
-- Start the YAML with: meta:
-
-HOW TO UPDATE
-- You will receive:
-  1) CURRENT STATE YAML
-  2) NEW USER MESSAGE
-- Update the YAML to reflect the NEW USER MESSAGE.
-- If the user changes/corrects something, overwrite it (latest wins).
-- If the user doesn’t mention something, keep the existing value if present.
-- Don’t delete filled values unless the user clearly removes them.
-
+# Update semantics shared by the full-YAML and patch prompts
+STATE_UPDATE_RULES = """\
 DESTINATIONS (MULTI)
 - Store destinations in: trip.essentials.destinations (a YAML list).
 - If user gives one destination -> list with 1 item.
@@ -153,7 +139,25 @@ INFERENCE (LIGHT)
   city, countryCode, region, iata (only if explicitly given or very confident).
 - Dates: if user gives specific dates, use YYYY-MM-DD. If flexible, don’t invent exact dates.
 - Travelers: “couple” -> adults=2, etc.
+"""
 
+YAML_UPDATE_SYSTEM_INSTRUCTIONS = """\
+You update a trip-intake state stored as YAML.
+
+OUTPUT
+- Return ONE valid YAML document only. No prose, no markdown fences, no comments.
+- Start the YAML with: meta:
+
+HOW TO UPDATE
+- You will receive:
+  1) CURRENT STATE YAML
+  2) NEW USER MESSAGE
+- Update the YAML to reflect the NEW USER MESSAGE.
+- If the user changes/corrects something, overwrite it (latest wins).
+- If the user doesn’t mention something, keep the existing value if present.
+- Don’t delete filled values unless the user clearly removes them.
+
+""" + STATE_UPDATE_RULES + """
 HISTORY (LIGHT)
 - Set conversation.rawPrompt to the new user message.
 - Append the new message to conversation.history.lastUserPrompts (keep last 5).
@@ -164,3 +168,26 @@ HISTORY (LIGHT)
 
 Remember: output YAML only.
 """
+
+STATE_PATCH_SYSTEM_INSTRUCTIONS = """\
+You update a trip-intake state. The state is shown as YAML, but you do NOT return it.
+
+OUTPUT
+- Return ONLY a JSON object: {"updates": [{"path": "<dotted.path>", "value": <new value>}, ...]}
+- One entry per field that changes. Leave out everything that stays the same.
+- Paths are dotted keys from the state, e.g. trip.essentials.travelers.adults or trip.essentials.dates.departureDate.
+- To change a list (destinations, notes, labels), set the whole list at its path, e.g.
+  {"path": "trip.essentials.destinations", "value": [{"kind": "airport_or_city_or_region", "iata": null, "city": "Rome", "countryCode": "IT", "region": null}]}
+- Use null to clear a value. Never invent new keys.
+- Don't touch conversation.* — the message history is recorded for you.
+- If the message changes nothing, return {"updates": []}.
+
+HOW TO UPDATE
+- You will receive:
+  1) CURRENT STATE YAML
+  2) NEW USER MESSAGE
+- Emit the updates that make the state reflect the NEW USER MESSAGE.
+- If the user changes/corrects something, overwrite it (latest wins).
+- Don’t clear filled values unless the user clearly removes them.
+
+""" + STATE_UPDATE_RULES
@@ -0,0 +1,151 @@
+"""
+Path -> value patches over the trip-intake state.
+
+In patch mode the LLM returns only the fields a message changes, e.g.
+{"updates": [{"path": "trip.essentials.travelers.adults", "value": 2}]},
+instead of re-emitting the whole YAML document. Every path is checked
+against the schema template (YAML_TRIP_INTAKE_SCHEMA_V11) before the patch
+is applied to the parsed state, so a bad patch is rejected as a whole.
+"""
+
+import copy
+import re
+from datetime import date
+from typing import Any, Dict, List
+
+import yaml
+from pydantic import BaseModel
+
+from apps.llm_chat_essentials.settings import YAML_TRIP_INTAKE_SCHEMA_V11
+
+_SCALARS = (str, int, float, bool, type(None))
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_DATE_KEYS = {"departureDate", "returnDate"}
+# Maintained locally by record_user_message
+_RESERVED_ROOTS = {"conversation"}
+
+
+class PathUpdate(BaseModel):
+    path: str
+    value: Any = None
+
+
+class StatePatch(BaseModel):
+    updates: List[PathUpdate] = []
+
+
+class InvalidPatch(ValueError):
+    pass
+
+
+TEMPLATE: Dict[str, Any] = yaml.safe_load(YAML_TRIP_INTAKE_SCHEMA_V11)
+
+
+def _check_value(template: Any, value: Any, path: str):
+    if isinstance(template, dict):
+        if not isinstance(value, dict):
+            raise InvalidPatch(f"{path} must be an object")
+        for key, item in value.items():
+            if key not in template:
+                raise InvalidPatch(f"Unknown field {path}.{key}")
+            _check_value(template[key], item, f"{path}.{key}")
+    elif isinstance(template, list):
+        if not isinstance(value, list):
+            raise InvalidPatch(f"{path} must be a list")
+        if template:
+            for item in value:
+                _check_value(template[0], item, f"{path}[]")
+        elif not all(isinstance(item, _SCALARS + (dict,)) for item in value):
+            raise InvalidPatch(f"{path} items must be scalars or objects")
+    elif not isinstance(value, _SCALARS):
+        raise InvalidPatch(f"{path} must be a scalar")
+
+
+def _template_at(segments: List[str]) -> Any:
+    node: Any = TEMPLATE
+    for i, segment in enumerate(segments):
+        if isinstance(node, dict) and segment in node:
+            node = node[segment]
+        elif isinstance(node, list) and segment.isdigit():
+            node = node[0] if node else None
+        else:
+            raise InvalidPatch(f"Unknown path {'.'.join(segments[:i + 1])}")
+    return node
+
+
+def validate_patch(patch: StatePatch):
+    """Raise InvalidPatch unless every update targets a template path with a matching shape."""
+    for update in patch.updates:
+        segments = [s for s in update.path.strip().split(".") if s]
+        if not segments or segments[0] in _RESERVED_ROOTS:
+            raise InvalidPatch(f"Path not allowed: {update.path!r}")
+        template = _template_at(segments)
+        if template is not None:
+            _check_value(template, update.value, update.path)
+        elif not isinstance(update.value, _SCALARS + (dict, list)):
+            raise InvalidPatch(f"{update.path} has an unsupported value")
+
+
+def _coerce(key: str, value: Any) -> Any:
+    # Keep dates as dates, like PyYAML produces for the LLM-written document
+    if key in _DATE_KEYS and isinstance(value, str) and _ISO_DATE_RE.match(value):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+def apply_patch(state: Dict[str, Any], patch: StatePatch) -> Dict[str, Any]:
+    """Validate `patch` and return a patched copy of `state`."""
+    validate_patch(patch)
+    updated = copy.deepcopy(state)
+
+    for update in patch.updates:
+        segments = [s for s in update.path.strip().split(".") if s]
+        node: Any = updated
+        for segment, next_segment in zip(segments, segments[1:]):
+            if isinstance(node, list):
+                index = int(segment)
+                if index > len(node):
+                    raise InvalidPatch(f"{update.path}: index {index} out of range")
+                if index == len(node):
+                    node.append({})
+                node = node[index]
+                continue
+            child = node.get(segment)
+            if not isinstance(child, (dict, list)):
+                child = node[segment] = [] if next_segment.isdigit() else {}
+            node = child
+
+        last = segments[-1]
+        if isinstance(node, list):
+            index = int(last)
+            if index > len(node):
+                raise InvalidPatch(f"{update.path}: index {index} out of range")
+            if index == len(node):
+                node.append(None)
+            node[index] = update.value
+        else:
+            node[last] = _coerce(last, update.value)
+
+    return updated
+
+
+def record_user_message(state: Dict[str, Any], message: str):
+    """Conversation bookkeeping the full-YAML update prompt asks the LLM for, done locally."""
+    conversation = state.get("conversation")
+    if not isinstance(conversation, dict):
+        conversation = state["conversation"] = {}
+    conversation["rawPrompt"] = message
+
+    history = conversation.get("history")
+    if not isinstance(history, dict):
+        history = conversation["history"] = {}
+    prompts = history.get("lastUserPrompts")
+    prompts = prompts if isinstance(prompts, list) else []
+    history["lastUserPrompts"] = (prompts + [message])[-5:]
+
+    messages = conversation.get("messages")
+    messages = messages if isinstance(messages, list) else []
+    conversation["messages"] = messages + [{"role": "user", "content": message, "ts": None}]
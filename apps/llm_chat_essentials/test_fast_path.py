@@ -0,0 +1,88 @@
+"""
+Checks for the rule-based essentials extractor.
+Run from the repository root: python -m pytest apps/llm_chat_essentials/test_fast_path.py
+"""
+
+from datetime import date
+
+import yaml
+
+from apps.llm_chat_essentials.fast_path import try_fast_update
+from apps.llm_chat_essentials.settings import YAML_TRIP_INTAKE_SCHEMA_V11
+
+TODAY = date(2026, 6, 1)
+
+
+def _state():
+    return yaml.safe_load(YAML_TRIP_INTAKE_SCHEMA_V11)
+
+
+def _essentials(state):
+    return state["trip"]["essentials"]
+
+
+def test_adult_count_answers_are_extracted():
+    for message, adults in [("2 adults", 2), ("two of us", 2), ("just me", 1), ("3", 3), ("me and my wife", 2)]:
+        updated = try_fast_update(_state(), "travelers.adults", message, TODAY)
+        assert _essentials(updated)["travelers"]["adults"] == adults, message
+
+
+def test_messages_with_extra_details_fall_back():
+    assert try_fast_update(_state(), "travelers.adults", "2 adults and a kid", TODAY) is None
+    assert try_fast_update(_state(), "travelers.adults", "2 adults, we love food", TODAY) is None
+    assert try_fast_update(_state(), "origin.(iata|city)", "from TLV or Haifa", TODAY) is None
+    assert try_fast_update(_state(), "destinations.(iata|city|region)", "Paris and Rome", TODAY) is None
+
+
+def test_known_airport_codes_and_cities():
+    updated = try_fast_update(_state(), "origin.(iata|city)", "flying from TLV", TODAY)
+    assert _essentials(updated)["origin"] == {
+        "kind": "airport_or_city", "iata": "TLV", "city": "Tel Aviv", "countryCode": "IL",
+    }
+    assert try_fast_update(_state(), "origin.(iata|city)", "XYZ", TODAY) is None
+
+    updated = try_fast_update(_state(), "destinations.(iata|city|region)", "London", TODAY)
+    destination = _essentials(updated)["destinations"]
+    assert destination == [{
+        "kind": "airport_or_city_or_region", "iata": None, "city": "London", "countryCode": "GB", "region": None,
+    }]
+
+
+def test_dates():
+    updated = try_fast_update(_state(), "dates.(x)", "2026-09-10 to 2026-09-17", TODAY)
+    dates = _essentials(updated)["dates"]
+    assert (dates["departureDate"], dates["returnDate"]) == (date(2026, 9, 10), date(2026, 9, 17))
+
+    updated = try_fast_update(_state(), "dates.(x)", "leaving 2026-09-10 for 5 nights", TODAY)
+    assert _essentials(updated)["dates"]["nights"] == 5
+
+    assert try_fast_update(_state(), "dates.(x)", "2026-09-17 to 2026-09-10", TODAY) is None
+    assert try_fast_update(_state(), "dates.(x)", "2026-01-10 to 2026-01-17", TODAY) is None
+    assert try_fast_update(_state(), "dates.(x)", "sometime in September", TODAY) is None
+
+
+def test_lone_dates_across_turns():
+    first = try_fast_update(_state(), "dates.(x)", "2026-09-10", TODAY)
+    assert _essentials(first)["dates"]["departureDate"] == date(2026, 9, 10)
+
+    second = try_fast_update(first, "dates.(x)", "returning 2026-09-17", TODAY)
+    dates = _essentials(second)["dates"]
+    assert (dates["departureDate"], dates["returnDate"]) == (date(2026, 9, 10), date(2026, 9, 17))
+
+    # Departure already known: a bare date is the return
+    second = try_fast_update(first, "dates.(x)", "2026-09-17", TODAY)
+    assert _essentials(second)["dates"]["returnDate"] == date(2026, 9, 17)
+
+    # A return before the departure, or a return with no departure yet, goes to the LLM
+    assert try_fast_update(first, "dates.(x)", "back 2026-09-01", TODAY) is None
+    assert try_fast_update(_state(), "dates.(x)", "returning 2026-09-17", TODAY) is None
+    # Both slots filled and no wording to say which one changes
+    assert try_fast_update(second, "dates.(x)", "2026-09-20", TODAY) is None
+
+
+def test_conversation_history_is_recorded_without_mutating_input():
+    state = _state()
+    updated = try_fast_update(state, "travelers.adults", "2 adults", TODAY)
+    assert updated["conversation"]["rawPrompt"] == "2 adults"
+    assert updated["conversation"]["history"]["lastUserPrompts"] == ["2 adults"]
+    assert state["trip"]["essentials"]["travelers"]["adults"] is None
@@ -0,0 +1,111 @@
+"""
+Checks for the session store: Redis fallback, stored types and unknown sessions.
+Run from the repository root: python -m pytest apps/llm_chat_essentials/test_session_store.py
+"""
+
+from datetime import date
+
+import redis
+import yaml
+from fastapi.testclient import TestClient
+
+from apps.llm_chat_essentials import main, session_store as session_store_module
+from apps.llm_chat_essentials.session_store import SessionStore
+from apps.llm_chat_essentials.settings import YAML_TRIP_INTAKE_SCHEMA_V11
+
+
+class FlakyRedis:
+    """Stands in for redis.Redis: a dict that raises while `down` is set."""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+        self.calls = 0
+
+    def _call(self):
+        self.calls += 1
+        if self.down:
+            raise redis.ConnectionError("connection refused")
+
+    def getex(self, key, ex=None):
+        self._call()
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self._call()
+        # Like redis-py without decode_responses: stored as bytes
+        self.data[key] = value.encode() if isinstance(value, str) else value
+
+    def delete(self, key):
+        self._call()
+        self.data.pop(key, None)
+
+
+def _store(monkeypatch, retry_seconds=30.0):
+    clock = [1000.0]
+    monkeypatch.setattr(session_store_module.time, "monotonic", lambda: clock[0])
+    store = SessionStore(redis_url=None, retry_seconds=retry_seconds)
+    store._redis = FlakyRedis()
+    return store, store._redis, clock
+
+
+def test_redis_outage_falls_back_then_retries(monkeypatch):
+    store, client, clock = _store(monkeypatch)
+    store.set("a", {"turn": 1})
+    assert store.backend == "redis" and store.get("a") == {"turn": 1}
+
+    client.down = True
+    store.set("b", {"turn": 1})
+    assert store.backend == "memory"
+    calls = client.calls
+    assert store.get("b") == {"turn": 1}
+    assert client.calls == calls  # no Redis round trip while backing off
+
+    client.down = False
+    clock[0] += 31
+    assert store.backend == "redis"
+    assert store.get("a") == {"turn": 1}
+    # Sessions started during the outage are still found
+    assert store.get("b") == {"turn": 1}
+
+    store.delete("b")
+    assert store.get("b") is None
+
+
+def test_failed_read_is_retried_after_backoff(monkeypatch):
+    store, client, clock = _store(monkeypatch, retry_seconds=5)
+    store.set("a", {"turn": 2})
+    client.down = True
+    assert store.get("a") is None
+    client.down = False
+    assert store.get("a") is None  # still backing off
+    clock[0] += 5
+    assert store.get("a") == {"turn": 2}
+
+
+def test_dates_keep_their_type(monkeypatch):
+    state = yaml.safe_load(YAML_TRIP_INTAKE_SCHEMA_V11)
+    state["trip"]["essentials"]["dates"]["departureDate"] = date(2026, 9, 10)
+    state["trip"]["essentials"]["destinations"] = [{"city": "Zürich", "countryCode": "CH"}]
+
+    store, client, _ = _store(monkeypatch)
+    memory = SessionStore(redis_url=None)
+    for backend in (store, memory):
+        backend.set("a", state)
+        assert backend.get("a") == state
+    assert isinstance(store.get("a")["trip"]["essentials"]["dates"]["departureDate"], date)
+
+    # Sessions written as JSON before still load
+    client.data[store._key("old")] = b'{"trip":{"essentials":{"dates":{"departureDate":"2026-09-10"}}}}'
+    assert store.get("old")["trip"]["essentials"]["dates"]["departureDate"] == "2026-09-10"
+
+
+def test_unknown_session_without_state_is_404(monkeypatch):
+    monkeypatch.setattr(main, "session_store", SessionStore(redis_url=None))
+    client = TestClient(main.app)
+    body = {"raw_user_message": "2 adults", "session_id": "gone"}
+
+    for path in ("/api/update_trip_yaml", "/api/get_single_missing_question"):
+        response = client.post(path, json=body)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Unknown or expired session"
@@ -0,0 +1,82 @@
+"""
+Checks for path/value state patches.
+Run from the repository root: python -m pytest apps/llm_chat_essentials/test_state_patch.py
+"""
+
+import json
+from datetime import date
+
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+from apps.llm_chat_essentials import main
+from apps.llm_chat_essentials.settings import YAML_TRIP_INTAKE_SCHEMA_V11
+from apps.llm_chat_essentials.state_patch import InvalidPatch, StatePatch, apply_patch
+
+
+def _state():
+    return yaml.safe_load(YAML_TRIP_INTAKE_SCHEMA_V11)
+
+
+def _patch(*updates):
+    return StatePatch(updates=[{"path": path, "value": value} for path, value in updates])
+
+
+def test_scalar_list_and_indexed_updates():
+    state = _state()
+    updated = apply_patch(state, _patch(
+        ("trip.essentials.travelers.adults", 2),
+        ("trip.essentials.dates.departureDate", "2026-09-10"),
+        ("trip.essentials.destinations.0.city", "Rome"),
+        ("trip.essentials.destinations.1", {"city": "Florence", "countryCode": "IT"}),
+        ("trip.classification.specialNotes", ["auto-selected"]),
+    ))
+    essentials = updated["trip"]["essentials"]
+    assert essentials["travelers"]["adults"] == 2
+    assert essentials["dates"]["departureDate"] == date(2026, 9, 10)
+    assert [d["city"] for d in essentials["destinations"]] == ["Rome", "Florence"]
+    assert updated["trip"]["classification"]["specialNotes"] == ["auto-selected"]
+    # The input state is left untouched
+    assert state["trip"]["essentials"]["travelers"]["adults"] is None
+
+
+@pytest.mark.parametrize("path, value", [
+    ("trip.essentials.unknown", 1),
+    ("conversation.rawPrompt", "hi"),
+    ("trip.essentials.travelers", 2),
+    ("trip.essentials.destinations", [{"town": "Rome"}]),
+    ("trip.essentials.destinations.5.city", "Rome"),
+])
+def test_invalid_updates_reject_the_whole_patch(path, value):
+    with pytest.raises(InvalidPatch):
+        apply_patch(_state(), _patch(("trip.essentials.travelers.adults", 2), (path, value)))
+
+
+def test_stream_resets_before_the_full_yaml_fallback(monkeypatch):
+    full_yaml = YAML_TRIP_INTAKE_SCHEMA_V11.replace("adults: null", "adults: 2", 1)
+    assert full_yaml != YAML_TRIP_INTAKE_SCHEMA_V11
+    replies = iter([["{\"updates\": ", "oops"], [full_yaml]])
+
+    def fake_call_llm(prompt, *, on_token=None, **kwargs):
+        parts = next(replies)
+        for part in parts:
+            on_token(part)
+        return "".join(parts)
+
+    monkeypatch.setattr(main, "call_llm", fake_call_llm)
+    monkeypatch.setattr(main, "YAML_UPDATE_MODE", "patch")
+    monkeypatch.setattr(main, "ESSENTIALS_FAST_PATH", False)
+
+    response = TestClient(main.app).post("/api/update_trip_yaml/stream", json={
+        "raw_user_message": "2 adults",
+        "current_yaml_state": YAML_TRIP_INTAKE_SCHEMA_V11,
+        "next_question": "off",
+    })
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        event, data = block.split("\n", 1)
+        events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    assert [event for event, _ in events] == ["token", "token", "reset", "token", "result"]
+    assert events[3][1] == {"text": full_yaml}
+    assert yaml.safe_load(events[-1][1]["yaml"])["trip"]["essentials"]["travelers"]["adults"] == 2
@@ -0,0 +1,32 @@
+"""
+Checks for the cached YAML loader.
+Run from the repository root: python -m pytest apps/llm_chat_essentials/test_yaml_codec.py
+"""
+
+import pytest
+import yaml
+
+from apps.llm_chat_essentials.settings import YAML_TRIP_INTAKE_SCHEMA_V11
+from apps.llm_chat_essentials.yaml_codec import dump_yaml, load_yaml
+
+
+def test_matches_safe_load_and_returns_copies():
+    first = load_yaml(YAML_TRIP_INTAKE_SCHEMA_V11)
+    assert first == yaml.safe_load(YAML_TRIP_INTAKE_SCHEMA_V11)
+
+    first["trip"]["essentials"]["travelers"]["adults"] = 2
+    second = load_yaml(YAML_TRIP_INTAKE_SCHEMA_V11)
+    assert second["trip"]["essentials"]["travelers"]["adults"] is None
+
+
+def test_dump_round_trips_dates_and_unicode():
+    state = {"trip": {"dates": {"departureDate": yaml.safe_load("2026-09-10")}, "city": "Zürich"}}
+    text = dump_yaml(state, sort_keys=False, allow_unicode=True)
+    assert "Zürich" in text
+    assert load_yaml(text) == state
+
+
+def test_invalid_yaml_raises_every_time():
+    for _ in range(2):
+        with pytest.raises(yaml.YAMLError):
+            load_yaml("a: [1, 2")
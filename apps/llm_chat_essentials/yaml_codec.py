@@ -0,0 +1,55 @@
+"""
+YAML parsing and dumping for the intake state.
+
+Uses libyaml's CSafeLoader / CSafeDumper when PyYAML was built with it (pure
+Python SafeLoader / SafeDumper otherwise). Parse results are memoized by
+content hash: clients send back the YAML they were given on the previous
+turn, and the same text is often parsed more than once per request.
+"""
+
+import copy
+import hashlib
+import os
+import threading
+from typing import Any
+
+import yaml
+from cachetools import LRUCache
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+LIBYAML = SafeLoader is not yaml.SafeLoader
+
+YAML_PARSE_CACHE_SIZE = int(os.getenv("YAML_PARSE_CACHE_SIZE", "256"))
+
+_parse_cache: LRUCache = LRUCache(maxsize=YAML_PARSE_CACHE_SIZE)
+_parse_cache_lock = threading.Lock()
+
+
+def _content_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def load_yaml(text: str) -> Any:
+    """
+    yaml.safe_load equivalent. Results are cached and a deep copy is
+    returned, so callers may mutate what they get. Errors are not cached.
+    """
+    key = _content_key(text)
+    with _parse_cache_lock:
+        cached = _parse_cache.get(key, _parse_cache)
+    if cached is _parse_cache:
+        cached = yaml.load(text, Loader=SafeLoader)
+        with _parse_cache_lock:
+            _parse_cache[key] = cached
+    return copy.deepcopy(cached)
+
+
+def dump_yaml(data: Any, **kwargs: Any) -> str:
+    """yaml.safe_dump equivalent."""
+    return yaml.dump(data, Dumper=SafeDumper, **kwargs)
+
+
+def clear_parse_cache():
+    with _parse_cache_lock:
+        _parse_cache.clear()
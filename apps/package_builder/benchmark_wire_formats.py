@@ -0,0 +1,98 @@
+"""
+Compare JSON and protobuf as the wire format for search results and packages.
+
+For a flight section, a stay section and a full trip (synthetic options from
+`large_scale_test`, 1000 per section by default) reports the payload size
+and the time to encode a model and to decode bytes back into it, for:
+    json       orjson dumps / Pydantic model_validate_json
+    protobuf   shared.protobuf_codec encode / decode (via the *_pb2 messages)
+plus decoding to plain dicts (what the trusted package builder consumes).
+
+Examples:
+    python -m apps.package_builder.benchmark_wire_formats
+    python -m apps.package_builder.benchmark_wire_formats --options 5000 --report wire.json
+"""
+
+import sys
+import os
+# Add the project root to sys.path so 'shared' can be imported without PYTHONPATH hacks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import json
+import random
+from typing import Any, Dict, List, Optional
+
+import orjson
+from pydantic import BaseModel
+
+from shared import serialization
+from shared import protobuf_codec
+from shared.data_types.models import FlightSearchResponse, HotelSearchResponse, TripResponse
+from apps.package_builder.benchmarks import measure
+from apps.package_builder.large_scale_test import PayloadShape, build_trip_response, generate_flights, generate_hotels
+
+SEED = 1234
+REPEAT = 10
+
+
+def _payloads(options: int) -> Dict[str, BaseModel]:
+    random.seed(SEED)
+    return {
+        "flight_section": FlightSearchResponse(options=generate_flights(options, "entry")),
+        "stay_section": HotelSearchResponse(options=generate_hotels(options, "London")),
+        "trip": build_trip_response(PayloadShape(stays=1, options_per_section=options, activities_per_stay=options // 10)),
+    }
+
+
+def _ms(stats: Dict[str, float]) -> float:
+    return stats["median"] * 1000
+
+
+def run(options: int, repeat: int) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, model in _payloads(options).items():
+        model_cls = type(model)
+        message_cls = protobuf_codec.message_for(model_cls)
+        json_bytes = serialization.dumps(model)
+        proto_bytes = protobuf_codec.encode(model)
+
+        results[name] = {
+            "json_bytes": len(json_bytes),
+            "protobuf_bytes": len(proto_bytes),
+            "json_encode_ms": _ms(measure(serialization.dumps, lambda: model, repeat)),
+            "protobuf_encode_ms": _ms(measure(protobuf_codec.encode, lambda: model, repeat)),
+            "json_decode_ms": _ms(measure(model_cls.model_validate_json, lambda: json_bytes, repeat)),
+            "protobuf_decode_ms": _ms(measure(lambda b: protobuf_codec.decode(b, model_cls), lambda: proto_bytes, repeat)),
+            "json_decode_dict_ms": _ms(measure(orjson.loads, lambda: json_bytes, repeat)),
+            "protobuf_decode_dict_ms": _ms(measure(lambda b: protobuf_codec.decode_dict(b, message_cls), lambda: proto_bytes, repeat)),
+            "protobuf_parse_only_ms": _ms(measure(message_cls.FromString, lambda: proto_bytes, repeat)),
+        }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="JSON vs protobuf wire format benchmark")
+    parser.add_argument("--options", type=int, default=1000, help="Options per section")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="Timed runs per case")
+    parser.add_argument("--report", help="Write results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args.options, args.repeat)
+    for name, stats in results.items():
+        print(f"{name}  ({args.options} options per section)")
+        print(f"  size        json={stats['json_bytes']:>10,d} B   protobuf={stats['protobuf_bytes']:>10,d} B  "
+              f"({stats['protobuf_bytes'] / stats['json_bytes']:.0%})")
+        print(f"  encode      json={stats['json_encode_ms']:10.2f} ms  protobuf={stats['protobuf_encode_ms']:10.2f} ms")
+        print(f"  to model    json={stats['json_decode_ms']:10.2f} ms  protobuf={stats['protobuf_decode_ms']:10.2f} ms")
+        print(f"  to dict     json={stats['json_decode_dict_ms']:10.2f} ms  protobuf={stats['protobuf_decode_dict_ms']:10.2f} ms  "
+              f"(FromString alone {stats['protobuf_parse_only_ms']:.2f} ms)")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,358 @@
+"""
+Micro-benchmarks for the package_builder hot paths.
+
+Times `build_package`, the flight/hotel scorers, `get_flight_time` and
+`TripResponse` validation/serialization (stdlib json vs orjson) on synthetic inputs from
+`large_scale_test` at several option counts. The suite runs `--runs` times
+and keeps each case's lowest median, which filters out most scheduler noise.
+
+Results can be saved as a baseline and later runs compared against it; a
+case regresses when its median grows by more than the threshold and by more
+than `--noise-ms`. Timings are machine specific, so no baseline is checked
+in (benchmark_baseline.json is gitignored): save one on the machine you
+compare on, e.g. in CI by running `--save` on the base commit and
+`--compare` on the change, in the same job.
+
+`--views N` instead compares, per option kind, the time and tracemalloc
+peak of materializing and selecting from N full models versus score views.
+
+Examples:
+    python -m apps.package_builder.benchmarks
+    python -m apps.package_builder.benchmarks --save
+    python -m apps.package_builder.benchmarks --compare --threshold 15 --runs 5
+    python -m apps.package_builder.benchmarks --views 10000
+"""
+
+import sys
+import os
+# Add the project root to sys.path so 'shared' can be imported without PYTHONPATH hacks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import gc
+import json
+import orjson
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from shared import serialization
+from shared.data_types.models import ActivityOption, FlightOption, HotelOption, TripResponse
+from apps.package_builder.large_scale_test import (
+    PayloadShape, build_trip_response, generate_activities, generate_flights, generate_hotels,
+)
+from apps.package_builder.packages_builder import build_package, build_package_from_raw
+from apps.package_builder.trusted_builder import build_package_trusted
+from apps.package_builder.streaming_builder import StreamingPackageBuilder
+from apps.package_builder.score_algorithms import set_activity_scores, set_flight_scores, set_hotel_scores, get_flight_time
+from apps.package_builder.score_views import (
+    ActivityScoreView, FlightScoreView, HotelScoreView, select_best, select_best_in_frame, views_of,
+)
+from shared.data_types.result_frame import SearchResultFrame
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+DEFAULT_SIZES = [10, 1000, 100000]
+DEFAULT_THRESHOLD_PCT = 20.0
+# Slowdowns smaller than this are noise whatever their percentage (tiny cases)
+DEFAULT_NOISE_MS = 0.05
+DEFAULT_RUNS = 3
+SEED = 1234
+
+
+def measure(fn: Callable[[Any], Any], setup: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Run `fn(setup())` `repeat` times, timing only `fn`. Returns seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        fn(arg)
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "repeat": repeat,
+    }
+
+
+def repeats_for(size: int) -> int:
+    """Fewer repetitions for big inputs so the suite stays in minutes."""
+    return max(3, min(50, 100000 // max(size, 1)))
+
+
+def _flight_scores(flights):
+    for flight in flights:
+        set_flight_scores(flight)
+
+
+def _hotel_scores(hotels):
+    for hotel in hotels:
+        set_hotel_scores(hotel)
+
+
+def _flight_times(segments):
+    for segment in segments:
+        get_flight_time(segment)
+
+
+def _trip_dict(size: int) -> Dict[str, Any]:
+    random.seed(SEED)
+    # One stay keeps the 100k-option trip within a few GB of memory
+    return build_trip_response(PayloadShape(stays=1, options_per_section=size)).model_dump(mode="json")
+
+
+def _prepare_build_package(size: int):
+    trip_dict = _trip_dict(size)
+    # build_package writes scores into the models, so validate fresh input each run
+    return build_package, lambda: TripResponse.model_validate(trip_dict)
+
+
+def _prepare_build_package_trusted(size: int):
+    body = orjson.dumps(_trip_dict(size))
+    # Includes parsing, since skipping model construction is the point
+    return (lambda b: build_package_trusted(orjson.loads(b))), lambda: body
+
+
+def _prepare_build_package_from_raw(size: int):
+    body = orjson.dumps(_trip_dict(size))
+    # Includes parsing, like build_package_trusted
+    return (lambda b: build_package_from_raw(orjson.loads(b))), lambda: body
+
+
+def _build_streaming(body: bytes, chunk_size: int = 64 * 1024):
+    builder = StreamingPackageBuilder()
+    for start in range(0, len(body), chunk_size):
+        builder.feed(body[start:start + chunk_size])
+    return builder.close()
+
+
+def _prepare_build_package_streaming(size: int):
+    body = orjson.dumps(_trip_dict(size))
+    # Fed in 64 KiB chunks, roughly what the server hands request.stream()
+    return _build_streaming, lambda: body
+
+
+def _prepare_flight_scores(size: int):
+    random.seed(SEED)
+    flights = generate_flights(size, "entry")
+    return _flight_scores, lambda: flights
+
+
+def _prepare_hotel_scores(size: int):
+    random.seed(SEED)
+    hotels = generate_hotels(size, "London")
+    return _hotel_scores, lambda: hotels
+
+
+def _prepare_flight_time(size: int):
+    random.seed(SEED)
+    # The ISO-parsing branch of get_flight_time only runs without a duration
+    segments = [f.outbound.model_copy(update={"duration_minutes": 0}) for f in generate_flights(size, "entry")]
+    return _flight_times, lambda: segments
+
+
+def _prepare_model_validate(size: int):
+    trip_dict = _trip_dict(size)
+    return TripResponse.model_validate, lambda: trip_dict
+
+
+def _prepare_model_dump(size: int):
+    trip = TripResponse.model_validate(_trip_dict(size))
+    return (lambda t: t.model_dump(mode="python")), lambda: trip
+
+
+def _prepare_serialize_json(size: int):
+    trip = TripResponse.model_validate(_trip_dict(size))
+    # What FastAPI's default JSONResponse amounts to: jsonable dict + stdlib json
+    return (lambda t: json.dumps(t.model_dump(mode="json")).encode("utf-8")), lambda: trip
+
+
+def _prepare_serialize_orjson(size: int):
+    trip = TripResponse.model_validate(_trip_dict(size))
+    return serialization.dumps, lambda: trip
+
+
+# Case name -> factory building (fn, setup) for a given option count.
+# Factories run one at a time so only one case's inputs are alive at once.
+CASES: Dict[str, Callable[[int], Any]] = {
+    "build_package": _prepare_build_package,
+    "build_package_trusted": _prepare_build_package_trusted,
+    "build_package_from_raw": _prepare_build_package_from_raw,
+    "build_package_streaming": _prepare_build_package_streaming,
+    "set_flight_scores": _prepare_flight_scores,
+    "set_hotel_scores": _prepare_hotel_scores,
+    "get_flight_time": _prepare_flight_time,
+    "TripResponse.model_validate": _prepare_model_validate,
+    "TripResponse.model_dump": _prepare_model_dump,
+    "TripResponse.serialize_json": _prepare_serialize_json,
+    "TripResponse.serialize_orjson": _prepare_serialize_orjson,
+}
+
+
+def run_suite(sizes: List[int], only: Optional[List[str]] = None, runs: int = 1) -> Dict[str, Dict[str, float]]:
+    """Each case's stats from the run with the lowest median; runs are interleaved across cases."""
+    results: Dict[str, Dict[str, float]] = {}
+    for run in range(1, runs + 1):
+        for size in sizes:
+            for name, prepare in CASES.items():
+                if only and name not in only:
+                    continue
+                key = f"{name}[{size}]"
+                fn, setup = prepare(size)
+                stats = measure(fn, setup, repeats_for(size))
+                del fn, setup
+                gc.collect()
+                best = results.get(key)
+                if best is None or stats["median"] < best["median"]:
+                    results[key] = {**stats, "runs": run}
+                else:
+                    best["runs"] = run
+                print(f"run {run} {key:<40} median={stats['median'] * 1000:10.3f} ms  min={stats['min'] * 1000:10.3f} ms  (n={stats['repeat']})")
+    return results
+
+
+def peak_memory(fn: Callable[[Any], Any], arg: Any) -> int:
+    """Peak bytes traced while running `fn(arg)`, counting what the result keeps alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+# Option kind -> (raw option generator, model, scorer for the model, score view)
+VIEW_KINDS = {
+    "flight": (lambda n: generate_flights(n, "entry"), FlightOption, set_flight_scores, FlightScoreView),
+    "hotel": (lambda n: generate_hotels(n, "London"), HotelOption, set_hotel_scores, HotelScoreView),
+    "activity": (lambda n: generate_activities(n, "London"), ActivityOption, set_activity_scores, ActivityScoreView),
+}
+
+
+def run_view_comparison(options: int, repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Per option kind, time (median ms) and tracemalloc peak (bytes) for:
+      models / views / frame        materializing all `options` options
+      select_models / select_views  picking the best: validate and score
+      / select_frame                everything, score views or score the
+                                    frame's columns, and validate only the
+                                    winner
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for kind, (generate, model_cls, set_scores, view_cls) in VIEW_KINDS.items():
+        random.seed(SEED)
+        raw = [option.model_dump(mode="json") for option in generate(options)]
+
+        def models(raw):
+            return [model_cls.model_validate(option) for option in raw]
+
+        def views(raw):
+            return list(views_of(view_cls, raw))
+
+        def select_models(raw):
+            validated = models(raw)
+            for model in validated:
+                set_scores(model)
+            return max(validated, key=lambda model: model.scores.preference_score)
+
+        def select_views(raw):
+            best, _ = select_best(views_of(view_cls, raw))
+            return model_cls.model_validate(raw[best.index])
+
+        def frame(raw):
+            return SearchResultFrame.from_options(model_cls, raw)
+
+        def select_frame(raw):
+            built = frame(raw)
+            best, _ = select_best_in_frame(built)
+            return built.row(best)
+
+        cases = (
+            ("models", models), ("views", views), ("frame", frame),
+            ("select_models", select_models), ("select_views", select_views), ("select_frame", select_frame),
+        )
+        for name, fn in cases:
+            key = f"{kind}.{name}[{options}]"
+            results[key] = {
+                "median_ms": measure(fn, lambda: raw, repeat)["median"] * 1000,
+                "peak_bytes": peak_memory(fn, raw),
+            }
+            print(f"{key:<40} median={results[key]['median_ms']:10.3f} ms  peak={results[key]['peak_bytes'] / 2**20:9.2f} MiB")
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold_pct: float,
+            noise_ms: float = DEFAULT_NOISE_MS) -> List[str]:
+    regressions: List[str] = []
+    for key, stats in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        old, new = base["median"], stats["median"]
+        change = (new - old) / old * 100 if old > 0 else 0.0
+        regressed = change > threshold_pct and (new - old) * 1000 > noise_ms
+        marker = "REGRESSION" if regressed else "ok"
+        print(f"{key:<40} {old * 1000:10.3f} -> {new * 1000:10.3f} ms  {change:+7.1f}%  {marker}")
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="package_builder micro-benchmarks")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma separated option counts")
+    parser.add_argument("--only", help="Comma separated case names to run")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save", action="store_true", help="Store results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare results against the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+                        help="Allowed median slowdown in percent")
+    parser.add_argument("--noise-ms", type=float, default=DEFAULT_NOISE_MS,
+                        help="Slowdowns below this many ms never count as regressions")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                        help="Run the suite this many times and keep each case's lowest median")
+    parser.add_argument("--views", type=int, metavar="OPTIONS",
+                        help="Only compare full models with score views at this option count")
+    args = parser.parse_args(argv)
+
+    if args.views:
+        run_view_comparison(args.views)
+        return 0
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    only = [s.strip() for s in args.only.split(",")] if args.only else None
+    if args.compare and not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save on this machine first")
+        return 2
+    results = run_suite(sizes, only, max(1, args.runs))
+
+    if args.compare:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold, args.noise_ms)
+        if regressions:
+            print(f"{len(regressions)} case(s) regressed by more than {args.threshold}%")
+            return 1
+        print(f"No regressions above {args.threshold}%")
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump({
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            }, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Shared fixtures for the package_builder tests: seeded trip payloads and the
+builders that must agree with the fully validated build_package.
+"""
+
+import random
+
+import orjson
+import pytest
+
+from shared.data_types.models import FinalTripLayout
+from apps.package_builder.large_scale_test import PayloadShape, build_trip_response
+from apps.package_builder.packages_builder import build_package_from_raw
+from apps.package_builder.streaming_builder import StreamingPackageBuilder
+from apps.package_builder.trusted_builder import build_package_trusted
+
+
+def _payload(seed, **shape):
+    random.seed(seed)
+    return build_trip_response(PayloadShape(**shape)).model_dump(mode="json")
+
+
+def _layout(result):
+    return FinalTripLayout.model_validate(result).model_dump(mode="json")
+
+
+def _trusted(raw):
+    # Round-trip through orjson like the endpoint does
+    return _layout(build_package_trusted(orjson.loads(orjson.dumps(raw))))
+
+
+def _from_raw(raw):
+    return build_package_from_raw(raw).model_dump(mode="json")
+
+
+def _streaming(raw):
+    body, builder = orjson.dumps(raw), StreamingPackageBuilder()
+    for start in range(0, len(body), 4096):
+        builder.feed(body[start:start + 4096])
+    return _layout(builder.close())
+
+
+# Each takes a TripResponse dict and returns the package as build_package's JSON
+BUILDERS = {"trusted": _trusted, "from_raw": _from_raw, "streaming": _streaming}
+
+
+@pytest.fixture
+def payload():
+    """payload(seed, **PayloadShape fields): a TripResponse dict, the same for the same seed."""
+    return _payload
+
+
+@pytest.fixture(params=list(BUILDERS))
+def builder(request):
+    """Each of the raw-dict builders in turn."""
+    return BUILDERS[request.param]
@@ -1,25 +1,59 @@
+"""
+End-to-end load generator for the trip pipeline.
+
+Drives `/api/build-package` (package_builder) and/or `/api/create_trip`
+(trip_builder) at a fixed arrival rate with synthetic payloads, records
+latency percentiles, error rates and throughput, and writes a JSON report
+that can be compared against a previous run to catch regressions.
+
+Examples:
+    python -m apps.package_builder.large_scale_test --target build-package \\
+        --rps 20 --duration 30 --options 1000 --report out.json
+    python -m apps.package_builder.large_scale_test --target create-trip \\
+        --rps 2 --duration 60 --compare baseline.json
+"""
+
 import sys
 import os
 # Add the project root to sys.path so 'shared' can be imported without PYTHONPATH hacks
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import argparse
+import asyncio
+import json
+import math
+import platform
 import random
 import time
-import requests
+from dataclasses import dataclass, field, asdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import httpx
+
 from shared.data_types.models import (
-    TripResponse, TripSectionResponse, SectionType, 
-    FlightResponse, StayResponse, FlightOption, HotelOption
+    TripResponse, TripSectionResponse, SectionType,
+    FlightResponse, StayResponse, FlightOption, HotelOption, ActivityOption,
+    TripRequest, TripSection, FlightRequest, StayRequest,
+    HotelSearchRequest, ActivitySearchRequest, Location, DateRange
 )
 
 # Configuration
-URL = "http://127.0.0.1:81/build-package"
+BUILD_PACKAGE_URL = os.getenv("BUILD_PACKAGE_URL", "http://127.0.0.1:8200/api/build-package")
+CREATE_TRIP_URL = os.getenv("CREATE_TRIP_URL", "http://127.0.0.1:8100/api/create_trip")
 NUM_FLIGHTS = 1000
 NUM_HOTELS = 1000
 COUNTRY = "UK"
 CITIES = ["London", "Manchester", "Liverpool", "Edinburgh", "Glasgow"]
 AMENITIES_POOL = ["wifi", "pool", "gym", "breakfast", "spa"]
+DEFAULT_CURRENCIES = ["USD"]
+
+# Histogram bucket upper bounds in milliseconds
+HISTOGRAM_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000]
 
-def generate_flights(count, type_prefix="f"):
+
+def generate_flights(count, type_prefix="f", currencies=None):
+    currencies = currencies or DEFAULT_CURRENCIES
     flights = []
     for i in range(count):
         origin = "New York" if type_prefix == "entry" else random.choice(CITIES)
@@ -36,12 +70,13 @@ def generate_flights(count, type_prefix="f"):
                 "airline": "Airline_Flight",
                 "flight_number": f"FL{i}"
             },
-            "price_per_person": {"currency": "USD", "amount": random.uniform(200, 2000)},
+            "price_per_person": {"currency": random.choice(currencies), "amount": random.uniform(200, 2000)},
             "available": True
         }))
     return flights
 
-def generate_hotels(count, city):
+def generate_hotels(count, city, currencies=None):
+    currencies = currencies or DEFAULT_CURRENCIES
     hotels = []
     for i in range(count):
         hotels.append(HotelOption(**{
@@ -49,57 +84,310 @@ def generate_hotels(count, city):
             "name": f"Hotel {city} {i}",
             "location": {"city": city, "country": COUNTRY},
             "rating": round(random.uniform(1.0, 5.0), 1),
-            "price_per_night": {"currency": "USD", "amount": random.uniform(50, 1000)},
+            "price_per_night": {"currency": random.choice(currencies), "amount": random.uniform(50, 1000)},
             "amenities": random.sample(AMENITIES_POOL, random.randint(0, 5)),
             "available": True
         }))
     return hotels
 
-def run_api_stress_test():
-    print(f"--- API Large Scale Test ---")
-    print(f"Generating large payload...")
-    
-    sections = [
-        TripSectionResponse(
-            type=SectionType.FLIGHT,
-            data=FlightResponse(options=generate_flights(NUM_FLIGHTS, "entry"))
-        ),
-        TripSectionResponse(
-            type=SectionType.STAY,
-            data=StayResponse(hotel_options=generate_hotels(NUM_HOTELS, "London"))
-        ),
-        TripSectionResponse(
+def generate_activities(count, city, currencies=None):
+    currencies = currencies or DEFAULT_CURRENCIES
+    activities = []
+    for i in range(count):
+        activities.append(ActivityOption(**{
+            "id": f"a_{city}_{i}",
+            "name": f"Activity {city} {i}",
+            "location": {"city": city, "country": COUNTRY},
+            "rating": round(random.uniform(3.0, 5.0), 1),
+            "review_count": random.randint(0, 500),
+            "price_per_person": {"currency": random.choice(currencies), "amount": random.uniform(10, 300)},
+            "duration_minutes": random.randint(60, 480),
+            "available_times": [{"date": "2026-06-02", "time": f"{random.randint(6, 22):02d}:00"}],
+            "available": True
+        }))
+    return activities
+
+
+@dataclass
+class PayloadShape:
+    """Shape of the synthetic trip: stays between an outbound and return flight."""
+    stays: int = 2
+    options_per_section: int = NUM_FLIGHTS
+    activities_per_stay: int = 0
+    currencies: List[str] = field(default_factory=lambda: list(DEFAULT_CURRENCIES))
+
+
+def build_trip_response(shape: PayloadShape) -> TripResponse:
+    """Synthetic package_builder input (what trip_builder would send)."""
+    cities = [CITIES[i % len(CITIES)] for i in range(shape.stays)]
+    sections = [TripSectionResponse(
+        type=SectionType.FLIGHT,
+        data=FlightResponse(options=generate_flights(shape.options_per_section, "entry", shape.currencies))
+    )]
+    for city in cities:
+        sections.append(TripSectionResponse(
             type=SectionType.STAY,
-            data=StayResponse(hotel_options=generate_hotels(NUM_HOTELS, "Manchester"))
-        ),
-        TripSectionResponse(
-            type=SectionType.FLIGHT,
-            data=FlightResponse(options=generate_flights(NUM_FLIGHTS, "exit"))
+            data=StayResponse(
+                hotel_options=generate_hotels(shape.options_per_section, city, shape.currencies),
+                activity_options=generate_activities(shape.activities_per_stay, city, shape.currencies)
+            )
+        ))
+    sections.append(TripSectionResponse(
+        type=SectionType.FLIGHT,
+        data=FlightResponse(options=generate_flights(shape.options_per_section, "exit", shape.currencies))
+    ))
+    return TripResponse(sections=sections)
+
+
+def build_trip_request(shape: PayloadShape) -> TripRequest:
+    """Synthetic trip_builder input (what the web-server would send)."""
+    cities = [CITIES[i % len(CITIES)] for i in range(shape.stays)]
+    start = date(2026, 6, 1)
+    nights = 3
+    sections = [TripSection(type=SectionType.FLIGHT, data=FlightRequest(
+        origin=Location(city="New York", country="US", airport_code="JFK"),
+        destination=Location(city=cities[0] if cities else "London", country="GB"),
+        departure_date=start.isoformat(),
+        passengers=2,
+        max_results=shape.options_per_section,
+    ))]
+    for i, city in enumerate(cities):
+        check_in = start + timedelta(days=nights * i)
+        dates = DateRange(
+            start_date=check_in.isoformat(),
+            end_date=(check_in + timedelta(days=nights)).isoformat()
         )
-    ]
-    trip = TripResponse(sections=sections)
-
-    print(f"Sending request to {URL}...")
-    try:
-        t0 = time.time()
-        # Ensure serialization using model_dump()
-        response = requests.post(URL, json=trip.model_dump())
-        t1 = time.time()
-        
-        response.raise_for_status()
-        result = response.json()
-        
-        print(f"API Response Time: {t1 - t0:.3f} seconds")
-        print(f"Package Size: {len(result)} items")
-        
-        for i, item in enumerate(result[:5]): # Only print first 5 for brevity
-            score = item.get("scores", {}).get("preference_score", "N/A")
-            print(f" Stage {i}: {item.get('id', '???')} - Score: {score}")
-
-        print("\nSuccess! API handles large payloads correctly.")
-    except Exception as e:
-        print(f"Test Failed: {e}")
-        print("Tip: Make sure the server is running (python apps/package_builder/main.py)")
+        location = Location(city=city, country="GB")
+        sections.append(TripSection(type=SectionType.STAY, data=StayRequest(
+            hotel_request=HotelSearchRequest(
+                location=location, dates=dates, guests=2, rooms=1,
+                max_results=shape.options_per_section
+            ),
+            activity_request=ActivitySearchRequest(
+                location=location, dates=dates, max_results=shape.activities_per_stay
+            )
+        )))
+    sections.append(TripSection(type=SectionType.FLIGHT, data=FlightRequest(
+        origin=Location(city=cities[-1] if cities else "London", country="GB"),
+        destination=Location(city="New York", country="US", airport_code="JFK"),
+        departure_date=(start + timedelta(days=nights * len(cities))).isoformat(),
+        passengers=2,
+        max_results=shape.options_per_section,
+    )))
+    return TripRequest(sections=sections)
+
+
+# ==========================================
+# Measurement
+# ==========================================
+
+@dataclass
+class RequestSample:
+    start: float
+    latency_ms: float
+    status: int
+    error: str = ""
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: List[RequestSample], wall_time_s: float) -> Dict:
+    ok = sorted(s.latency_ms for s in samples if not s.error)
+    errors: Dict[str, int] = {}
+    for s in samples:
+        if s.error:
+            errors[s.error] = errors.get(s.error, 0) + 1
+
+    histogram = {f"le_{b}": 0 for b in HISTOGRAM_BUCKETS_MS}
+    histogram["le_inf"] = 0
+    for value in ok:
+        for bucket in HISTOGRAM_BUCKETS_MS:
+            if value <= bucket:
+                histogram[f"le_{bucket}"] += 1
+                break
+        else:
+            histogram["le_inf"] += 1
+
+    total = len(samples)
+    return {
+        "requests": total,
+        "successes": len(ok),
+        "error_rate": (total - len(ok)) / total if total else 0.0,
+        "errors": errors,
+        "throughput_rps": len(ok) / wall_time_s if wall_time_s > 0 else 0.0,
+        "latency_ms": {
+            "min": ok[0] if ok else 0.0,
+            "mean": sum(ok) / len(ok) if ok else 0.0,
+            "p50": percentile(ok, 50),
+            "p95": percentile(ok, 95),
+            "p99": percentile(ok, 99),
+            "max": ok[-1] if ok else 0.0,
+        },
+        "histogram_ms": histogram,
+    }
+
+
+async def _send(client: httpx.AsyncClient, url: str, body: bytes, semaphore: asyncio.Semaphore,
+                start: float) -> RequestSample:
+    # Latency runs from the request's scheduled time, not from when it got a
+    # slot: time spent waiting behind max_in_flight (or a late event loop) is
+    # part of what a client arriving then would see. Measuring from the send
+    # would hide exactly that queueing (coordinated omission).
+    async with semaphore:
+        try:
+            response = await client.post(url, content=body, headers={"Content-Type": "application/json"})
+            latency = (time.perf_counter() - start) * 1000
+            error = "" if response.is_success else f"http_{response.status_code}"
+            return RequestSample(start, latency, response.status_code, error)
+        except httpx.HTTPError as e:
+            latency = (time.perf_counter() - start) * 1000
+            return RequestSample(start, latency, 0, type(e).__name__)
+
+
+async def run_load(url: str, body: bytes, rps: float, duration_s: float,
+                   max_in_flight: int, timeout_s: float) -> Dict:
+    """
+    Open-loop load: requests are scheduled at a fixed arrival rate regardless
+    of how fast responses come back, so queueing shows up in the tail
+    latencies instead of silently lowering the offered load.
+    """
+    total_requests = max(1, int(rps * duration_s))
+    semaphore = asyncio.Semaphore(max_in_flight)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+
+    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout_s), limits=limits) as client:
+        t0 = time.perf_counter()
+        tasks = []
+        for i in range(total_requests):
+            scheduled = t0 + i / rps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(_send(client, url, body, semaphore, scheduled)))
+        samples = await asyncio.gather(*tasks)
+        wall_time = time.perf_counter() - t0
+
+    result = summarize(list(samples), wall_time)
+    result["target_rps"] = rps
+    result["wall_time_s"] = wall_time
+    return result
+
+
+# ==========================================
+# Reporting
+# ==========================================
+
+def compare_reports(current: Dict, baseline: Dict, threshold_pct: float) -> List[str]:
+    """Return human-readable regressions of `current` against `baseline`."""
+    regressions: List[str] = []
+    for target, result in current["targets"].items():
+        base = baseline.get("targets", {}).get(target)
+        if not base:
+            continue
+        for key in ("p50", "p95", "p99"):
+            old, new = base["latency_ms"][key], result["latency_ms"][key]
+            if old > 0 and (new - old) / old * 100 > threshold_pct:
+                regressions.append(f"{target} {key}: {old:.1f}ms -> {new:.1f}ms (+{(new - old) / old * 100:.1f}%)")
+        old_tp, new_tp = base["throughput_rps"], result["throughput_rps"]
+        if old_tp > 0 and (old_tp - new_tp) / old_tp * 100 > threshold_pct:
+            regressions.append(f"{target} throughput: {old_tp:.2f} -> {new_tp:.2f} rps")
+        if result["error_rate"] > base["error_rate"] + threshold_pct / 100:
+            regressions.append(f"{target} error rate: {base['error_rate']:.2%} -> {result['error_rate']:.2%}")
+    return regressions
+
+
+def print_summary(target: str, result: Dict):
+    lat = result["latency_ms"]
+    print(f"--- {target} ---")
+    print(f" requests={result['requests']} ok={result['successes']} "
+          f"errors={result['error_rate']:.2%} throughput={result['throughput_rps']:.2f} rps "
+          f"(target {result['target_rps']:.2f})")
+    print(f" latency ms: p50={lat['p50']:.1f} p95={lat['p95']:.1f} p99={lat['p99']:.1f} "
+          f"mean={lat['mean']:.1f} max={lat['max']:.1f}")
+    if result["errors"]:
+        print(f" errors: {result['errors']}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load test the trip pipeline.")
+    parser.add_argument("--target", choices=["build-package", "create-trip", "both"], default="build-package")
+    parser.add_argument("--build-package-url", default=BUILD_PACKAGE_URL)
+    parser.add_argument("--create-trip-url", default=CREATE_TRIP_URL)
+    parser.add_argument("--rps", type=float, default=5.0, help="Target arrival rate (requests/second)")
+    parser.add_argument("--duration", type=float, default=20.0, help="Test duration in seconds")
+    parser.add_argument("--max-in-flight", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--stays", type=int, default=2, help="Stay sections between the two flights")
+    parser.add_argument("--options", type=int, default=NUM_FLIGHTS, help="Options per section")
+    parser.add_argument("--activities", type=int, default=0, help="Activities per stay section")
+    parser.add_argument("--currencies", default="USD", help="Comma separated currency codes")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--report", help="Write the JSON report to this path")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    random.seed(args.seed)
+
+    shape = PayloadShape(
+        stays=args.stays,
+        options_per_section=args.options,
+        activities_per_stay=args.activities,
+        currencies=[c.strip().upper() for c in args.currencies.split(",") if c.strip()],
+    )
+
+    targets = ["build-package", "create-trip"] if args.target == "both" else [args.target]
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "host": platform.node(),
+        "config": {
+            "rps": args.rps,
+            "duration_s": args.duration,
+            "max_in_flight": args.max_in_flight,
+            "shape": asdict(shape),
+        },
+        "targets": {},
+    }
+
+    for target in targets:
+        if target == "build-package":
+            url, payload = args.build_package_url, build_trip_response(shape)
+        else:
+            url, payload = args.create_trip_url, build_trip_request(shape)
+        # Serialize once so payload generation never throttles the load generator
+        body = json.dumps(payload.model_dump(mode="json")).encode("utf-8")
+        print(f"Driving {url} at {args.rps} rps for {args.duration}s ({len(body) / 1024:.0f} KiB payload)...")
+        result = await run_load(url, body, args.rps, args.duration, args.max_in_flight, args.timeout)
+        result["payload_bytes"] = len(body)
+        report["targets"][target] = result
+        print_summary(target, result)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.report}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_reports(report, baseline, args.threshold)
+        if regressions:
+            print("REGRESSIONS:")
+            for line in regressions:
+                print(f" {line}")
+            return 1
+        print(f"No regressions above {args.threshold}% against {args.compare}")
+    return 0
+
 
 if __name__ == "__main__":
-    run_api_stress_test()
+    sys.exit(asyncio.run(main()))
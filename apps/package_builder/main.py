@@ -2,10 +2,16 @@ import sys
 # Add the project root to sys.path so 'shared' can be imported without PYTHONPATH hacks
 
 from fastapi import FastAPI, HTTPException, Request
-from shared.data_types.models import TripResponse
+from shared.data_types.models import FinalTripLayout, TripResponse
+from shared.serialization import ORJSONResponse
+from shared.protobuf_codec import ProtobufResponse, accepts_protobuf, decode_dict, is_protobuf
+from shared.data_types import trip_pb2
 import uvicorn
 import logging
 import time
+import hmac
+import os
+import orjson
 
 # Configure logging
 logging.basicConfig(
@@ -13,12 +19,36 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
-from .packages_builder import build_package
+from .packages_builder import build_package, build_package_from_raw
+from .trusted_builder import build_package_trusted
+from .streaming_builder import build_package_streaming
+
+# Callers presenting this shared token skip Pydantic validation entirely
+INTERNAL_CALLER_HEADER = "X-Internal-Caller"
+INTERNAL_CALLER_TOKEN = os.getenv("INTERNAL_CALLER_TOKEN", "")
+
+# "full" validates every option into a model; "selected" scores the raw JSON
+# through score views and validates only the options that end up in the package
+PACKAGE_VALIDATION_MODES = ("full", "selected")
+PACKAGE_VALIDATION_MODE = os.getenv("PACKAGE_VALIDATION_MODE", "full")
+if PACKAGE_VALIDATION_MODE not in PACKAGE_VALIDATION_MODES:
+    raise ValueError(
+        f"PACKAGE_VALIDATION_MODE must be one of {', '.join(PACKAGE_VALIDATION_MODES)}, got {PACKAGE_VALIDATION_MODE!r}"
+    )
+# Off by default. Parse JSON bodies while they arrive, keeping only each
+# section's best option, for requests that don't validate every option
+# (trusted or "selected" mode). Memory stays flat however large the body, but
+# parsing takes about 5x the CPU, so it is meant for memory-bound workers that
+# receive very large bodies; only bodies of at least PACKAGE_STREAMING_MIN_BYTES
+# (or of unknown length) take it.
+PACKAGE_STREAMING_PARSE = os.getenv("PACKAGE_STREAMING_PARSE", "0") == "1"
+PACKAGE_STREAMING_MIN_BYTES = int(os.getenv("PACKAGE_STREAMING_MIN_BYTES", str(16 * 1024 * 1024)))
 
 app = FastAPI(
     title="Package Builder API",
     description="Optimizes travel packages using shared models.",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 @app.middleware("http")
@@ -29,6 +59,26 @@ async def log_requests(request: Request, call_next):
     logger.info(f"Handled {request.method} {request.url.path} in {duration:.4f} seconds")
     return response
 
+def is_trusted_caller(request: Request) -> bool:
+    if not INTERNAL_CALLER_TOKEN:
+        return False
+    presented = request.headers.get(INTERNAL_CALLER_HEADER, "")
+    return hmac.compare_digest(presented.encode(), INTERNAL_CALLER_TOKEN.encode())
+
+def _streams_body(request: Request, trusted: bool) -> bool:
+    """Whether the body takes the opt-in streaming parse (PACKAGE_STREAMING_PARSE)."""
+    if not PACKAGE_STREAMING_PARSE or is_protobuf(request):
+        return False
+    if not trusted and PACKAGE_VALIDATION_MODE != "selected":
+        return False
+    length = request.headers.get("content-length", "")
+    return not length.isdigit() or int(length) >= PACKAGE_STREAMING_MIN_BYTES
+
+def _package_response(request: Request, result):
+    if accepts_protobuf(request):
+        return ProtobufResponse(result, trip_pb2.FinalTripLayout)
+    return ORJSONResponse(content=result)
+
 @app.post("/api/build-package")
 async def create_package(request: Request):
     """
@@ -38,12 +88,47 @@ async def create_package(request: Request):
     **OPTIMIZED MODE**: 
     - Bypasses FastAPI's automatic request/response validation
     - Uses Pydantic V2's fast model_validate for manual parsing
-    - Returns raw dicts to skip response validation overhead
+    - Serializes the result model directly with orjson, skipping response validation
+
+    **TRUSTED MODE** (`X-Internal-Caller` matches `INTERNAL_CALLER_TOKEN`):
+    - Parses the body with orjson and scores straight from the dicts
+    - Returns the selected input dicts without building any models
+
+    **SELECTED VALIDATION** (`PACKAGE_VALIDATION_MODE=selected`):
+    - Scores compact views read from the parsed body
+    - Validates only the chosen options into models
+
+    **STREAMING PARSE** (opt-in, `PACKAGE_STREAMING_PARSE=1`; trusted or
+    selected validation, JSON bodies of `PACKAGE_STREAMING_MIN_BYTES` or more):
+    - Walks `sections[*].data.*options[*]` as the body arrives, scoring each
+      option and keeping only the best, so memory doesn't grow with the body
+    - Costs about 5x the CPU of the paths above; for memory-bound workers only
+
+    **PROTOBUF** (opt-in): a `Content-Type: application/x-protobuf` body is
+    read as trip.proto's TripResponse, and `Accept: application/x-protobuf`
+    returns a FinalTripLayout message instead of JSON.
     """
     try:
-        
-        # Parse JSON without FastAPI's automatic validation (trusted data)
-        raw_data = await request.json()
+        trusted = is_trusted_caller(request)
+        if _streams_body(request, trusted):
+            result = await build_package_streaming(request.stream())
+            if not trusted:
+                result = FinalTripLayout.model_validate(result)
+            return _package_response(request, result)
+
+        # Parse without FastAPI's automatic validation (trusted data)
+        body = await request.body()
+        if is_protobuf(request):
+            raw_data = decode_dict(body, trip_pb2.TripResponse)
+        else:
+            raw_data = orjson.loads(body)
+
+        if trusted:
+            result = build_package_trusted(raw_data)
+            return _package_response(request, result)
+
+        if PACKAGE_VALIDATION_MODE == "selected":
+            return _package_response(request, build_package_from_raw(raw_data))
         
         # Use model_validate which properly constructs nested models
         # In Pydantic V2 this is already very fast
@@ -54,14 +139,9 @@ async def create_package(request: Request):
         result = build_package(trip)
         
         
-        # Convert result to dictionaries without validation
-        # Using model_dump with mode='python' for fastest serialization
-        response_data = result.model_dump(mode='python')
-        
-        
-
-        
-        return response_data
+        # Hand the model straight to orjson; returning a dict would send it
+        # through FastAPI's jsonable_encoder first
+        return _package_response(request, result)
     except Exception as e:
         import traceback
         error_details = traceback.format_exc()
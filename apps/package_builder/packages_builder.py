@@ -1,7 +1,11 @@
+from typing import Any, Dict, List
+
 from .score_algorithms import *
+from .score_views import FlightScoreView, HotelScoreView, select_best, views_of
 from shared.data_types.models import (
     TripResponse, SectionType,
-    FinalTripLayout, FinalTripSection, FinalStayOption
+    FinalTripLayout, FinalTripSection, FinalStayOption,
+    FlightOption, HotelOption, ActivityOption, TransportOption, ComponentScores
 )
 
 def build_package(trip: TripResponse) -> FinalTripLayout:
@@ -61,3 +65,68 @@ def build_package(trip: TripResponse) -> FinalTripLayout:
                 )
 
     return layout
+
+
+def _best_model(options: List[Dict[str, Any]], view_cls, model_cls):
+    """Validate only the winning option; rescored winners get their new scores."""
+    selected = select_best(views_of(view_cls, options))
+    if selected is None:
+        return None
+    view, scores = selected
+    best = model_cls.model_validate(options[view.index])
+    if scores is not None:
+        price_score, preference_score = scores
+        best.scores = ComponentScores(
+            price_score=price_score,
+            quality_score=0,
+            convenience_score=0,
+            preference_score=preference_score
+        )
+    return best
+
+
+def build_package_from_raw(trip: Dict[str, Any]) -> FinalTripLayout:
+    """
+    build_package over the raw TripResponse JSON dict: options are scored
+    through score views and only the selected ones (plus the kept
+    activities) are validated into models, so a malformed losing option is
+    not reported. Returns the same FinalTripLayout as build_package.
+    """
+    layout = FinalTripLayout(sections=[])
+
+    for section in trip.get("sections") or []:
+        section_type = section.get("type")
+        data = section.get("data") or {}
+
+        if section_type == SectionType.FLIGHT.value:
+            best_flight = _best_model(data.get("options") or [], FlightScoreView, FlightOption)
+            if best_flight:
+                layout.sections.append(
+                    FinalTripSection(type=SectionType.FLIGHT, data=best_flight)
+                )
+
+        elif section_type == SectionType.STAY.value:
+            best_hotel = _best_model(data.get("hotel_options") or [], HotelScoreView, HotelOption)
+
+            # Skip this stay section entirely if no hotel is available
+            if not best_hotel or not best_hotel.id or not best_hotel.name:
+                print(f"Skipping stay section - no valid hotel available")
+                continue
+
+            stay_option = FinalStayOption(hotel=best_hotel)
+            stay_option.activities = [
+                ActivityOption.model_validate(activity) for activity in (data.get("activity_options") or [])[:5]
+            ]
+            layout.sections.append(
+                FinalTripSection(type=SectionType.STAY, data=stay_option)
+            )
+
+        elif section_type == SectionType.TRANSFER.value:
+            options = data.get("options") or []
+            if options:
+                # Transfer scoring to be implemented
+                layout.sections.append(
+                    FinalTripSection(type=SectionType.TRANSFER, data=TransportOption.model_validate(options[0]))
+                )
+
+    return layout
@@ -2,7 +2,7 @@
 # Large sample data for testing the package builder
 
 from typing import List
-from enums_and_models import (
+from shared.data_types.models import (
     PreferenceType,
     Money,
     Location,
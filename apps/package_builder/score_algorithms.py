@@ -16,6 +16,34 @@ TIME_NAMES = {
         "night": (21, 6),      # 21:00–5:59
 }
 
+# Score weights per mode and the reference values each input is normalized
+# by. calc_flight_score, calc_hotel_score and activity_score_values read
+# these, as do the views and the column-wise frame scorers in score_views.
+
+# (price, flight time, connections); each term counts against the score
+FLIGHT_SCORE_WEIGHTS = {
+    "normal": (0.5, 0.35, 0.15),
+    "budget": (0.7, 0.25, 0.05),
+    "duration": (0.3, 0.65, 0.05),
+}
+FLIGHT_REF_PRICE = 1000
+FLIGHT_REF_DURATION = 720  # minutes
+FLIGHT_REF_CONNECTIONS = 2
+
+# (rating, price per night, amenities)
+HOTEL_SCORE_WEIGHTS = {
+    "normal": (0.5, 0.3, 0.2),
+    "budget": (0.3, 0.6, 0.1),
+}
+HOTEL_REF_PRICE = 1500
+HOTEL_REF_RATING = 5
+HOTEL_REF_AMENITIES = 10  # amenities beyond this don't score
+
+ACTIVITY_MAX_PRICE = 1000  # per minute, for normalization
+ACTIVITY_MIN_REVIEWS = 20  # more reviews than this make the rating count more
+ACTIVITY_RATING_FACTORS = (0.5, 0.7)  # (few reviews, many reviews)
+ACTIVITY_PRICE_SCORE_WEIGHTS = (0.7, 0.3)  # (inverted price, rating)
+
 
 def set_flights_scores(flights: List[FlightOption]):
     for flight in flights:
@@ -68,23 +96,11 @@ def set_activities_scores(activities: List[ActivityOption]):
 
 
 def set_activity_scores(activity: ActivityOption):
-
-    max_price = 1000  # for normalization
     price = get_currency_rate(activity.price_per_person.currency) * activity.price_per_person.amount
-    relative_price = price / max(activity.duration_minutes, 1)  # avoid division by zero
-    
-    # Invert price so cheaper per minute -> higher score
-    inverted_price = max(0, max_price - relative_price)
-    
-    # Weight rating factor based on review count
-    if activity.review_count > 20:
-        rating_factor = 0.7
-    else:
-        rating_factor = 0.5
-    
-    preference_score = activity.rating * rating_factor + (inverted_price / max_price) * (1 - rating_factor)
-    price_score = (inverted_price / max_price) * 0.7 + activity.rating * 0.3
-    
+
+    price_score, preference_score = activity_score_values(
+        activity.rating, activity.review_count, price, activity.duration_minutes
+    )
     activity.scores = ComponentScores(
         price_score=price_score,
         quality_score=0,
@@ -118,11 +134,12 @@ def set_flight_scores(flight: FlightOption):
     connections = outbound.stops
     price = get_flight_price_usd(flight)
 
+    price_score, preference_score = flight_score_values(flight_time, connections, price)
     flight.scores = ComponentScores(
-        price_score=calc_flight_score(flight_time, connections, price, mode="budget"),
+        price_score=price_score,
         quality_score=0,          # can be extended
         convenience_score=0,      # can be extended
-        preference_score=calc_flight_score(flight_time, connections, price, mode="normal")
+        preference_score=preference_score
     )
 
 
@@ -130,59 +147,90 @@ def set_hotel_scores(hotel: HotelOption):
     """Compute hotel scores based on rating, price, amenities."""
     rating = hotel.rating
     price_per_night = get_hotel_price_usd(hotel)
-    amenities_count = min(len(hotel.amenities), 10)
+    amenities_count = min(len(hotel.amenities), HOTEL_REF_AMENITIES)
 
+    price_score, preference_score = hotel_score_values(rating, price_per_night, amenities_count)
     hotel.scores = ComponentScores(
-        price_score=calc_hotel_score(rating, price_per_night, amenities_count, mode="budget"),
+        price_score=price_score,
         quality_score=0,         # can be extended
         convenience_score=0,     # can be extended
-        preference_score=calc_hotel_score(rating, price_per_night, amenities_count, mode="normal")
+        preference_score=preference_score
     )
 
 
-def calc_hotel_score(rating, price_per_night, amenities_count, mode="normal"):
-    """Normalized 0-1 hotel score."""
-    ref_price = 1500
-    ref_rating = 5
-    ref_amenities = 10
+def flight_score_values(flight_time, connections, price):
+    """(price_score, preference_score) from a flight's primitive fields."""
+    return (
+        calc_flight_score(flight_time, connections, price, mode="budget"),
+        calc_flight_score(flight_time, connections, price, mode="normal")
+    )
+
 
-    if mode == "normal":
-        score = 0.5 * (rating / ref_rating) + 0.3 * (1 - price_per_night / ref_price) + 0.2 * (amenities_count / ref_amenities)
-    elif mode == "budget":
-        score = 0.3 * (rating / ref_rating) + 0.6 * (1 - price_per_night / ref_price) + 0.1 * (amenities_count / ref_amenities)
+def hotel_score_values(rating, price_per_night, amenities_count):
+    """(price_score, preference_score) from a hotel's primitive fields."""
+    return (
+        calc_hotel_score(rating, price_per_night, amenities_count, mode="budget"),
+        calc_hotel_score(rating, price_per_night, amenities_count, mode="normal")
+    )
+
+
+def activity_score_values(rating, review_count, price, duration_minutes):
+    """(price_score, preference_score) from an activity's primitive fields."""
+    max_price = ACTIVITY_MAX_PRICE
+    relative_price = price / max(duration_minutes, 1)  # avoid division by zero
+
+    # Invert price so cheaper per minute -> higher score
+    inverted_price = max(0, max_price - relative_price)
+
+    # Weight rating factor based on review count
+    rating_factor = ACTIVITY_RATING_FACTORS[review_count > ACTIVITY_MIN_REVIEWS]
+
+    price_weight, rating_weight = ACTIVITY_PRICE_SCORE_WEIGHTS
+    preference_score = rating * rating_factor + (inverted_price / max_price) * (1 - rating_factor)
+    price_score = (inverted_price / max_price) * price_weight + rating * rating_weight
+    return price_score, preference_score
 
+
+def calc_hotel_score(rating, price_per_night, amenities_count, mode="normal"):
+    """Normalized 0-1 hotel score."""
+    rating_weight, price_weight, amenities_weight = HOTEL_SCORE_WEIGHTS[mode]
+    score = (
+        rating_weight * (rating / HOTEL_REF_RATING)
+        + price_weight * (1 - price_per_night / HOTEL_REF_PRICE)
+        + amenities_weight * (amenities_count / HOTEL_REF_AMENITIES)
+    )
     return max(0, min(score, 1))
 
 
 def calc_flight_score(flight_time, connections, price, mode="normal"):
     """Normalized 0-1 flight score."""
-    ref_price = 1000
-    ref_duration = 720
-    ref_connections = 2
-
-    if mode == "normal":
-        raw = 0.5 * (price / ref_price) + 0.35 * (flight_time / ref_duration) + 0.15 * (connections / ref_connections)
-    elif mode == "budget":
-        raw = 0.7 * (price / ref_price) + 0.25 * (flight_time / ref_duration) + 0.05 * (connections / ref_connections)
-    else:  # duration
-        raw = 0.3 * (price / ref_price) + 0.65 * (flight_time / ref_duration) + 0.05 * (connections / ref_connections)
-
+    # Unknown modes weigh like "duration"
+    price_weight, time_weight, connections_weight = FLIGHT_SCORE_WEIGHTS.get(mode, FLIGHT_SCORE_WEIGHTS["duration"])
+    raw = (
+        price_weight * (price / FLIGHT_REF_PRICE)
+        + time_weight * (flight_time / FLIGHT_REF_DURATION)
+        + connections_weight * (connections / FLIGHT_REF_CONNECTIONS)
+    )
     return 1 - min(raw, 1)
 
 
 def get_flight_time(segment: FlightSegment):
-    if segment.duration_minutes > 0:
-        return segment.duration_minutes
+    return flight_time_minutes(segment.duration_minutes, segment.departure_time, segment.arrival_time)
+
+
+def flight_time_minutes(duration_minutes, departure_time, arrival_time):
+    if duration_minutes > 0:
+        return duration_minutes
 
     # Use fromisoformat (up to 30x faster than strptime)
     try:
-        dep = datetime.fromisoformat(segment.departure_time)
-        arr = datetime.fromisoformat(segment.arrival_time)
+        dep = datetime.fromisoformat(departure_time)
+        arr = datetime.fromisoformat(arrival_time)
         return (arr - dep).total_seconds() / 60
     except (ValueError, AttributeError):
         fmt = "%Y-%m-%dT%H:%M:%S"
-        dep = datetime.strptime(segment.departure_time, fmt)
-        arr = datetime.strptime(segment.arrival_time, fmt)
+        dep = datetime.strptime(departure_time, fmt)
+        arr = datetime.strptime(arrival_time, fmt)
         return (arr - dep).total_seconds() / 60
 
 
@@ -0,0 +1,221 @@
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from shared.data_types.models import ActivityOption, FlightOption, HotelOption
+from shared.data_types.result_frame import SearchResultFrame
+from .currency_service import get_currency_rate
+from .score_algorithms import (
+    ACTIVITY_MAX_PRICE, ACTIVITY_MIN_REVIEWS, ACTIVITY_PRICE_SCORE_WEIGHTS, ACTIVITY_RATING_FACTORS,
+    FLIGHT_REF_CONNECTIONS, FLIGHT_REF_DURATION, FLIGHT_REF_PRICE, FLIGHT_SCORE_WEIGHTS,
+    HOTEL_REF_AMENITIES, HOTEL_REF_PRICE, HOTEL_REF_RATING, HOTEL_SCORE_WEIGHTS,
+    activity_score_values, flight_score_values, flight_time_minutes, hotel_score_values,
+)
+
+# Compact, read-only views of an option holding just the fields its score
+# depends on, read straight from the option's JSON dict. Selecting the best of
+# N options through views costs N small tuples instead of N nested Pydantic
+# models (FlightOption alone carries two Locations, Money, AmenityInfo, ...);
+# only the winner is then validated into a full model. `index` is the
+# option's position in the section's list.
+
+
+def _money(option: Dict[str, Any], field: str) -> Tuple[float, str]:
+    money = option.get(field) or {}
+    return money.get("amount", 0.0), money.get("currency", "USD")
+
+
+def _preference_score(option: Dict[str, Any]) -> float:
+    return (option.get("scores") or {}).get("preference_score", 0.0)
+
+
+class FlightScoreView(NamedTuple):
+    index: int
+    id: str
+    price: float
+    currency: str
+    duration_minutes: int
+    departure_time: str  # used for the flight time when duration_minutes is unset
+    arrival_time: str
+    stops: int
+    preference_score: float  # as received; non-zero means the section is pre-scored
+
+    @classmethod
+    def from_raw(cls, index: int, option: Dict[str, Any]) -> "FlightScoreView":
+        outbound = option.get("outbound") or {}
+        price, currency = _money(option, "price_per_person")
+        return cls(
+            index, option.get("id", ""), price, currency, outbound.get("duration_minutes", 0),
+            outbound.get("departure_time", ""), outbound.get("arrival_time", ""), outbound.get("stops", 0),
+            _preference_score(option),
+        )
+
+    def score_values(self) -> Tuple[float, float]:
+        flight_time = flight_time_minutes(self.duration_minutes, self.departure_time, self.arrival_time)
+        return flight_score_values(flight_time, self.stops, get_currency_rate(self.currency) * self.price)
+
+
+class HotelScoreView(NamedTuple):
+    index: int
+    id: str
+    price: float  # per night
+    currency: str
+    rating: float
+    amenities_count: int  # capped at HOTEL_REF_AMENITIES, as scored
+    preference_score: float
+
+    @classmethod
+    def from_raw(cls, index: int, option: Dict[str, Any]) -> "HotelScoreView":
+        price, currency = _money(option, "price_per_night")
+        amenities_count = min(len(option.get("amenities") or []), HOTEL_REF_AMENITIES)
+        return cls(index, option.get("id", ""), price, currency, option.get("rating", 0.0), amenities_count, _preference_score(option))
+
+    def score_values(self) -> Tuple[float, float]:
+        return hotel_score_values(self.rating, get_currency_rate(self.currency) * self.price, self.amenities_count)
+
+
+class ActivityScoreView(NamedTuple):
+    index: int
+    id: str
+    price: float  # per person
+    currency: str
+    duration: int
+    rating: float
+    review_count: int
+    preference_score: float
+
+    @classmethod
+    def from_raw(cls, index: int, option: Dict[str, Any]) -> "ActivityScoreView":
+        price, currency = _money(option, "price_per_person")
+        return cls(
+            index, option.get("id", ""), price, currency, option.get("duration_minutes", 0),
+            option.get("rating", 0.0), option.get("review_count", 0), _preference_score(option),
+        )
+
+    def score_values(self) -> Tuple[float, float]:
+        return activity_score_values(self.rating, self.review_count, get_currency_rate(self.currency) * self.price, self.duration)
+
+
+View = TypeVar("View", FlightScoreView, HotelScoreView, ActivityScoreView)
+
+
+def scores_dict(price_score: float, preference_score: float) -> Dict[str, float]:
+    """ComponentScores as a dict, for a rescored option returned as the caller's dict."""
+    return {
+        "price_score": price_score,
+        "quality_score": 0.0,
+        "convenience_score": 0.0,
+        "preference_score": preference_score,
+    }
+
+
+def views_of(view_cls, options: List[Dict[str, Any]]) -> Iterable[View]:
+    """Lazily built views of `options`, so an argmax keeps one alive at a time."""
+    return (view_cls.from_raw(i, option) for i, option in enumerate(options))
+
+
+def select_best(views: Iterable[View]) -> Optional[Tuple[View, Optional[Tuple[float, float]]]]:
+    """
+    Single pass argmax with get_best_flight/get_best_hotel semantics: when the
+    first option arrives pre-scored (non-zero preference_score) the received
+    scores are compared and returned scores are None; otherwise every option
+    is scored and the winner comes with its (price_score, preference_score).
+    Ties keep the first option, like max(). Views may be a generator.
+    """
+    views = iter(views)
+    first = next(views, None)
+    if first is None:
+        return None
+
+    if first.preference_score != 0.0:
+        best = first
+        for view in views:
+            if view.preference_score > best.preference_score:
+                best = view
+        return best, None
+
+    best, best_scores = first, first.score_values()
+    for view in views:
+        scores = view.score_values()
+        if scores[1] > best_scores[1]:
+            best, best_scores = view, scores
+    return best, best_scores
+
+
+# The same scores computed column-wise over a SearchResultFrame. Each returns
+# (price_scores, preference_scores) arrays equal to the per-option results.
+
+def _price_usd(frame: SearchResultFrame) -> np.ndarray:
+    return frame.map_strings("currency", get_currency_rate) * frame["price"]
+
+
+def flight_frame_scores(frame: SearchResultFrame) -> Tuple[np.ndarray, np.ndarray]:
+    flight_time = frame["duration_minutes"].astype(np.float64)
+    # Rows without a duration fall back to their timestamps, one at a time
+    departures, arrivals = frame.tables["departure_time"], frame.tables["arrival_time"]
+    for i in np.flatnonzero(flight_time <= 0):
+        departure = departures[frame["departure_time"][i]]
+        arrival = arrivals[frame["arrival_time"][i]]
+        flight_time[i] = flight_time_minutes(0, departure, arrival)
+
+    price, connections = _price_usd(frame), frame["stops"]
+
+    def score(mode):
+        price_weight, time_weight, connections_weight = FLIGHT_SCORE_WEIGHTS[mode]
+        raw = (
+            price_weight * (price / FLIGHT_REF_PRICE)
+            + time_weight * (flight_time / FLIGHT_REF_DURATION)
+            + connections_weight * (connections / FLIGHT_REF_CONNECTIONS)
+        )
+        return 1 - np.minimum(raw, 1)
+
+    return score("budget"), score("normal")
+
+
+def hotel_frame_scores(frame: SearchResultFrame) -> Tuple[np.ndarray, np.ndarray]:
+    rating, price = frame["rating"], _price_usd(frame)
+    amenities = np.minimum(frame["amenities_count"], HOTEL_REF_AMENITIES)
+
+    def score(mode):
+        rating_weight, price_weight, amenities_weight = HOTEL_SCORE_WEIGHTS[mode]
+        raw = (
+            rating_weight * (rating / HOTEL_REF_RATING)
+            + price_weight * (1 - price / HOTEL_REF_PRICE)
+            + amenities_weight * (amenities / HOTEL_REF_AMENITIES)
+        )
+        return np.maximum(0, np.minimum(raw, 1))
+
+    return score("budget"), score("normal")
+
+
+def activity_frame_scores(frame: SearchResultFrame) -> Tuple[np.ndarray, np.ndarray]:
+    rating = frame["rating"]
+    relative_price = _price_usd(frame) / np.maximum(frame["duration_minutes"], 1)
+    inverted_price = np.maximum(0, ACTIVITY_MAX_PRICE - relative_price)
+    few_reviews, many_reviews = ACTIVITY_RATING_FACTORS
+    rating_factor = np.where(frame["review_count"] > ACTIVITY_MIN_REVIEWS, many_reviews, few_reviews)
+
+    price_weight, rating_weight = ACTIVITY_PRICE_SCORE_WEIGHTS
+    preference_score = rating * rating_factor + (inverted_price / ACTIVITY_MAX_PRICE) * (1 - rating_factor)
+    price_score = (inverted_price / ACTIVITY_MAX_PRICE) * price_weight + rating * rating_weight
+    return price_score, preference_score
+
+
+FRAME_SCORES = {
+    FlightOption: flight_frame_scores,
+    HotelOption: hotel_frame_scores,
+    ActivityOption: activity_frame_scores,
+}
+
+
+def select_best_in_frame(frame: SearchResultFrame) -> Optional[Tuple[int, Optional[Tuple[float, float]]]]:
+    """select_best over a frame: (row index, scores or None when pre-scored)."""
+    if not len(frame):
+        return None
+    received = frame["preference_score"]
+    if received[0] != 0.0:
+        return int(np.argmax(received)), None
+
+    price_scores, preference_scores = FRAME_SCORES[frame.model_cls](frame)
+    best = int(np.argmax(preference_scores))
+    return best, (float(price_scores[best]), float(preference_scores[best]))
@@ -0,0 +1,45 @@
+"""
+Parity checks between each raw-dict builder (trusted, from_raw, streaming;
+see conftest.py) and the fully validated build_package.
+Run from the repository root: python -m pytest apps/package_builder/test_builder_parity.py
+"""
+
+from shared.data_types.models import TripResponse
+from apps.package_builder.packages_builder import build_package
+
+
+def _validated(raw):
+    return build_package(TripResponse.model_validate(raw)).model_dump(mode="json")
+
+
+def test_parity_mixed_currencies(payload, builder):
+    raw = payload(7, stays=3, options_per_section=200, activities_per_stay=8,
+                  currencies=["USD", "EUR", "GBP", "JPY"])
+    assert builder(raw) == _validated(raw)
+
+
+def test_parity_flight_time_from_timestamps(payload, builder):
+    raw = payload(11, stays=1, options_per_section=50)
+    for section in raw["sections"]:
+        if section["type"] == "flight":
+            for i, option in enumerate(section["data"]["options"]):
+                option["outbound"]["duration_minutes"] = 0
+                option["outbound"]["arrival_time"] = f"2026-06-01T{12 + i % 10:02d}:{i % 60:02d}:00"
+    assert builder(raw) == _validated(raw)
+
+
+def test_parity_prescored_options_are_not_rescored(payload, builder):
+    raw = payload(3, stays=1, options_per_section=20)
+    for i, option in enumerate(raw["sections"][0]["data"]["options"]):
+        option["scores"]["preference_score"] = 0.1 + (i % 7) / 10
+    assert builder(raw) == _validated(raw)
+
+
+def test_stay_without_valid_hotel_is_skipped(payload, builder):
+    raw = payload(5, stays=2, options_per_section=5)
+    for option in raw["sections"][1]["data"]["hotel_options"]:
+        option["name"] = ""
+    built = builder(raw)
+    assert built == _validated(raw)
+    assert [s["type"] for s in built["sections"]] == ["flight", "stay", "flight"]
+
@@ -0,0 +1,76 @@
+"""
+Conformance checks for the protobuf schema generated from the Pydantic models.
+Run from the repository root: python -m pytest apps/package_builder/test_proto_conformance.py
+"""
+
+import random
+
+import pytest
+from pydantic import BaseModel
+
+from shared import protobuf_codec
+from shared.data_types import generate_protos
+from shared.data_types.models import (
+    ActivityOption, FinalStayOption, FinalTripLayout, FinalTripSection, FlightOption, HotelOption,
+    Location, SectionType, TransportMode, TransportOption, TripRequest,
+)
+from shared.data_types.proto_schema import PROTO_FILES
+from apps.package_builder.data_loader import get_full_packet, get_hotels, get_hotels2
+from apps.package_builder.large_scale_test import PayloadShape, build_trip_request
+from apps.package_builder.sample import get_activities, get_flights, get_flights2
+
+LISTED_MODELS = [cls for _, types in PROTO_FILES.values() for cls in types if issubclass(cls, BaseModel)]
+
+
+def _round_trip(model: BaseModel) -> BaseModel:
+    return protobuf_codec.decode(protobuf_codec.encode(model), type(model))
+
+
+def test_generated_protos_are_up_to_date():
+    assert generate_protos.stale_files(generate_protos.render_all()) == []
+
+
+def test_every_listed_model_has_a_message():
+    for cls in LISTED_MODELS:
+        assert protobuf_codec.message_for(cls).DESCRIPTOR.name == cls.__name__
+
+
+@pytest.mark.parametrize("cls", [cls for cls in LISTED_MODELS if not any(f.is_required() for f in cls.model_fields.values())],
+                         ids=lambda cls: cls.__name__)
+def test_default_instances_round_trip(cls):
+    model = cls()
+    assert _round_trip(model) == model
+
+
+def test_sample_options_round_trip():
+    flights = [FlightOption(**{k: v for k, v in f.items() if k != "return"}) for f in get_flights() + get_flights2()]
+    hotels = [HotelOption(**h) for h in get_hotels() + get_hotels2()]
+    activities = [ActivityOption(**a) for a in get_activities()]
+    for model in flights + hotels + activities:
+        assert _round_trip(model) == model
+
+
+def test_sample_packet_round_trips():
+    packet = get_full_packet()
+    assert _round_trip(packet) == packet
+
+
+def test_trip_request_round_trips():
+    random.seed(3)
+    request = build_trip_request(PayloadShape(stays=2, options_per_section=5, activities_per_stay=2))
+    assert isinstance(request, TripRequest)
+    assert _round_trip(request) == request
+
+
+def test_final_layout_sections_round_trip():
+    packet = get_full_packet()
+    flight = packet.sections[0].data.options[0]
+    stay = packet.sections[1].data
+    layout = FinalTripLayout(sections=[
+        FinalTripSection(type=SectionType.FLIGHT, data=flight),
+        FinalTripSection(type=SectionType.STAY, data=FinalStayOption(hotel=stay.hotel_options[0], activities=stay.activity_options)),
+        FinalTripSection(type=SectionType.TRANSFER, data=TransportOption(
+            id="t1", mode=TransportMode.TAXI, origin=Location(city="London"), destination=Location(city="Manchester"),
+        )),
+    ])
+    assert _round_trip(layout) == layout
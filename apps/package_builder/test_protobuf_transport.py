@@ -0,0 +1,42 @@
+"""
+Checks for the opt-in protobuf transport of /api/build-package.
+Run from the repository root: python -m pytest apps/package_builder/test_protobuf_transport.py
+"""
+
+import random
+
+from fastapi.testclient import TestClient
+
+from shared import protobuf_codec
+from shared.data_types.models import FinalTripLayout, TripResponse
+from shared.serialization import dumps
+from apps.package_builder.large_scale_test import PayloadShape, build_trip_response
+from apps.package_builder.main import app
+
+PROTOBUF = protobuf_codec.PROTOBUF_MEDIA_TYPE
+
+
+def _trip(seed=7):
+    random.seed(seed)
+    return build_trip_response(PayloadShape(stays=2, options_per_section=20, activities_per_stay=3))
+
+
+def test_trip_response_round_trip():
+    trip = _trip()
+    assert protobuf_codec.decode(protobuf_codec.encode(trip), TripResponse) == trip
+
+
+def test_build_package_protobuf_matches_json():
+    client = TestClient(app)
+    trip = _trip()
+
+    as_json = client.post("/api/build-package", content=dumps(trip), headers={"Content-Type": "application/json"})
+    as_protobuf = client.post(
+        "/api/build-package",
+        content=protobuf_codec.encode(trip),
+        headers={"Content-Type": PROTOBUF, "Accept": PROTOBUF},
+    )
+
+    assert as_protobuf.status_code == 200
+    assert as_protobuf.headers["content-type"] == PROTOBUF
+    assert protobuf_codec.decode(as_protobuf.content, FinalTripLayout) == FinalTripLayout.model_validate_json(as_json.content)
@@ -0,0 +1,79 @@
+"""
+Checks for SearchResultFrame and the column-wise scores computed on it.
+Run from the repository root: python -m pytest apps/package_builder/test_result_frame.py
+"""
+
+import random
+
+import numpy as np
+
+from shared.data_types.models import ActivityOption, FlightOption, HotelOption
+from shared.data_types.result_frame import SearchResultFrame
+from apps.package_builder.large_scale_test import generate_activities, generate_flights, generate_hotels
+from apps.package_builder.score_algorithms import set_activity_scores, set_flight_scores, set_hotel_scores
+from apps.package_builder.score_views import FRAME_SCORES, select_best_in_frame
+
+CURRENCIES = ["USD", "EUR", "GBP", "JPY"]
+
+
+def _options(seed=4, count=300):
+    random.seed(seed)
+    flights = generate_flights(count, "entry", CURRENCIES)
+    for i, flight in enumerate(flights[::7]):
+        flight.outbound.duration_minutes = 0
+        flight.outbound.arrival_time = f"2026-06-01T{12 + i % 10:02d}:{i % 60:02d}:00"
+    return {
+        FlightOption: (flights, set_flight_scores),
+        HotelOption: (generate_hotels(count, "London", CURRENCIES), set_hotel_scores),
+        ActivityOption: (generate_activities(count, "London", CURRENCIES), set_activity_scores),
+    }
+
+
+def test_rows_materialize_lazily_into_equal_models():
+    flights = generate_flights(20, "entry")
+    frame = SearchResultFrame.from_options(FlightOption, [f.model_dump(mode="json") for f in flights])
+    assert len(frame) == 20
+    assert frame.to_models() == flights
+    assert frame.strings("id") == [f.id for f in flights]
+    assert frame["price"].tolist() == [f.price_per_person.amount for f in flights]
+
+
+def test_filter_and_take_keep_rows_aligned():
+    random.seed(1)
+    hotels = generate_hotels(50, "London", CURRENCIES)
+    frame = SearchResultFrame.from_options(HotelOption, hotels)
+
+    eur = frame.filter(frame["currency"] == frame.code("currency", "EUR"))
+    assert eur.to_models() == [h for h in hotels if h.price_per_night.currency == "EUR"]
+    assert frame.code("currency", "CHF") == -1
+
+    reordered = frame.take([3, 0])
+    assert reordered.strings("id") == [hotels[3].id, hotels[0].id]
+    assert reordered.row(1) == hotels[0]
+    assert reordered.tables is frame.tables
+
+
+def test_frame_scores_match_model_scores():
+    for model_cls, (options, set_scores) in _options().items():
+        frame = SearchResultFrame.from_options(model_cls, options)
+        price_scores, preference_scores = FRAME_SCORES[model_cls](frame)
+        for i, option in enumerate(options):
+            set_scores(option)
+            assert (price_scores[i], preference_scores[i]) == (option.scores.price_score, option.scores.preference_score)
+
+
+def test_select_best_in_frame_matches_max():
+    for model_cls, (options, set_scores) in _options(seed=9).items():
+        frame = SearchResultFrame.from_options(model_cls, options)
+        index, scores = select_best_in_frame(frame)
+        for option in options:
+            set_scores(option)
+        best = max(options, key=lambda option: option.scores.preference_score)
+        assert options[index] is best
+        assert scores == (best.scores.price_score, best.scores.preference_score)
+
+        # Pre-scored options are compared as received
+        rescored = SearchResultFrame.from_options(model_cls, options)
+        assert select_best_in_frame(rescored) == (index, None)
+
+    assert select_best_in_frame(SearchResultFrame.from_options(HotelOption, [])) is None
@@ -0,0 +1,31 @@
+"""
+Checks for score views and build_package_from_raw (score views, winners
+validated); its parity with build_package is in test_builder_parity.py.
+Run from the repository root: python -m pytest apps/package_builder/test_score_views.py
+"""
+
+import random
+
+from shared.data_types.models import ActivityOption
+from apps.package_builder.large_scale_test import generate_activities
+from apps.package_builder.packages_builder import build_package_from_raw
+from apps.package_builder.score_algorithms import set_activity_scores
+from apps.package_builder.score_views import ActivityScoreView, FlightScoreView, select_best, views_of
+
+
+def test_losing_options_are_not_validated(payload):
+    raw = payload(3, stays=1, options_per_section=10)
+    flights = raw["sections"][0]["data"]["options"]
+    best, _ = select_best(views_of(FlightScoreView, flights))
+    loser = next(option for i, option in enumerate(flights) if i != best.index)
+    loser["outbound"]["origin"] = "not a location"
+    assert build_package_from_raw(raw).sections[0].data.id == best.id
+
+
+def test_activity_view_scores_match_model_scores():
+    random.seed(2)
+    activities = [a.model_dump(mode="json") for a in generate_activities(20, "London")]
+    for i, raw in enumerate(activities):
+        model = ActivityOption.model_validate(raw)
+        set_activity_scores(model)
+        assert ActivityScoreView.from_raw(i, raw).score_values() == (model.scores.price_score, model.scores.preference_score)
@@ -0,0 +1,89 @@
+"""
+Chunking, field order and memory checks for the streaming build-package
+parser; its parity with build_package is in test_builder_parity.py.
+Run from the repository root: python -m pytest apps/package_builder/test_streaming_builder.py
+"""
+
+import tracemalloc
+
+import orjson
+from fastapi.testclient import TestClient
+
+from shared.data_types.models import FinalTripLayout, TripResponse
+from apps.package_builder import main
+from apps.package_builder.packages_builder import build_package
+from apps.package_builder.streaming_builder import StreamingPackageBuilder
+from apps.package_builder.trusted_builder import build_package_trusted
+
+
+def _streamed(body: bytes, chunk_size: int = 4096):
+    builder = StreamingPackageBuilder()
+    for start in range(0, len(body), chunk_size):
+        builder.feed(body[start:start + chunk_size])
+    return builder.close()
+
+
+def _type_last(raw):
+    return {"sections": [{"data": s["data"], "type": s["type"]} for s in raw["sections"]]}
+
+
+def test_chunk_boundaries_do_not_matter(payload):
+    body = orjson.dumps(payload(7, stays=2, options_per_section=100, activities_per_stay=4))
+    expected = build_package_trusted(orjson.loads(body))
+    assert _streamed(body, chunk_size=7) == expected
+    assert _streamed(body, chunk_size=len(body)) == expected
+
+
+def test_section_type_after_data(payload):
+    raw = payload(11, stays=2, options_per_section=30, activities_per_stay=2)
+    raw["sections"].insert(1, {"type": "transfer", "data": {"options": [{"id": "t1", "mode": 2}, {"id": "t2"}]}})
+    reordered = _type_last(raw)
+    assert list(reordered["sections"][0]) == ["data", "type"]
+    assert _streamed(orjson.dumps(reordered)) == build_package_trusted(raw)
+
+
+def _peak_memory(payload, options_per_section):
+    body = orjson.dumps(payload(5, stays=1, options_per_section=options_per_section))
+    tracemalloc.start()
+    try:
+        _streamed(body, chunk_size=64 * 1024)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, len(body)
+
+
+def test_memory_stays_flat(payload):
+    small_peak, _ = _peak_memory(payload, 500)
+    large_peak, large_body = _peak_memory(payload, 4000)
+    # Bounded by the chunk being parsed, not by the body
+    assert large_peak < small_peak * 1.5
+    assert large_peak < large_body / 5
+
+
+def test_endpoint_streams_for_selected_validation(monkeypatch, payload):
+    monkeypatch.setattr(main, "PACKAGE_STREAMING_PARSE", True)
+    monkeypatch.setattr(main, "PACKAGE_VALIDATION_MODE", "selected")
+    raw = payload(9, stays=2, options_per_section=50, activities_per_stay=3)
+    body = orjson.dumps(_type_last(raw))
+    expected = build_package(TripResponse.model_validate(raw)).model_dump(mode="json")
+
+    streamed = []
+    real_streaming = main.build_package_streaming
+
+    async def recording(chunks):
+        streamed.append(True)
+        return await real_streaming(chunks)
+
+    monkeypatch.setattr(main, "build_package_streaming", recording)
+    client = TestClient(main.app)
+
+    # Bodies under PACKAGE_STREAMING_MIN_BYTES are parsed whole
+    monkeypatch.setattr(main, "PACKAGE_STREAMING_MIN_BYTES", len(body) + 1)
+    response = client.post("/api/build-package", content=body)
+    assert response.status_code == 200 and not streamed
+
+    monkeypatch.setattr(main, "PACKAGE_STREAMING_MIN_BYTES", len(body))
+    response = client.post("/api/build-package", content=body)
+    assert response.status_code == 200 and streamed
+    assert FinalTripLayout.model_validate_json(response.content).model_dump(mode="json") == expected
@@ -0,0 +1,14 @@
+"""
+Checks for the trusted fast path; its parity with build_package is in
+test_builder_parity.py.
+Run from the repository root: python -m pytest apps/package_builder/test_trusted_builder.py
+"""
+
+from apps.package_builder.trusted_builder import build_package_trusted
+
+
+def test_selected_options_are_caller_dicts(payload):
+    raw = payload(9, stays=1, options_per_section=10, activities_per_stay=3)
+    result = build_package_trusted(raw)
+    activities = raw["sections"][1]["data"]["activity_options"]
+    assert result["sections"][1]["data"]["activities"][0] is activities[0]
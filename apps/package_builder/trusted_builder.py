@@ -0,0 +1,66 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from .score_views import FlightScoreView, HotelScoreView, scores_dict, select_best, views_of
+from shared.data_types.models import SectionType
+
+logger = logging.getLogger(__name__)
+
+# Same selection rules as build_package, but over the raw JSON dicts sent by
+# trip_builder. Only the handful of fields scoring needs are read, and the
+# chosen options are returned as the caller's own dicts (plus their scores),
+# so no Pydantic models are built for the thousands of losing options.
+
+MAX_ACTIVITIES = 5
+
+
+def _select_best(options: List[Dict[str, Any]], view_cls) -> Optional[Dict[str, Any]]:
+    """The winning caller dict; rescored options carry their new scores."""
+    selected = select_best(views_of(view_cls, options))
+    if selected is None:
+        return None
+    view, scores = selected
+    if scores is None:
+        return options[view.index]
+    return {**options[view.index], "scores": scores_dict(*scores)}
+
+
+def build_package_trusted(trip: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fast-path equivalent of build_package for trusted internal payloads.
+    Takes and returns plain dicts shaped like TripResponse / FinalTripLayout.
+    """
+    sections: List[Dict[str, Any]] = []
+
+    for section in trip.get("sections") or []:
+        section_type = section.get("type")
+        data = section.get("data") or {}
+
+        if section_type == SectionType.FLIGHT.value:
+            best_flight = _select_best(data.get("options") or [], FlightScoreView)
+            if best_flight:
+                sections.append({"type": SectionType.FLIGHT.value, "data": best_flight})
+
+        elif section_type == SectionType.STAY.value:
+            best_hotel = _select_best(data.get("hotel_options") or [], HotelScoreView)
+
+            # Skip this stay section entirely if no hotel is available
+            if not best_hotel or not best_hotel.get("id") or not best_hotel.get("name"):
+                logger.info("Skipping stay section - no valid hotel available")
+                continue
+
+            sections.append({
+                "type": SectionType.STAY.value,
+                "data": {
+                    "hotel": best_hotel,
+                    "activities": (data.get("activity_options") or [])[:MAX_ACTIVITIES],
+                },
+            })
+
+        elif section_type == SectionType.TRANSFER.value:
+            options = data.get("options") or []
+            if options:
+                # Transfer scoring to be implemented
+                sections.append({"type": SectionType.TRANSFER.value, "data": options[0]})
+
+    return {"sections": sections}
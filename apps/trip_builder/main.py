@@ -1,5 +1,9 @@
 from fastapi import FastAPI, Request
 from shared.data_types.models import *
+from shared.serialization import ORJSONResponse, dumps
+from shared import protobuf_codec
+from shared.protobuf_codec import PROTOBUF_MEDIA_TYPE
+from shared.data_types import flight_pb2
 import os
 import logging
 import time
@@ -16,13 +20,24 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 HOTEL_REQUEST_API = os.getenv("HOTEL_REQUEST_API", "http://localhost:8000/api/hotels/search")
 FLIGHT_REQUEST_API = os.getenv("FLIGHT_REQUEST_API", "http://localhost:8000/api/flights/search")
 TRANSFER_REQUEST_API = os.getenv("TRANSFER_REQUEST_API", "http://localhost:8000/api/transport/search")
 ACTIVITY_REQUEST_API = os.getenv("ACTIVITY_REQUEST_API", "http://localhost:8000/api/activities/search")
 PACKAGE_BUILDER_API = os.getenv("PACKAGE_BUILDER_API", "http://localhost:8000/api/build-package")
+# When set, activities are read from llm_retriever's NDJSON stream and whatever
+# arrived by the deadline is used, instead of waiting for the full generation
+ACTIVITY_STREAM_API = os.getenv("ACTIVITY_STREAM_API", "")
+ACTIVITY_STREAM_DEADLINE_SECONDS = float(os.getenv("ACTIVITY_STREAM_DEADLINE_SECONDS", "20"))
+# Shared with package_builder; lets it skip re-validating our payload
+INTERNAL_CALLER_TOKEN = os.getenv("INTERNAL_CALLER_TOKEN", "")
+# "json" (default) or "protobuf": wire format asked of the hotel/flight search
+# services and used with package_builder. Services that only speak JSON keep
+# answering in JSON, which is still accepted.
+INTERNAL_WIRE_FORMAT = os.getenv("INTERNAL_WIRE_FORMAT", "json")
+USE_PROTOBUF = INTERNAL_WIRE_FORMAT == "protobuf"
 
 @app.get("/")
 def read_root():
@@ -37,33 +52,70 @@ async def log_requests(request: Request, call_next):
     logger.info(f"Handled {request.method} {request.url.path} in {duration:.4f} seconds")
     return response
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+PROTOBUF_HEADERS = {"Content-Type": PROTOBUF_MEDIA_TYPE}
+ACCEPT_HEADERS = {"Accept": f"{PROTOBUF_MEDIA_TYPE}, application/json;q=0.9"} if USE_PROTOBUF else {}
+
+async def post_json(client: httpx.AsyncClient, url: str, body: BaseModel, headers: Optional[dict] = None) -> httpx.Response:
+    """POST a model encoded with orjson instead of httpx's stdlib json encoding."""
+    response = await client.post(url, content=dumps(body), headers={**JSON_HEADERS, **(headers or {})})
+    response.raise_for_status()
+    return response
+
+async def post_protobuf(client: httpx.AsyncClient, url: str, body: BaseModel, headers: Optional[dict] = None) -> httpx.Response:
+    response = await client.post(url, content=protobuf_codec.encode(body), headers={**PROTOBUF_HEADERS, **(headers or {})})
+    response.raise_for_status()
+    return response
+
+def parse_response(response: httpx.Response, model_cls, message_cls=None):
+    """Decode a JSON or protobuf response body, whichever the service sent."""
+    if response.headers.get("content-type", "").startswith(PROTOBUF_MEDIA_TYPE):
+        return protobuf_codec.decode(response.content, model_cls, message_cls)
+    return model_cls.model_validate_json(response.content)
+
 async def flight_search(request: FlightRequest, client: httpx.AsyncClient) -> FlightResponse:
     try:
-        response = await client.post(FLIGHT_REQUEST_API, json=request.model_dump())
-        response.raise_for_status()
-        return FlightResponse.model_validate(response.json())
+        response = await post_json(client, FLIGHT_REQUEST_API, request, headers=ACCEPT_HEADERS)
+        return parse_response(response, FlightResponse, flight_pb2.FlightSearchResponse)
     except Exception as e:
         logger.info(f"Flight search failed: {type(e).__name__}: {e}")
         return FlightResponse()
 
 async def transfer_search(request: TransferRequest, client: httpx.AsyncClient) -> TransferResponse:
     try:
-        response = await client.post(TRANSFER_REQUEST_API, json=request.model_dump())
-        response.raise_for_status()
-        return TransferResponse.model_validate(response.json())
+        response = await post_json(client, TRANSFER_REQUEST_API, request)
+        return TransferResponse.model_validate_json(response.content)
     except Exception as e:
         logger.info(f"Transfer search failed: {type(e).__name__}: {e}")
         return TransferResponse()
 
+async def stream_activities(request: ActivitySearchRequest, client: httpx.AsyncClient) -> ActivitySearchResponse:
+    """Collect streamed activities until the stream ends or the deadline passes, keeping partial results."""
+    options: List[ActivityOption] = []
+
+    async def consume():
+        async with client.stream("POST", ACTIVITY_STREAM_API, content=dumps(request), headers=JSON_HEADERS) as res:
+            res.raise_for_status()
+            async for line in res.aiter_lines():
+                if line.strip():
+                    options.append(ActivityOption.model_validate_json(line))
+
+    try:
+        await asyncio.wait_for(consume(), timeout=ACTIVITY_STREAM_DEADLINE_SECONDS)
+    except asyncio.TimeoutError:
+        logger.info(f"Activity stream deadline reached, using {len(options)} activities")
+    except Exception as e:
+        logger.info(f"Activity stream failed after {len(options)} activities: {type(e).__name__}: {e}")
+    return ActivitySearchResponse(options=options)
+
 async def stay_search(request: StayRequest, client: httpx.AsyncClient) -> StayResponse:
     # Execute hotel and activity searches in parallel
     
     async def get_hotels():
         try:
             logger.info(f"Searching hotels in {request.hotel_request.location.city}...")
-            res = await client.post(HOTEL_REQUEST_API, json=request.hotel_request.model_dump())
-            res.raise_for_status()
-            result = HotelSearchResponse.model_validate(res.json())
+            res = await post_json(client, HOTEL_REQUEST_API, request.hotel_request, headers=ACCEPT_HEADERS)
+            result = parse_response(res, HotelSearchResponse)
             logger.info(f"Hotel search returned {len(result.options)} hotels for {request.hotel_request.location.city}")
             return result
         except Exception as e:
@@ -71,11 +123,13 @@ async def stay_search(request: StayRequest, client: httpx.AsyncClient) -> StayRe
             return HotelSearchResponse()
 
     async def get_activities():
+        if ACTIVITY_STREAM_API:
+            result = await stream_activities(request.activity_request, client)
+            logger.info(f"Activity stream returned {len(result.options)} activities")
+            return result
         try:
-            res = await client.post(ACTIVITY_REQUEST_API, json=request.activity_request.model_dump())
-            res.raise_for_status()
-            data = res.json()
-            result = ActivitySearchResponse.model_validate(data)
+            res = await post_json(client, ACTIVITY_REQUEST_API, request.activity_request)
+            result = ActivitySearchResponse.model_validate_json(res.content)
             logger.info(f"Activity search returned {len(result.options)} activities")
             return result
         except Exception as e:
@@ -124,9 +178,12 @@ async def process_sections(request: TripRequest) -> TripResponse:
 
 async def build_package(trip_response: TripResponse) -> FinalTripLayout:
     async with httpx.AsyncClient(timeout=httpx.Timeout(120.0)) as client:
-        res = await client.post(PACKAGE_BUILDER_API, json=trip_response.model_dump())
-        res.raise_for_status()
-        return FinalTripLayout.model_validate(res.json())
+        headers = {"X-Internal-Caller": INTERNAL_CALLER_TOKEN} if INTERNAL_CALLER_TOKEN else {}
+        if USE_PROTOBUF:
+            res = await post_protobuf(client, PACKAGE_BUILDER_API, trip_response, headers={**ACCEPT_HEADERS, **headers})
+        else:
+            res = await post_json(client, PACKAGE_BUILDER_API, trip_response, headers=headers)
+        return parse_response(res, FinalTripLayout)
 
 @app.post("/api/create_trip", response_model=FinalTripLayout)
 async def create_trip(
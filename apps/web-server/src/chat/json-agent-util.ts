@@ -33,6 +33,8 @@ export interface EditTripPlansRequest {
 export interface EditTripPlansResponse {
   plans: TripPlan[];
   modified_indices: number[];
+  // Built only for the modified plans, keyed by plan index
+  trip_requests?: Record<string, TripRequest>;
 }
 
 /**
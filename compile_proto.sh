@@ -1,2 +1,3 @@
 #!/bin/bash
-ls shared/data_types/*.proto | xargs -I {} protoc --proto_path=. --python_out=. {}
\ No newline at end of file
+# Regenerates shared/data_types/*.proto from the Pydantic models and compiles them
+python -m shared.data_types.generate_protos "$@"
@@ -0,0 +1,164 @@
+"""
+Country name / code resolution shared by the services.
+
+shared/metadata/countries.json is read once at import into a dict keyed by
+normalized name, so resolving "Italy", "ITA", "south korea" or "Côte d'Ivoire"
+is a dict lookup. Normalization (NFKD, accent stripping, punctuation folding)
+is memoized because the same handful of countries is resolved over and over.
+"""
+
+import json
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+COUNTRIES_PATH = Path(__file__).resolve().parent / "metadata" / "countries.json"
+
+# Common and colloquial names not covered by the ISO short names, by ISO-2 code
+COUNTRY_ALIASES: Dict[str, tuple] = {
+    "US": ("USA", "U.S.", "U.S.A.", "United States of America", "America"),
+    "GB": ("UK", "U.K.", "Great Britain", "Britain", "England", "Scotland", "Wales", "Northern Ireland"),
+    "AE": ("UAE", "Emirates"),
+    "KR": ("South Korea", "Republic of Korea"),
+    "KP": ("North Korea",),
+    "RU": ("Russia",),
+    "CZ": ("Czech Republic",),
+    "VN": ("Vietnam",),
+    "IR": ("Iran",),
+    "SY": ("Syria",),
+    "LA": ("Laos",),
+    "MD": ("Moldova",),
+    "TZ": ("Tanzania",),
+    "TW": ("Taiwan",),
+    "BO": ("Bolivia",),
+    "VE": ("Venezuela",),
+    "MK": ("Macedonia",),
+    "SZ": ("Swaziland",),
+    "CI": ("Ivory Coast", "Cote d'Ivoire"),
+    "CV": ("Cabo Verde",),
+    "VA": ("Vatican", "Vatican City", "Holy See"),
+    "PS": ("Palestine",),
+    "TR": ("Turkiye", "Türkiye"),
+    "BN": ("Brunei",),
+    "FM": ("Micronesia",),
+    "MM": ("Burma",),
+    "CD": ("DR Congo", "DRC", "Democratic Republic of the Congo"),
+    "CG": ("Republic of the Congo",),
+    "NL": ("Holland",),
+    "MO": ("Macau",),
+    "FK": ("Falkland Islands",),
+    "VG": ("British Virgin Islands",),
+    "VI": ("US Virgin Islands",),
+}
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_PARENTHETICAL_RE = re.compile(r"\s*\(.*?\)")
+
+
+class Country(NamedTuple):
+    name: str
+    iso2: str
+    iso3: str
+
+
+@lru_cache(maxsize=4096)
+def normalize_country_key(value: str) -> str:
+    """Lowercase, strip accents and fold punctuation/whitespace to single spaces."""
+    normalized = unicodedata.normalize("NFKD", value)
+    normalized = "".join(char for char in normalized if not unicodedata.combining(char))
+    return " ".join(_NON_ALNUM_RE.sub(" ", normalized.lower()).split())
+
+
+def _load_countries() -> Dict[str, Country]:
+    try:
+        items = json.loads(COUNTRIES_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    by_iso2: Dict[str, Country] = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        name = str(item.get("name") or "").strip()
+        code = str(item.get("code") or "").strip().upper()
+        if name and code:
+            by_iso2[code] = Country(name, code, str(item.get("alpha3") or "").strip().upper())
+    return by_iso2
+
+
+def _build_name_index(by_iso2: Dict[str, Country]) -> Dict[str, Country]:
+    index: Dict[str, Country] = {}
+
+    def add(name: str, country: Country):
+        key = normalize_country_key(name)
+        if key:
+            index.setdefault(key, country)
+
+    for country in by_iso2.values():
+        add(country.name, country)
+        # "Holy See (Vatican City State)" -> "Holy See"
+        add(_PARENTHETICAL_RE.sub("", country.name), country)
+        # "Korea, Republic of" -> "Republic of Korea"
+        head, sep, tail = country.name.partition(", ")
+        if sep:
+            add(f"{tail} {head}", country)
+
+    for code, aliases in COUNTRY_ALIASES.items():
+        if code in by_iso2:
+            for alias in aliases:
+                add(alias, by_iso2[code])
+    return index
+
+
+COUNTRIES_BY_ISO2: Dict[str, Country] = _load_countries()
+COUNTRIES_BY_ISO3: Dict[str, Country] = {c.iso3: c for c in COUNTRIES_BY_ISO2.values() if c.iso3}
+_COUNTRIES_BY_NAME: Dict[str, Country] = _build_name_index(COUNTRIES_BY_ISO2)
+
+
+def lookup_country(value: Optional[str]) -> Optional[Country]:
+    """Resolve an ISO-2 / ISO-3 code or a (common) country name, else None."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not value:
+        return None
+
+    if len(value) <= 3 and value.isascii() and value.isalpha():
+        upper = value.upper()
+        country = COUNTRIES_BY_ISO2.get(upper) or COUNTRIES_BY_ISO3.get(upper)
+        if country:
+            return country
+
+    return _COUNTRIES_BY_NAME.get(normalize_country_key(value))
+
+
+def normalize_country_to_iso2(country: str) -> str:
+    """
+    ISO-2 code for a country name or code. Unknown two-letter input is
+    upper-cased as is; anything else unresolvable is returned stripped but
+    otherwise unchanged.
+    """
+    if not isinstance(country, str):
+        return ""
+
+    country = country.strip()
+    resolved = lookup_country(country)
+    if resolved:
+        return resolved.iso2
+    if len(country) == 2 and country.isascii() and country.isalpha():
+        return country.upper()
+    return country
+
+
+def country_to_iso3(country: str) -> str:
+    resolved = lookup_country(country)
+    return resolved.iso3 if resolved else ""
+
+
+def country_name(country: str) -> str:
+    resolved = lookup_country(country)
+    return resolved.name if resolved else ""
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: shared/data_types/activity.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from shared.data_types import common_pb2 as shared_dot_data__types_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n shared/data_types/activity.proto\x12\x11vacation.activity\x1a\x1eshared/data_types/common.proto\"\xb2\x02\n\x15\x41\x63tivitySearchRequest\x12+\n\x08location\x18\x01 \x01(\x0b\x32\x19.vacation.common.Location\x12)\n\x05\x64\x61tes\x18\x02 \x01(\x0b\x32\x1a.vacation.common.DateRange\x12\x13\n\x0b\x64\x65scription\x18\n \x01(\t\x12\x13\n\x0bmax_results\x18\x05 \x01(\x05\x12\x11\n\tmax_price\x18\x06 \x01(\x01\x12\x12\n\nmin_rating\x18\x07 \x01(\x01\x12\x17\n\x0fmax_distance_km\x18\x08 \x01(\x05\x12\x32\n\x0epreferred_time\x18\t \x01(\x0b\x32\x1a.vacation.common.TimeRangeJ\x04\x08\x03\x10\x04J\x04\x08\x04\x10\x05R\ncategoriesR\x0bpreferences\"\x7f\n\x16\x41\x63tivitySearchResponse\x12\x32\n\x07options\x18\x01 \x03(\x0b\x32!.vacation.activity.ActivityOption\x12\x31\n\x08metadata\x18\x02 \x01(\x0b\x32\x1f.vacation.common.SearchMetadata\"\xf3\x05\n\x0e\x41\x63tivityOption\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x35\n\x08\x63\x61tegory\x18\x04 \x01(\x0e\x32#.vacation.activity.ActivityCategory\x12+\n\x08location\x18\x05 \x01(\x0b\x32\x19.vacation.common.Location\x12\x1e\n\x16\x64istance_from_query_km\x18\x06 \x01(\x01\x12\x0e\n\x06rating\x18\x07 \x01(\x01\x12\x14\n\x0creview_count\x18\x08 \x01(\x05\x12\x30\n\x10price_per_person\x18\t \x01(\x0b\x32\x16.vacation.common.Money\x12\x36\n\rprice_details\x18\n \x01(\x0b\x32\x1f.vacation.activity.PriceDetails\x12\x18\n\x10\x64uration_minutes\x18\x0b \x01(\x05\x12\x34\n\x0f\x61vailable_times\x18\x0c \x03(\x0b\x32\x1b.vacation.activity.TimeSlot\x12\x12\n\nhighlights\x18\r \x03(\t\x12\x10\n\x08included\x18\x0e \x03(\t\x12\x10\n\x08\x65xcluded\x18\x0f \x03(\t\x12\x18\n\x10min_participants\x18\x10 \x01(\x05\x12\x18\n\x10max_participants\x18\x11 \x01(\x05\x12\x18\n\x10\x64ifficulty_level\x18\x12 \x01(\t\x12\x14\n\x0chotel_pickup\x18\x13 \x01(\x08\x12\x15\n\rmeal_included\x18\x14 \x01(\x08\x12\x1b\n\x13\x63\x61ncellation_policy\x18\x15 \x01(\t\x12\x30\n\x06scores\x18\x16 \x01(\x0b\x32 .vacation.common.ComponentScores\x12\x13\n\x0b\x62ooking_url\x18\x17 \x01(\t\x12\x10\n\x08provider\x18\x18 \x01(\t\x12\x11\n\tavailable\x18\x19 \x01(\x08\x12\x12\n\nimage_urls\x18\x1a \x03(\t\"\x96\x01\n\x0cPriceDetails\x12+\n\x0b\x61\x64ult_price\x18\x01 \x01(\x0b\x32\x16.vacation.common.Money\x12+\n\x0b\x63hild_price\x18\x02 \x01(\x0b\x32\x16.vacation.common.Money\x12,\n\x0csenior_price\x18\x03 \x01(\x0b\x32\x16.vacation.common.Money\"?\n\x08TimeSlot\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x0c\n\x04time\x18\x02 \x01(\t\x12\x17\n\x0f\x61vailable_spots\x18\x03 \x01(\x05*\xc9\x01\n\x10\x41\x63tivityCategory\x12\x14\n\x10\x43\x41TEGORY_UNKNOWN\x10\x00\x12\x08\n\x04TOUR\x10\x01\x12\n\n\x06MUSEUM\x10\x02\x12\x0e\n\nRESTAURANT\x10\x03\x12\x08\n\x04SHOW\x10\x04\x12\x0b\n\x07OUTDOOR\x10\x05\x12\x10\n\x0cWATER_SPORTS\x10\x06\x12\r\n\tNIGHTLIFE\x10\x07\x12\x0c\n\x08SHOPPING\x10\x08\x12\x07\n\x03SPA\x10\t\x12\r\n\tADVENTURE\x10\n\x12\x0c\n\x08\x43ULTURAL\x10\x0b\x12\r\n\tFOOD_TOUR\x10\x0c\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'shared.data_types.activity_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _ACTIVITYCATEGORY._serialized_start=1502
+  _ACTIVITYCATEGORY._serialized_end=1703
+  _ACTIVITYSEARCHREQUEST._serialized_start=88
+  _ACTIVITYSEARCHREQUEST._serialized_end=394
+  _ACTIVITYSEARCHRESPONSE._serialized_start=396
+  _ACTIVITYSEARCHRESPONSE._serialized_end=523
+  _ACTIVITYOPTION._serialized_start=526
+  _ACTIVITYOPTION._serialized_end=1281
+  _PRICEDETAILS._serialized_start=1284
+  _PRICEDETAILS._serialized_end=1434
+  _TIMESLOT._serialized_start=1436
+  _TIMESLOT._serialized_end=1499
+# @@protoc_insertion_point(module_scope)
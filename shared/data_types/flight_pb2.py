@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: shared/data_types/flight.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from shared.data_types import common_pb2 as shared_dot_data__types_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1eshared/data_types/flight.proto\x12\x0fvacation.flight\x1a\x1eshared/data_types/common.proto\"\xb7\x02\n\x13\x46lightSearchRequest\x12)\n\x06origin\x18\x01 \x01(\x0b\x32\x19.vacation.common.Location\x12.\n\x0b\x64\x65stination\x18\x02 \x01(\x0b\x32\x19.vacation.common.Location\x12\x16\n\x0e\x64\x65parture_date\x18\x03 \x01(\t\x12\x13\n\x0breturn_date\x18\x04 \x01(\t\x12\x12\n\npassengers\x18\x05 \x01(\x05\x12\x13\n\x0b\x63\x61\x62in_class\x18\x06 \x01(\t\x12\x34\n\x0bpreferences\x18\x07 \x03(\x0e\x32\x1f.vacation.common.PreferenceType\x12\x13\n\x0bmax_results\x18\x08 \x01(\x05\x12\x11\n\tmax_price\x18\t \x01(\x01\x12\x11\n\tmax_stops\x18\n \x01(\x05\"y\n\x14\x46lightSearchResponse\x12.\n\x07options\x18\x01 \x03(\x0b\x32\x1d.vacation.flight.FlightOption\x12\x31\n\x08metadata\x18\x02 \x01(\x0b\x32\x1f.vacation.common.SearchMetadata\"\xa5\x02\n\x0c\x46lightOption\x12\n\n\x02id\x18\x01 \x01(\t\x12\x30\n\x08outbound\x18\x02 \x01(\x0b\x32\x1e.vacation.flight.FlightSegment\x12+\n\x0btotal_price\x18\x04 \x01(\x0b\x32\x16.vacation.common.Money\x12\x30\n\x10price_per_person\x18\x05 \x01(\x0b\x32\x16.vacation.common.Money\x12\x30\n\x06scores\x18\x06 \x01(\x0b\x32 .vacation.common.ComponentScores\x12\x13\n\x0b\x62ooking_url\x18\x07 \x01(\t\x12\x10\n\x08provider\x18\x08 \x01(\t\x12\x11\n\tavailable\x18\t \x01(\x08J\x04\x08\x03\x10\x04R\x06return\"\x9c\x03\n\rFlightSegment\x12)\n\x06origin\x18\x01 \x01(\x0b\x32\x19.vacation.common.Location\x12.\n\x0b\x64\x65stination\x18\x02 \x01(\x0b\x32\x19.vacation.common.Location\x12\x16\n\x0e\x64\x65parture_time\x18\x03 \x01(\t\x12\x14\n\x0c\x61rrival_time\x18\x04 \x01(\t\x12\x18\n\x10\x64uration_minutes\x18\x05 \x01(\x05\x12\r\n\x05stops\x18\x06 \x01(\x05\x12*\n\x08layovers\x18\x07 \x03(\x0b\x32\x18.vacation.flight.Layover\x12\x0f\n\x07\x61irline\x18\x08 \x01(\t\x12\x15\n\rflight_number\x18\t \x01(\t\x12\x10\n\x08\x61ircraft\x18\n \x01(\t\x12\x13\n\x0b\x63\x61\x62in_class\x18\x0b \x01(\t\x12/\n\tamenities\x18\x0c \x01(\x0b\x32\x1c.vacation.flight.AmenityInfo\x12-\n\x07luggage\x18\r \x01(\x0b\x32\x1c.vacation.flight.LuggageInfo\"\xda\x02\n\x07Layover\x12*\n\x07\x61irport\x18\x01 \x01(\x0b\x32\x19.vacation.common.Location\x12\x12\n\nstart_time\x18\x03 \x01(\t\x12\x10\n\x08\x65nd_time\x18\x04 \x01(\t\x12\x18\n\x10\x64uration_minutes\x18\x02 \x01(\x05\x12\x1d\n\x10\x61rrival_terminal\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x1f\n\x12\x64\x65parture_terminal\x18\x06 \x01(\tH\x01\x88\x01\x01\x12\x16\n\x0e\x61irline_before\x18\x07 \x01(\t\x12\x15\n\rairline_after\x18\x08 \x01(\t\x12\x19\n\x11is_airline_change\x18\t \x01(\x08\x12\x1a\n\x12is_terminal_change\x18\n \x01(\x08\x12\x11\n\tovernight\x18\x0b \x01(\x08\x42\x13\n\x11_arrival_terminalB\x15\n\x13_departure_terminal\"\x95\x01\n\x0bLuggageInfo\x12\x14\n\x0c\x63hecked_bags\x18\x01 \x01(\x05\x12\x1d\n\x15\x63hecked_bag_weight_kg\x18\x02 \x01(\x01\x12\x15\n\rcarry_on_bags\x18\x03 \x01(\x05\x12\x1a\n\x12\x63\x61rry_on_weight_kg\x18\x04 \x01(\x01\x12\x1e\n\x16\x63\x61rry_on_dimensions_cm\x18\x05 \x01(\t\"n\n\x0b\x41menityInfo\x12\x0c\n\x04wifi\x18\x01 \x01(\x08\x12\x0c\n\x04meal\x18\x02 \x01(\x08\x12\x15\n\rentertainment\x18\x03 \x01(\x08\x12\x14\n\x0cpower_outlet\x18\x04 \x01(\x08\x12\x16\n\x0elegroom_inches\x18\x05 \x01(\x05\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'shared.data_types.flight_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _FLIGHTSEARCHREQUEST._serialized_start=84
+  _FLIGHTSEARCHREQUEST._serialized_end=395
+  _FLIGHTSEARCHRESPONSE._serialized_start=397
+  _FLIGHTSEARCHRESPONSE._serialized_end=518
+  _FLIGHTOPTION._serialized_start=521
+  _FLIGHTOPTION._serialized_end=814
+  _FLIGHTSEGMENT._serialized_start=817
+  _FLIGHTSEGMENT._serialized_end=1229
+  _LAYOVER._serialized_start=1232
+  _LAYOVER._serialized_end=1578
+  _LUGGAGEINFO._serialized_start=1581
+  _LUGGAGEINFO._serialized_end=1730
+  _AMENITYINFO._serialized_start=1732
+  _AMENITYINFO._serialized_end=1842
+# @@protoc_insertion_point(module_scope)
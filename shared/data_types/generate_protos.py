@@ -0,0 +1,272 @@
+"""
+Generate shared/data_types/*.proto from the Pydantic models and compile them.
+
+models.py is the single source of truth; the .proto files and their
+`*_pb2.py` modules are generated from the models listed in proto_schema.py
+and are not edited by hand. Field numbers stay stable across runs: a field
+keeps the number it has in the current .proto, new fields take the next free
+number, and the numbers and names of removed fields are reserved.
+
+Type mapping: str -> string, int -> int32, float -> double, bool -> bool,
+IntEnum -> enum, str Enum -> string, List[X] -> repeated X, optional scalar
+-> proto3 optional, model -> message. A Union of models (a section's `data`)
+becomes a oneof whose members are named after the section type.
+
+Examples:
+    python -m shared.data_types.generate_protos              # write .proto files and compile them
+    python -m shared.data_types.generate_protos --check      # exit 1 if the .proto files are stale
+    python -m shared.data_types.generate_protos --no-compile
+"""
+
+import sys
+import os
+# Add the project root to sys.path so 'shared' can be imported without PYTHONPATH hacks
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import inspect
+import re
+import shutil
+import subprocess
+import types
+import typing
+from enum import Enum, IntEnum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+from shared.data_types.proto_schema import PROTO_FILES, SECTION_DATA, declared_type, proto_file_of
+
+ROOT = Path(__file__).resolve().parents[2]
+PROTO_DIR = Path(__file__).resolve().parent
+PROTO_IMPORT_PREFIX = "shared/data_types"
+
+HEADER = "// Generated from shared/data_types/models.py by generate_protos.py. DO NOT EDIT.\n"
+
+SCALARS = {str: "string", int: "int32", float: "double", bool: "bool"}
+
+_BLOCK_RE = re.compile(r"^\s*(message|enum|oneof)\s+(\w+)\s*\{")
+_FIELD_RE = re.compile(r"^\s*(?:optional\s+|repeated\s+)?[\w.]+\s+(\w+)\s*=\s*(\d+)\s*;")
+_RESERVED_RE = re.compile(r"^\s*reserved\s+(.+);")
+_COMMENT_RE = re.compile(r"^\s+(\w+)\s*:[^#]*#\s*(.+?)\s*$")
+
+
+class ExistingMessage:
+    def __init__(self):
+        self.numbers: Dict[str, int] = {}
+        self.reserved_numbers: Set[int] = set()
+        self.reserved_names: Set[str] = set()
+
+
+def parse_existing(proto_dir: Path = PROTO_DIR) -> Dict[str, ExistingMessage]:
+    """Field numbers and reservations of every message in the current .proto files, by message name."""
+    messages: Dict[str, ExistingMessage] = {}
+    for path in sorted(proto_dir.glob("*.proto")):
+        stack: List[Tuple[str, str]] = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.split("//", 1)[0]
+            block = _BLOCK_RE.match(line)
+            if block:
+                stack.append((block.group(1), block.group(2)))
+                continue
+            if line.strip().startswith("}"):
+                if stack:
+                    stack.pop()
+                continue
+            message = next((name for kind, name in reversed(stack) if kind == "message"), None)
+            if message is None or stack[-1][0] == "enum":
+                continue
+            existing = messages.setdefault(message, ExistingMessage())
+            field = _FIELD_RE.match(line)
+            if field:
+                existing.numbers.setdefault(field.group(1), int(field.group(2)))
+                continue
+            reserved = _RESERVED_RE.match(line)
+            if reserved:
+                for item in reserved.group(1).split(","):
+                    item = item.strip()
+                    if item.startswith('"'):
+                        existing.reserved_names.add(item.strip('"'))
+                    elif item:
+                        existing.reserved_numbers.add(int(item))
+    return messages
+
+
+def _field_comments(model: Type) -> Dict[str, str]:
+    """Trailing `# ...` comments on the model's field declarations."""
+    try:
+        source = inspect.getsource(model)
+    except (OSError, TypeError):
+        return {}
+    comments = {}
+    for line in source.splitlines():
+        match = _COMMENT_RE.match(line)
+        if match:
+            comments[match.group(1)] = match.group(2)
+    return comments
+
+
+def _unwrap_optional(annotation: Any) -> Tuple[Any, bool]:
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) < len(typing.get_args(annotation)):
+            return (args[0] if len(args) == 1 else typing.Union[tuple(args)]), True
+    return annotation, False
+
+
+class ProtoFile:
+    def __init__(self, stem: str, existing: Dict[str, ExistingMessage]):
+        self.stem = stem
+        self.package, self.types = PROTO_FILES[stem]
+        self.existing = existing
+        self.imports: Set[str] = set()
+
+    def _type_name(self, cls: Type) -> str:
+        cls = declared_type(cls)
+        stem = proto_file_of(cls)
+        if stem == self.stem:
+            return cls.__name__
+        self.imports.add(stem)
+        return f"{PROTO_FILES[stem][0]}.{cls.__name__}"
+
+    def _scalar_or_ref(self, annotation: Any, where: str) -> str:
+        if annotation in SCALARS:
+            return SCALARS[annotation]
+        if isinstance(annotation, type) and issubclass(annotation, IntEnum):
+            return self._type_name(annotation)
+        if isinstance(annotation, type) and issubclass(annotation, Enum) and issubclass(annotation, str):
+            return "string"
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return self._type_name(annotation)
+        raise TypeError(f"{where}: no protobuf mapping for {annotation!r}")
+
+    def _render_enum(self, enum_cls: Type[IntEnum]) -> List[str]:
+        members = list(enum_cls)
+        if not members or members[0].value != 0:
+            raise ValueError(f"{enum_cls.__name__}: proto3 enums need a first value of 0")
+        return [f"enum {enum_cls.__name__} {{"] + [f"  {m.name} = {m.value};" for m in members] + ["}"]
+
+    def _render_message(self, model: Type[BaseModel]) -> List[str]:
+        name = model.__name__
+        existing = self.existing.get(name, ExistingMessage())
+        used_numbers = set(existing.numbers.values()) | existing.reserved_numbers
+        next_number = max(used_numbers, default=0) + 1
+        comments = _field_comments(model)
+
+        def number_for(field_name: str) -> int:
+            nonlocal next_number
+            if field_name in existing.numbers:
+                return existing.numbers[field_name]
+            number = next_number
+            next_number += 1
+            return number
+
+        lines = [f"message {name} {{"]
+        present: Set[str] = set()
+        for field_name, info in model.model_fields.items():
+            where = f"{name}.{field_name}"
+            annotation, optional = _unwrap_optional(info.annotation)
+            comment = f"  // {comments[field_name]}" if field_name in comments else ""
+
+            if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+                lines.append(f"  oneof {field_name} {{")
+                for member in typing.get_args(annotation):
+                    if member not in SECTION_DATA:
+                        raise TypeError(f"{where}: union member {member.__name__} has no section type in SECTION_DATA")
+                    member_name = SECTION_DATA[member].value
+                    present.add(member_name)
+                    lines.append(f"    {self._type_name(member)} {member_name} = {number_for(member_name)};")
+                lines.append("  }")
+                continue
+
+            present.add(field_name)
+            if typing.get_origin(annotation) is list:
+                (item,) = typing.get_args(annotation)
+                proto_type = f"repeated {self._scalar_or_ref(item, where)}"
+            else:
+                proto_type = self._scalar_or_ref(annotation, where)
+                if optional and annotation in SCALARS:
+                    proto_type = f"optional {proto_type}"
+            lines.append(f"  {proto_type} {field_name} = {number_for(field_name)};{comment}")
+
+        removed = {n: num for n, num in existing.numbers.items() if n not in present}
+        reserved_numbers = sorted(existing.reserved_numbers | set(removed.values()))
+        reserved_names = sorted(existing.reserved_names | set(removed))
+        if reserved_numbers:
+            lines.append(f"  reserved {', '.join(str(n) for n in reserved_numbers)};")
+        if reserved_names:
+            lines.append(f"  reserved {', '.join(f'{chr(34)}{n}{chr(34)}' for n in reserved_names)};")
+        lines.append("}")
+        return lines
+
+    def render(self) -> str:
+        blocks: List[List[str]] = []
+        for cls in self.types:
+            if issubclass(cls, IntEnum):
+                blocks.append(self._render_enum(cls))
+            else:
+                blocks.append(self._render_message(cls))
+
+        out = [HEADER, 'syntax = "proto3";', "", f"package {self.package};", ""]
+        if self.imports:
+            out += [f'import "{PROTO_IMPORT_PREFIX}/{stem}.proto";' for stem in sorted(self.imports)] + [""]
+        for block in blocks:
+            out += block + [""]
+        return "\n".join(out)
+
+
+def _check_subclasses():
+    """Section request aliases (FlightRequest etc.) are sent as their base message, so they can't add fields."""
+    for cls in SECTION_DATA:
+        base = declared_type(cls)
+        if base is not cls and set(cls.model_fields) != set(base.model_fields):
+            raise TypeError(f"{cls.__name__} adds fields to {base.__name__}; list it in PROTO_FILES")
+
+
+def render_all(proto_dir: Path = PROTO_DIR) -> Dict[Path, str]:
+    _check_subclasses()
+    existing = parse_existing(proto_dir)
+    return {proto_dir / f"{stem}.proto": ProtoFile(stem, existing).render() for stem in PROTO_FILES}
+
+
+def stale_files(rendered: Dict[Path, str]) -> List[Path]:
+    return [path for path, text in rendered.items() if not path.exists() or path.read_text(encoding="utf-8") != text]
+
+
+def compile_protos(paths: List[Path]):
+    protoc = shutil.which("protoc")
+    if not protoc:
+        raise RuntimeError("protoc not found on PATH")
+    subprocess.run(
+        [protoc, f"--proto_path={ROOT}", f"--python_out={ROOT}"] + [str(p.relative_to(ROOT)) for p in paths],
+        cwd=ROOT,
+        check=True,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate and compile .proto files from the Pydantic models")
+    parser.add_argument("--check", action="store_true", help="Only report whether the .proto files are up to date")
+    parser.add_argument("--no-compile", action="store_true", help="Write the .proto files without running protoc")
+    args = parser.parse_args(argv)
+
+    rendered = render_all()
+    stale = stale_files(rendered)
+    if args.check:
+        for path in stale:
+            print(f"stale: {path.relative_to(ROOT)}")
+        return 1 if stale else 0
+
+    for path in stale:
+        path.write_text(rendered[path], encoding="utf-8")
+        print(f"wrote {path.relative_to(ROOT)}")
+    if not args.no_compile:
+        compile_protos(sorted(rendered))
+        print(f"compiled {len(rendered)} files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: shared/data_types/hotel.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from shared.data_types import common_pb2 as shared_dot_data__types_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1dshared/data_types/hotel.proto\x12\x0evacation.hotel\x1a\x1eshared/data_types/common.proto\"\x9a\x02\n\x12HotelSearchRequest\x12+\n\x08location\x18\x01 \x01(\x0b\x32\x19.vacation.common.Location\x12)\n\x05\x64\x61tes\x18\x02 \x01(\x0b\x32\x1a.vacation.common.DateRange\x12\x0e\n\x06guests\x18\x03 \x01(\x05\x12\r\n\x05rooms\x18\x04 \x01(\x05\x12\x34\n\x0bpreferences\x18\x05 \x03(\x0e\x32\x1f.vacation.common.PreferenceType\x12\x13\n\x0bmax_results\x18\x06 \x01(\x05\x12\x1b\n\x13max_price_per_night\x18\x07 \x01(\x01\x12\x12\n\nmin_rating\x18\x08 \x01(\x01\x12\x11\n\tamenities\x18\t \x03(\x05\"v\n\x13HotelSearchResponse\x12,\n\x07options\x18\x01 \x03(\x0b\x32\x1b.vacation.hotel.HotelOption\x12\x31\n\x08metadata\x18\x02 \x01(\x0b\x32\x1f.vacation.common.SearchMetadata\"\xb0\x04\n\x0bHotelOption\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12+\n\x08location\x18\x04 \x01(\x0b\x32\x19.vacation.common.Location\x12\x1d\n\x15\x64istance_to_center_km\x18\x05 \x01(\x01\x12\r\n\x05image\x18\x14 \x01(\t\x12\x0e\n\x06rating\x18\x06 \x01(\x01\x12\x14\n\x0creview_count\x18\x07 \x01(\x05\x12\x17\n\x0frating_category\x18\x08 \x01(\t\x12/\n\x0fprice_per_night\x18\t \x01(\x0b\x32\x16.vacation.common.Money\x12+\n\x0btotal_price\x18\n \x01(\x0b\x32\x16.vacation.common.Money\x12,\n\x0f\x61\x64\x64itional_fees\x18\x0b \x03(\x0b\x32\x13.vacation.hotel.Fee\x12&\n\x04room\x18\x0c \x01(\x0b\x32\x18.vacation.hotel.RoomInfo\x12\x11\n\tamenities\x18\r \x03(\t\x12\x10\n\x08\x63\x61tegory\x18\x0e \x01(\t\x12\x13\n\x0bstar_rating\x18\x0f \x01(\x05\x12\x30\n\x06scores\x18\x10 \x01(\x0b\x32 .vacation.common.ComponentScores\x12\x13\n\x0b\x62ooking_url\x18\x11 \x01(\t\x12\x10\n\x08provider\x18\x12 \x01(\t\x12\x11\n\tavailable\x18\x13 \x01(\x08\"s\n\x08RoomInfo\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04\x62\x65\x64s\x18\x02 \x01(\x05\x12\x10\n\x08\x62\x65\x64_type\x18\x03 \x01(\t\x12\x15\n\rmax_occupancy\x18\x04 \x01(\x05\x12\x10\n\x08size_sqm\x18\x05 \x01(\x01\x12\x10\n\x08\x66\x65\x61tures\x18\x06 \x03(\t\"N\n\x03\x46\x65\x65\x12\x0c\n\x04name\x18\x01 \x01(\t\x12&\n\x06\x61mount\x18\x02 \x01(\x0b\x32\x16.vacation.common.Money\x12\x11\n\tmandatory\x18\x03 \x01(\x08\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'shared.data_types.hotel_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _HOTELSEARCHREQUEST._serialized_start=82
+  _HOTELSEARCHREQUEST._serialized_end=364
+  _HOTELSEARCHRESPONSE._serialized_start=366
+  _HOTELSEARCHRESPONSE._serialized_end=484
+  _HOTELOPTION._serialized_start=487
+  _HOTELOPTION._serialized_end=1047
+  _ROOMINFO._serialized_start=1049
+  _ROOMINFO._serialized_end=1164
+  _FEE._serialized_start=1166
+  _FEE._serialized_end=1244
+# @@protoc_insertion_point(module_scope)
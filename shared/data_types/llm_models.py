@@ -12,6 +12,10 @@ class FillStatus(str, Enum):
 class UpdateTripRequest(BaseModel):
     raw_user_message: str = Field(..., description="The raw user message to use for updating the trip YAML.")
     current_yaml_state: str = Field(default="", description="The current YAML state, or empty string for fresh start.")
+    session_id: Optional[str] = Field(default=None, description="Keep the state server-side under this id; current_yaml_state is then only read for a new session.")
+    new_session: bool = Field(default=False, description="Start session_id from current_yaml_state (or the blank template). Without it, an unknown or expired session with no current_yaml_state is a 404.")
+    include_yaml: bool = Field(default=True, description="Return the YAML state in the response (sessions can fetch it later instead).")
+    next_question: Optional[str] = Field(default=None, description="update_trip_yaml only: 'off', 'template' or 'speculative' to return the next question in message; defaults to the service's NEXT_QUESTION_MODE.")
 
 class ReadyResponse(BaseModel):
     user_details: str = Field(..., description="The filled/updated YAML output.")
@@ -19,4 +23,5 @@ class ReadyResponse(BaseModel):
 class FillResponse(BaseModel):
     yaml: str = Field(..., description="The filled/updated YAML output.")
     status: FillStatus = Field(..., description="Whether the YAML is ready or needs more info.")
-    message: Optional[str] = Field(None, description="Optional explanation or follow-up question if not ready.")
\ No newline at end of file
+    message: Optional[str] = Field(None, description="Optional explanation or follow-up question if not ready.")
+    session_id: Optional[str] = Field(None, description="The session the state is stored under, if any.")
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+Which Pydantic models are exchanged as protobuf, and in which .proto file.
+
+models.py is the source of truth: generate_protos.py renders one .proto per
+entry below from the listed models (and compiles it to `<file>_pb2.py`), and
+shared.protobuf_codec maps each model to the generated message of the same
+name. A model referenced by a listed model must be listed too.
+"""
+
+from typing import Dict, List, Tuple, Type
+
+from shared.data_types.models import *
+
+# file stem -> (proto package, models and enums in declaration order)
+PROTO_FILES: Dict[str, Tuple[str, List[Type]]] = {
+    "common": ("vacation.common", [
+        PreferenceType, Money, Location, DateRange, TimeRange, ComponentScores, SearchMetadata,
+    ]),
+    "hotel": ("vacation.hotel", [
+        HotelSearchRequest, HotelSearchResponse, HotelOption, RoomInfo, Fee,
+    ]),
+    "flight": ("vacation.flight", [
+        FlightSearchRequest, FlightSearchResponse, FlightOption, FlightSegment, Layover, LuggageInfo, AmenityInfo,
+    ]),
+    "activity": ("vacation.activity", [
+        ActivitySearchRequest, ActivityCategory, ActivitySearchResponse, ActivityOption, PriceDetails, TimeSlot,
+    ]),
+    "transport": ("vacation.transport", [
+        TransportSearchRequest, TransportMode, TransportSearchResponse, TransportOption, TransportDetails,
+        RentalCarDetails, RideDetails, PublicTransitDetails,
+    ]),
+    "trip": ("vacation.trip", [
+        TripRequest, TripSection, StayRequest,
+        TripResponse, TripSectionResponse, FlightResponse, StayResponse, TransferResponse,
+        FinalTripLayout, FinalTripSection, FinalStayOption,
+    ]),
+}
+
+# Section `data` unions become a oneof with one member per section type;
+# the member for each union class is named after its section type
+SECTION_DATA: Dict[Type, SectionType] = {
+    FlightRequest: SectionType.FLIGHT,
+    StayRequest: SectionType.STAY,
+    TransferRequest: SectionType.TRANSFER,
+    FlightResponse: SectionType.FLIGHT,
+    StayResponse: SectionType.STAY,
+    TransferResponse: SectionType.TRANSFER,
+    FlightOption: SectionType.FLIGHT,
+    FinalStayOption: SectionType.STAY,
+    TransportOption: SectionType.TRANSFER,
+}
+
+
+def proto_file_of(cls: Type) -> str:
+    """File stem declaring `cls` (or, for a subclass adding no fields, its base)."""
+    for candidate in cls.__mro__:
+        for stem, (_, types) in PROTO_FILES.items():
+            if candidate in types:
+                return stem
+    raise KeyError(f"{cls.__name__} is not listed in PROTO_FILES")
+
+
+def declared_type(cls: Type) -> Type:
+    """The listed class `cls` is exchanged as (itself, or the base it extends)."""
+    listed = {t for _, types in PROTO_FILES.values() for t in types}
+    for candidate in cls.__mro__:
+        if candidate in listed:
+            return candidate
+    raise KeyError(f"{cls.__name__} is not listed in PROTO_FILES")
@@ -0,0 +1,172 @@
+"""
+Column-wise storage for a section's search results.
+
+A SearchResultFrame keeps the fields that scoring and filtering read as NumPy
+columns (strings such as ids, currencies and airlines as int32 codes into a
+table holding each distinct value once) and every option as its orjson
+bytes. Pydantic models are only built for the rows asked for, so a 100k
+option section costs a few arrays and a list of bytes instead of 100k nested
+models.
+
+    frame = SearchResultFrame.from_options(FlightOption, options)
+    cheap = frame.filter(frame["price"] < 300)
+    best = cheap.row(int(np.argmax(cheap["preference_score"])))
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+import orjson
+from pydantic import BaseModel
+
+from shared.data_types.models import ActivityOption, FlightOption, HotelOption
+
+
+class Column(NamedTuple):
+    path: Tuple[str, ...]  # keys leading to the value in the option's JSON dict
+    dtype: str  # NumPy dtype, "str" for interned strings, "len" for a list's length
+    default: Any = 0
+
+
+STRING = "str"
+LENGTH = "len"
+
+_ID = Column(("id",), STRING, "")
+_PREFERENCE_SCORE = Column(("scores", "preference_score"), "float64", 0.0)
+
+# Model -> columns kept for it
+FRAME_COLUMNS: Dict[Type[BaseModel], Dict[str, Column]] = {
+    FlightOption: {
+        "id": _ID,
+        "price": Column(("price_per_person", "amount"), "float64", 0.0),
+        "currency": Column(("price_per_person", "currency"), STRING, "USD"),
+        "total_price": Column(("total_price", "amount"), "float64", 0.0),
+        "duration_minutes": Column(("outbound", "duration_minutes"), "int32"),
+        "departure_time": Column(("outbound", "departure_time"), STRING, ""),
+        "arrival_time": Column(("outbound", "arrival_time"), STRING, ""),
+        "stops": Column(("outbound", "stops"), "int16"),
+        "airline": Column(("outbound", "airline"), STRING, ""),
+        "preference_score": _PREFERENCE_SCORE,
+    },
+    HotelOption: {
+        "id": _ID,
+        "price": Column(("price_per_night", "amount"), "float64", 0.0),
+        "currency": Column(("price_per_night", "currency"), STRING, "USD"),
+        "rating": Column(("rating",), "float64", 0.0),
+        "star_rating": Column(("star_rating",), "int16"),
+        "amenities_count": Column(("amenities",), LENGTH),
+        "city": Column(("location", "city"), STRING, ""),
+        "preference_score": _PREFERENCE_SCORE,
+    },
+    ActivityOption: {
+        "id": _ID,
+        "price": Column(("price_per_person", "amount"), "float64", 0.0),
+        "currency": Column(("price_per_person", "currency"), STRING, "USD"),
+        "duration_minutes": Column(("duration_minutes",), "int32"),
+        "rating": Column(("rating",), "float64", 0.0),
+        "review_count": Column(("review_count",), "int32"),
+        "category": Column(("category",), "int16"),
+        "preference_score": _PREFERENCE_SCORE,
+    },
+}
+
+
+def _value(option: Dict[str, Any], column: Column) -> Any:
+    value: Any = option
+    for key in column.path:
+        value = value.get(key) if isinstance(value, dict) else None
+        if value is None:
+            return column.default
+    return value
+
+
+class SearchResultFrame:
+    def __init__(
+        self,
+        model_cls: Type[BaseModel],
+        columns: Dict[str, np.ndarray],
+        tables: Dict[str, List[str]],
+        rows: List[bytes],
+    ):
+        self.model_cls = model_cls
+        self.columns = columns
+        self.tables = tables  # string column -> distinct values, indexed by code
+        self.rows = rows
+
+    @classmethod
+    def from_options(cls, model_cls: Type[BaseModel], options: Iterable[Union[BaseModel, Dict[str, Any]]]) -> "SearchResultFrame":
+        """Build from models or their JSON-mode dicts (e.g. a parsed search response's `options`)."""
+        spec = FRAME_COLUMNS[model_cls]
+        values: Dict[str, List[Any]] = {name: [] for name in spec}
+        interned: Dict[str, Dict[str, int]] = {name: {} for name, column in spec.items() if column.dtype == STRING}
+        rows: List[bytes] = []
+
+        for option in options:
+            if isinstance(option, BaseModel):
+                option = option.model_dump(mode="json")
+            rows.append(orjson.dumps(option))
+            for name, column in spec.items():
+                value = _value(option, column)
+                if column.dtype == STRING:
+                    table = interned[name]
+                    value = table.setdefault(value, len(table))
+                elif column.dtype == LENGTH:
+                    value = len(value) if value else 0
+                values[name].append(value)
+
+        columns = {
+            name: np.array(values[name], dtype=np.int32 if column.dtype in (STRING, LENGTH) else column.dtype)
+            for name, column in spec.items()
+        }
+        return cls(model_cls, columns, {name: list(table) for name, table in interned.items()}, rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """A numeric column, or a string column's codes."""
+        return self.columns[name]
+
+    def code(self, name: str, value: str) -> int:
+        """Code of `value` in string column `name`, -1 if no row has it."""
+        try:
+            return self.tables[name].index(value)
+        except ValueError:
+            return -1
+
+    def strings(self, name: str) -> List[str]:
+        table = self.tables[name]
+        return [table[code] for code in self.columns[name]]
+
+    def map_strings(self, name: str, fn: Callable[[str], float], dtype: str = "float64") -> np.ndarray:
+        """`fn` of each row's string, evaluated once per distinct value (e.g. currency -> USD rate)."""
+        mapped = np.array([fn(value) for value in self.tables[name]], dtype=dtype)
+        return mapped[self.columns[name]]
+
+    def take(self, indices: Union[Sequence[int], np.ndarray]) -> "SearchResultFrame":
+        """The rows at `indices`, in that order. String tables are shared, not copied."""
+        indices = np.asarray(indices, dtype=np.intp)
+        columns = {name: column[indices] for name, column in self.columns.items()}
+        return SearchResultFrame(self.model_cls, columns, self.tables, [self.rows[i] for i in indices])
+
+    def filter(self, mask: np.ndarray) -> "SearchResultFrame":
+        """The rows where the boolean `mask` is set."""
+        return self.take(np.flatnonzero(mask))
+
+    def row_dict(self, index: int) -> Dict[str, Any]:
+        return orjson.loads(self.rows[index])
+
+    def row(self, index: int) -> BaseModel:
+        return self.model_cls.model_validate_json(self.rows[index])
+
+    def to_models(self, indices: Optional[Iterable[int]] = None) -> List[BaseModel]:
+        indices = range(len(self)) if indices is None else indices
+        return [self.row(int(i)) for i in indices]
+
+    def nbytes(self) -> int:
+        """Approximate memory held: columns, row bytes and string tables."""
+        return (
+            sum(column.nbytes for column in self.columns.values())
+            + sum(len(row) for row in self.rows)
+            + sum(len(value) for table in self.tables.values() for value in table)
+        )
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: shared/data_types/transport.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from shared.data_types import common_pb2 as shared_dot_data__types_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!shared/data_types/transport.proto\x12\x12vacation.transport\x1a\x1eshared/data_types/common.proto\"\xa5\x02\n\x16TransportSearchRequest\x12)\n\x06origin\x18\x01 \x01(\x0b\x32\x19.vacation.common.Location\x12.\n\x0b\x64\x65stination\x18\x02 \x01(\x0b\x32\x19.vacation.common.Location\x12\x0c\n\x04\x64\x61te\x18\x03 \x01(\t\x12\x0c\n\x04time\x18\x04 \x01(\t\x12\x12\n\npassengers\x18\x05 \x01(\x05\x12:\n\x0fpreferred_modes\x18\x06 \x03(\x0e\x32!.vacation.transport.TransportMode\x12\x13\n\x0bmax_results\x18\x07 \x01(\x05\x12\x11\n\tmax_price\x18\x08 \x01(\x01\x12\x1c\n\x14max_duration_minutes\x18\t \x01(\x05\"\x82\x01\n\x17TransportSearchResponse\x12\x34\n\x07options\x18\x01 \x03(\x0b\x32#.vacation.transport.TransportOption\x12\x31\n\x08metadata\x18\x02 \x01(\x0b\x32\x1f.vacation.common.SearchMetadata\"\x88\x04\n\x0fTransportOption\x12\n\n\x02id\x18\x01 \x01(\t\x12/\n\x04mode\x18\x02 \x01(\x0e\x32!.vacation.transport.TransportMode\x12\x10\n\x08provider\x18\x03 \x01(\t\x12)\n\x06origin\x18\x04 \x01(\x0b\x32\x19.vacation.common.Location\x12.\n\x0b\x64\x65stination\x18\x05 \x01(\x0b\x32\x19.vacation.common.Location\x12\x13\n\x0b\x64istance_km\x18\x06 \x01(\x01\x12\x16\n\x0e\x64\x65parture_time\x18\x07 \x01(\t\x12\x14\n\x0c\x61rrival_time\x18\x08 \x01(\t\x12\x18\n\x10\x64uration_minutes\x18\t \x01(\x05\x12+\n\x0btotal_price\x18\n \x01(\x0b\x32\x16.vacation.common.Money\x12\x30\n\x10price_per_person\x18\x0b \x01(\x0b\x32\x16.vacation.common.Money\x12\x35\n\x07\x64\x65tails\x18\x0c \x01(\x0b\x32$.vacation.transport.TransportDetails\x12\x30\n\x06scores\x18\r \x01(\x0b\x32 .vacation.common.ComponentScores\x12\x13\n\x0b\x62ooking_url\x18\x0e \x01(\t\x12\x11\n\tavailable\x18\x0f \x01(\x08\"\xb6\x01\n\x10TransportDetails\x12\x38\n\nrental_car\x18\x01 \x01(\x0b\x32$.vacation.transport.RentalCarDetails\x12-\n\x04ride\x18\x02 \x01(\x0b\x32\x1f.vacation.transport.RideDetails\x12\x39\n\x07transit\x18\x03 \x01(\x0b\x32(.vacation.transport.PublicTransitDetails\"\xa2\x02\n\x10RentalCarDetails\x12\x15\n\rvehicle_class\x18\x01 \x01(\t\x12\x15\n\rvehicle_model\x18\x02 \x01(\t\x12\r\n\x05seats\x18\x03 \x01(\x05\x12\x0f\n\x07luggage\x18\x04 \x01(\x05\x12\x14\n\x0ctransmission\x18\x05 \x01(\t\x12\x18\n\x10\x61ir_conditioning\x18\x06 \x01(\x08\x12\x19\n\x11unlimited_mileage\x18\x07 \x01(\x08\x12\x19\n\x11included_features\x18\x08 \x03(\t\x12*\n\ndaily_rate\x18\t \x01(\x0b\x32\x16.vacation.common.Money\x12.\n\x0einsurance_cost\x18\n \x01(\x0b\x32\x16.vacation.common.Money\"b\n\x0bRideDetails\x12\x14\n\x0cvehicle_type\x18\x01 \x01(\t\x12\r\n\x05seats\x18\x02 \x01(\x05\x12\x0e\n\x06shared\x18\x03 \x01(\x08\x12\x1e\n\x16\x65stimated_wait_minutes\x18\x04 \x01(\x05\"\x87\x01\n\x14PublicTransitDetails\x12\x0c\n\x04line\x18\x01 \x01(\t\x12\r\n\x05stops\x18\x02 \x01(\x05\x12\x17\n\x0ftransfer_points\x18\x03 \x03(\t\x12\x15\n\rservice_class\x18\x04 \x01(\t\x12\x0c\n\x04wifi\x18\x05 \x01(\x08\x12\x14\n\x0c\x66ood_service\x18\x06 \x01(\x08*\x93\x01\n\rTransportMode\x12\x10\n\x0cMODE_UNKNOWN\x10\x00\x12\x0e\n\nRENTAL_CAR\x10\x01\x12\x08\n\x04TAXI\x10\x02\x12\r\n\tRIDESHARE\x10\x03\x12\t\n\x05TRAIN\x10\x04\x12\x07\n\x03\x42US\x10\x05\x12\t\n\x05\x46\x45RRY\x10\x06\x12\x14\n\x10PRIVATE_TRANSFER\x10\x07\x12\x12\n\x0ePUBLIC_TRANSIT\x10\x08\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'shared.data_types.transport_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _TRANSPORTMODE._serialized_start=1758
+  _TRANSPORTMODE._serialized_end=1905
+  _TRANSPORTSEARCHREQUEST._serialized_start=90
+  _TRANSPORTSEARCHREQUEST._serialized_end=383
+  _TRANSPORTSEARCHRESPONSE._serialized_start=386
+  _TRANSPORTSEARCHRESPONSE._serialized_end=516
+  _TRANSPORTOPTION._serialized_start=519
+  _TRANSPORTOPTION._serialized_end=1039
+  _TRANSPORTDETAILS._serialized_start=1042
+  _TRANSPORTDETAILS._serialized_end=1224
+  _RENTALCARDETAILS._serialized_start=1227
+  _RENTALCARDETAILS._serialized_end=1517
+  _RIDEDETAILS._serialized_start=1519
+  _RIDEDETAILS._serialized_end=1617
+  _PUBLICTRANSITDETAILS._serialized_start=1620
+  _PUBLICTRANSITDETAILS._serialized_end=1755
+# @@protoc_insertion_point(module_scope)
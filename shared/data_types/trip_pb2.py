@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: shared/data_types/trip.proto
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from shared.data_types import activity_pb2 as shared_dot_data__types_dot_activity__pb2
+from shared.data_types import flight_pb2 as shared_dot_data__types_dot_flight__pb2
+from shared.data_types import hotel_pb2 as shared_dot_data__types_dot_hotel__pb2
+from shared.data_types import transport_pb2 as shared_dot_data__types_dot_transport__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1cshared/data_types/trip.proto\x12\rvacation.trip\x1a shared/data_types/activity.proto\x1a\x1eshared/data_types/flight.proto\x1a\x1dshared/data_types/hotel.proto\x1a!shared/data_types/transport.proto\";\n\x0bTripRequest\x12,\n\x08sections\x18\x01 \x03(\x0b\x32\x1a.vacation.trip.TripSection\"\x87\x01\n\x0bTripSection\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x36\n\x06\x66light\x18\x02 \x01(\x0b\x32$.vacation.flight.FlightSearchRequestH\x00\x12*\n\x04stay\x18\x03 \x01(\x0b\x32\x1a.vacation.trip.StayRequestH\x00\x42\x06\n\x04\x64\x61ta\"\x8c\x01\n\x0bStayRequest\x12\x39\n\rhotel_request\x18\x01 \x01(\x0b\x32\".vacation.hotel.HotelSearchRequest\x12\x42\n\x10\x61\x63tivity_request\x18\x02 \x01(\x0b\x32(.vacation.activity.ActivitySearchRequest\"D\n\x0cTripResponse\x12\x34\n\x08sections\x18\x01 \x03(\x0b\x32\".vacation.trip.TripSectionResponse\"\x99\x01\n\x13TripSectionResponse\x12\x0c\n\x04type\x18\x01 \x01(\t\x12/\n\x06\x66light\x18\x02 \x01(\x0b\x32\x1d.vacation.trip.FlightResponseH\x00\x12+\n\x04stay\x18\x03 \x01(\x0b\x32\x1b.vacation.trip.StayResponseH\x00\x42\x06\n\x04\x64\x61taJ\x04\x08\x04\x10\x05R\x08transfer\"@\n\x0e\x46lightResponse\x12.\n\x07options\x18\x01 \x03(\x0b\x32\x1d.vacation.flight.FlightOption\"\x7f\n\x0cStayResponse\x12\x32\n\rhotel_options\x18\x01 \x03(\x0b\x32\x1b.vacation.hotel.HotelOption\x12;\n\x10\x61\x63tivity_options\x18\x02 \x03(\x0b\x32!.vacation.activity.ActivityOption\"H\n\x10TransferResponse\x12\x34\n\x07options\x18\x01 \x03(\x0b\x32#.vacation.transport.TransportOption\"D\n\x0f\x46inalTripLayout\x12\x31\n\x08sections\x18\x01 \x03(\x0b\x32\x1f.vacation.trip.FinalTripSection\"\xc2\x01\n\x10\x46inalTripSection\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x37\n\x08transfer\x18\x04 \x01(\x0b\x32#.vacation.transport.TransportOptionH\x00\x12/\n\x06\x66light\x18\x02 \x01(\x0b\x32\x1d.vacation.flight.FlightOptionH\x00\x12.\n\x04stay\x18\x03 \x01(\x0b\x32\x1e.vacation.trip.FinalStayOptionH\x00\x42\x06\n\x04\x64\x61ta\"t\n\x0f\x46inalStayOption\x12*\n\x05hotel\x18\x01 \x01(\x0b\x32\x1b.vacation.hotel.HotelOption\x12\x35\n\nactivities\x18\x02 \x03(\x0b\x32!.vacation.activity.ActivityOptionb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'shared.data_types.trip_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _TRIPREQUEST._serialized_start=179
+  _TRIPREQUEST._serialized_end=238
+  _TRIPSECTION._serialized_start=241
+  _TRIPSECTION._serialized_end=376
+  _STAYREQUEST._serialized_start=379
+  _STAYREQUEST._serialized_end=519
+  _TRIPRESPONSE._serialized_start=521
+  _TRIPRESPONSE._serialized_end=589
+  _TRIPSECTIONRESPONSE._serialized_start=592
+  _TRIPSECTIONRESPONSE._serialized_end=745
+  _FLIGHTRESPONSE._serialized_start=747
+  _FLIGHTRESPONSE._serialized_end=811
+  _STAYRESPONSE._serialized_start=813
+  _STAYRESPONSE._serialized_end=940
+  _TRANSFERRESPONSE._serialized_start=942
+  _TRANSFERRESPONSE._serialized_end=1014
+  _FINALTRIPLAYOUT._serialized_start=1016
+  _FINALTRIPLAYOUT._serialized_end=1084
+  _FINALTRIPSECTION._serialized_start=1087
+  _FINALTRIPSECTION._serialized_end=1281
+  _FINALSTAYOPTION._serialized_start=1283
+  _FINALSTAYOPTION._serialized_end=1399
+# @@protoc_insertion_point(module_scope)
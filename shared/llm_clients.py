@@ -0,0 +1,242 @@
+"""
+Process-wide LLM provider clients.
+
+Every service that talks to Perplexity or Gemini gets its clients from the
+`llm_clients` registry instead of building one per call, so TLS sessions and
+keep-alive connections are reused. Clients are created on first use from the
+environment and kept for the life of the process. The registry also keeps
+per-provider request, error, latency, token and pool counters, exposed by the
+services on their `/metrics/llm` endpoint.
+
+Environment:
+    PERPLEXITY_API_KEY, GEMINI_API_TOKEN / GEMINI_API_KEY
+    PERPLEXITY_BASE_URL      override, e.g. a local stub for benchmarks
+    PERPLEXITY_TIMEOUT_SECONDS, GEMINI_TIMEOUT_SECONDS   (default 60)
+    LLM_MAX_CONNECTIONS      max open connections per client (default 100)
+    LLM_MAX_KEEPALIVE        idle connections kept per client (default 20)
+    LLM_KEEPALIVE_EXPIRY     seconds an idle connection is kept (default 30)
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PERPLEXITY = "perplexity"
+GEMINI = "gemini"
+
+
+@dataclass(frozen=True)
+class ProviderConfig:
+    api_key_envs: Tuple[str, ...]
+    base_url: Optional[str]
+    timeout_s: float
+
+    @property
+    def api_key(self) -> Optional[str]:
+        for name in self.api_key_envs:
+            if os.getenv(name):
+                return os.getenv(name)
+        return None
+
+
+PROVIDERS: Dict[str, ProviderConfig] = {
+    PERPLEXITY: ProviderConfig(
+        api_key_envs=("PERPLEXITY_API_KEY",),
+        base_url=os.getenv("PERPLEXITY_BASE_URL", "https://api.perplexity.ai"),
+        timeout_s=float(os.getenv("PERPLEXITY_TIMEOUT_SECONDS", "60")),
+    ),
+    GEMINI: ProviderConfig(
+        api_key_envs=("GEMINI_API_TOKEN", "GEMINI_API_KEY"),
+        base_url=None,
+        timeout_s=float(os.getenv("GEMINI_TIMEOUT_SECONDS", "60")),
+    ),
+}
+
+POOL_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "100")),
+    max_keepalive_connections=int(os.getenv("LLM_MAX_KEEPALIVE", "20")),
+    keepalive_expiry=float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30")),
+)
+
+
+@dataclass
+class ProviderMetrics:
+    clients_created: int = 0
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    total_latency_s: float = 0.0
+    max_latency_s: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        completed = self.requests - self.in_flight
+        return {
+            "clients_created": self.clients_created,
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "avg_latency_ms": round(self.total_latency_s / completed * 1000, 2) if completed else 0.0,
+            "max_latency_ms": round(self.max_latency_s * 1000, 2),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+        }
+
+
+def _pool_connections(http_client: Any) -> Optional[int]:
+    """Open connections in an httpx client's pool, if the transport exposes it."""
+    pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    return len(connections) if connections is not None else None
+
+
+def _token_usage(response: Any) -> Tuple[int, int]:
+    """(prompt, completion) tokens from an OpenAI-style or genai response."""
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        return getattr(usage, "prompt_tokens", 0) or 0, getattr(usage, "completion_tokens", 0) or 0
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        return getattr(usage, "prompt_token_count", 0) or 0, getattr(usage, "candidates_token_count", 0) or 0
+    return 0, 0
+
+
+class LLMClientRegistry:
+    def __init__(self, providers: Dict[str, ProviderConfig] = PROVIDERS, limits: httpx.Limits = POOL_LIMITS):
+        self.providers = providers
+        self.limits = limits
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._http_clients: Dict[Tuple[str, str], Any] = {}
+        self._metrics: Dict[str, ProviderMetrics] = {name: ProviderMetrics() for name in providers}
+        self._lock = threading.Lock()
+
+    def _config(self, provider: str) -> ProviderConfig:
+        config = self.providers[provider]
+        if not config.api_key:
+            raise ValueError(f"Set {' or '.join(config.api_key_envs)} environment variable")
+        return config
+
+    def _get(self, provider: str, kind: str, factory):
+        key = (provider, kind)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = factory(self._config(provider))
+                    self._clients[key] = client
+                    self._metrics[provider].clients_created += 1
+        return client
+
+    def openai(self, provider: str = PERPLEXITY):
+        """Blocking OpenAI-compatible client (for sync endpoints)."""
+        from openai import OpenAI
+
+        def factory(config: ProviderConfig):
+            http_client = httpx.Client(limits=self.limits, timeout=config.timeout_s)
+            self._http_clients[(provider, "openai")] = http_client
+            return OpenAI(api_key=config.api_key, base_url=config.base_url,
+                          timeout=config.timeout_s, http_client=http_client)
+
+        return self._get(provider, "openai", factory)
+
+    def async_openai(self, provider: str = PERPLEXITY):
+        """Async OpenAI-compatible client (for async endpoints)."""
+        from openai import AsyncOpenAI
+
+        def factory(config: ProviderConfig):
+            http_client = httpx.AsyncClient(limits=self.limits, timeout=config.timeout_s)
+            self._http_clients[(provider, "async_openai")] = http_client
+            return AsyncOpenAI(api_key=config.api_key, base_url=config.base_url,
+                               timeout=config.timeout_s, http_client=http_client)
+
+        return self._get(provider, "async_openai", factory)
+
+    def gemini(self):
+        """genai client; use `.aio` on it for the async interface."""
+        from google import genai
+        from google.genai import types
+
+        def factory(config: ProviderConfig):
+            http_client = httpx.Client(limits=self.limits)
+            async_http_client = httpx.AsyncClient(limits=self.limits)
+            self._http_clients[(GEMINI, "gemini")] = http_client
+            self._http_clients[(GEMINI, "gemini.aio")] = async_http_client
+            return genai.Client(
+                api_key=config.api_key,
+                http_options=types.HttpOptions(
+                    timeout=int(config.timeout_s * 1000),
+                    httpx_client=http_client,
+                    httpx_async_client=async_http_client,
+                ),
+            )
+
+        return self._get(GEMINI, "gemini", factory)
+
+    @contextmanager
+    def track(self, provider: str):
+        """
+        Count and time one provider call. Works around both blocking calls and
+        awaits, e.g. `with llm_clients.track(PERPLEXITY): await client...`.
+        """
+        metrics = self._metrics[provider]
+        with self._lock:
+            metrics.requests += 1
+            metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            with self._lock:
+                metrics.errors += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                metrics.in_flight -= 1
+                metrics.total_latency_s += elapsed
+                metrics.max_latency_s = max(metrics.max_latency_s, elapsed)
+
+    def record_usage(self, provider: str, response: Any) -> Tuple[int, int]:
+        """Add a response's token usage to the counters and return (prompt, completion)."""
+        prompt_tokens, completion_tokens = _token_usage(response)
+        metrics = self._metrics[provider]
+        with self._lock:
+            metrics.prompt_tokens += prompt_tokens
+            metrics.completion_tokens += completion_tokens
+        return prompt_tokens, completion_tokens
+
+    def snapshot(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        with self._lock:
+            for provider, metrics in self._metrics.items():
+                data = metrics.snapshot()
+                data["open_connections"] = {
+                    kind: _pool_connections(http_client)
+                    for (owner, kind), http_client in self._http_clients.items()
+                    if owner == provider
+                }
+                result[provider] = data
+        return result
+
+    async def aclose(self):
+        """Close every pool; call from a service's shutdown hook."""
+        for http_client in list(self._http_clients.values()):
+            if isinstance(http_client, httpx.AsyncClient):
+                await http_client.aclose()
+            else:
+                http_client.close()
+        self._clients.clear()
+        self._http_clients.clear()
+
+
+llm_clients = LLMClientRegistry()
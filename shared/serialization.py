@@ -0,0 +1,46 @@
+"""
+orjson-based JSON encoding shared by the Python services.
+
+`ORJSONResponse` is used as FastAPI's response class and `cache_dumps` /
+`cache_loads` as the Redis value codec. Pydantic models are encoded via
+`model_dump(mode="json")`, so handlers can return models (or structures
+containing models) directly without FastAPI's jsonable_encoder pass.
+"""
+
+from typing import Any, Union
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize dicts, lists, Pydantic models, enums and datetimes to JSON bytes."""
+    return orjson.dumps(value, default=_default)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    return orjson.loads(data)
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def cache_dumps(value: Any) -> bytes:
+    """Encode a value for Redis."""
+    return dumps(value)
+
+
+def cache_loads(data: Union[bytes, str]) -> Any:
+    """Decode a value read from Redis (bytes, or str with decode_responses)."""
+    return orjson.loads(data)